@@ -0,0 +1,131 @@
+"""
+Benchmark runner.
+
+    python -m benchmarks run [--wheelhouse DIR] [--repeats N]
+                             [--output FILE | --update-baseline]
+    python -m benchmarks compare BASELINE CURRENT [--threshold 0.2]
+
+`run` writes the median, min and mean of every case to a JSON file,
+benchmarks/results.json by default, which is not tracked. The committed
+benchmarks/baseline.json is written only with --update-baseline or when
+passed as --output. `compare` flags every case whose
+median got slower than the baseline by more than the threshold and exits
+with code 1 if there is any.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.cases import COLD_START_BUDGET, get_cases
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+
+BASELINE = BENCHMARKS_DIR / "baseline.json"
+
+DEFAULT_OUTPUT = BENCHMARKS_DIR / "results.json"
+
+
+def run(args) -> int:
+    cases = get_cases(args.wheelhouse)
+    results = {}
+
+    for name, case in cases.items():
+        # the end to end build is slow, a single run is enough
+        repeats = 1 if name.startswith("e2e.") else args.repeats
+        samples = [case() for _ in range(repeats)]
+        results[name] = {
+            "median": statistics.median(samples),
+            "min": min(samples),
+            "mean": statistics.fmean(samples),
+            "repeats": repeats,
+        }
+        print(f"{name:<28} {results[name]['median'] * 1000:10.2f} ms")
+
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": f"{sys.platform}-{platform.machine()}",
+        "results": results,
+    }
+    output = BASELINE if args.update_baseline else args.output
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"\nwrote {output}")
+
+    cold_start = results["cli.version_cold_start"]["median"]
+    if cold_start > COLD_START_BUDGET:
+        print(
+            f"FAIL: hut --version took {cold_start:.3f}s, "
+            f"budget is {COLD_START_BUDGET:.3f}s"
+        )
+        return 1
+    return 0
+
+
+def compare(args) -> int:
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+    current = json.loads(args.current.read_text(encoding="utf-8"))["results"]
+    regressions = 0
+
+    for name in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[name]["median"], current[name]["median"]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(
+            f"{name:<28} {before * 1000:10.2f} ms -> {after * 1000:10.2f} ms "
+            f"{change:+8.1%}{flag}"
+        )
+
+    for name in sorted(baseline.keys() ^ current.keys()):
+        print(f"{name:<28} only in {'baseline' if name in baseline else 'current'}")
+
+    if regressions:
+        print(f"\n{regressions} regression(s) over {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument(
+        "--wheelhouse",
+        type=Path,
+        help="Wheelhouse for the end to end offline build, skipped without one",
+    )
+    run_parser.add_argument("--repeats", type=int, default=20)
+    output = run_parser.add_mutually_exclusive_group()
+    output.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    output.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help=f"Write the results to {BASELINE.relative_to(BENCHMARKS_DIR.parent)}",
+    )
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown of the median, 0.2 is 20%%",
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
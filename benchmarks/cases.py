@@ -0,0 +1,137 @@
+"""
+Benchmark cases.
+
+Each case returns the seconds one run took. Steps run in isolation
+against a fresh temporary directory, with the package installs of
+SetupEnv stubbed out so only the generator's own work is timed.
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from unittest import mock
+
+from builders_hut.setups import (
+    FILES_TO_WRITE,
+    SetupDatabase,
+    SetupEnv,
+    SetupFiles,
+    SetupFileWriter,
+    SetupGithub,
+    SetupStructure,
+)
+from builders_hut.setups.database.factory import SQL_FILES
+from builders_hut.setups.resource import add_resource as _add_resource
+from builders_hut.setups.templates import PROJECT_TEMPLATES, ProjectContext
+from builders_hut.utils import setup_project
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CONFIG = {
+    "name": "bench",
+    "description": "Benchmark project",
+    "version": "0.1.0",
+    "database_type": "sql",
+    "database_provider": "postgres",
+    "installer": "pip",
+    "use_cache": False,
+}
+
+# `hut --version` must start faster than this, in seconds
+COLD_START_BUDGET = 0.5
+
+
+def _time_step(step, stub_subprocess: bool = False) -> float:
+    with tempfile.TemporaryDirectory(prefix="hut-bench-") as tmp:
+        location = Path(tmp)
+        # SetupEnv and SetupGithub need the files in place, like in a real build
+        if step in (SetupEnv, SetupGithub):
+            setup_project(location, SetupFiles, **CONFIG)
+
+        stub = (
+            mock.patch("builders_hut.setups.installer.run_command")
+            if stub_subprocess
+            else nullcontext()
+        )
+        with stub:
+            start = time.perf_counter()
+            setup_project(location, step, **CONFIG)
+            return time.perf_counter() - start
+
+
+def _run_hut(*args: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "builders_hut", *args],
+        cwd=ROOT,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def render_templates() -> float:
+    """Render every project template once, they are compiled on the first run"""
+    context = ProjectContext.from_config(**CONFIG)
+    start = time.perf_counter()
+    for template_id in [*FILES_TO_WRITE.values(), *SQL_FILES.values()]:
+        PROJECT_TEMPLATES.render(template_id, context)
+    return time.perf_counter() - start
+
+
+def add_resource(existing: int) -> float:
+    """Add a resource to a project that has `existing` added ones already"""
+    with tempfile.TemporaryDirectory(prefix="hut-bench-") as tmp:
+        location = Path(tmp)
+        setup_project(location, SetupFiles, **CONFIG)
+        for i in range(existing):
+            _add_resource(location, f"thing{i}")
+
+        start = time.perf_counter()
+        _add_resource(location, "last thing")
+        return time.perf_counter() - start
+
+
+def cold_start() -> float:
+    return _run_hut("--version")
+
+
+def end_to_end(wheelhouse: Path) -> float:
+    with tempfile.TemporaryDirectory(prefix="hut-bench-") as tmp:
+        return _run_hut(
+            "build",
+            "-y",
+            # time the cold path, not a running `hut daemon`
+            "--no-daemon",
+            "--no-cache",
+            "--offline",
+            "--wheelhouse",
+            str(wheelhouse),
+            "--path",
+            str(Path(tmp) / "project"),
+        )
+
+
+def get_cases(wheelhouse: Path | None = None) -> dict:
+    """Name -> zero argument callable timing one run"""
+    cases = {
+        "step.SetupStructure": lambda: _time_step(SetupStructure),
+        "step.SetupFiles": lambda: _time_step(SetupFiles),
+        "step.SetupFileWriter": lambda: _time_step(SetupFileWriter),
+        "step.SetupDatabase": lambda: _time_step(SetupDatabase),
+        "step.SetupEnv": lambda: _time_step(SetupEnv, stub_subprocess=True),
+        "render.project_templates": render_templates,
+        "add.resource_1st": lambda: add_resource(0),
+        "add.resource_200th": lambda: add_resource(199),
+        "cli.version_cold_start": cold_start,
+    }
+    if shutil.which("git"):
+        cases["step.SetupGithub"] = lambda: _time_step(SetupGithub)
+    if wheelhouse is not None:
+        cases["e2e.build_offline"] = lambda: end_to_end(wheelhouse)
+    return cases
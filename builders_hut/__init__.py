@@ -0,0 +1,13 @@
+APP_VERSION = "0.4.3"
+
+# the build API pulls in every setup step and template, so it is only
+# imported on first use and `hut --version` stays fast
+_LAZY_API = ("build_project", "build_project_async", "ProjectSpec", "BuildResult")
+
+
+def __getattr__(name):
+    if name in _LAZY_API:
+        from builders_hut import api
+
+        return getattr(api, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,100 @@
+"""
+Programmatic build API.
+
+build_project() scaffolds a project without any console output and
+without touching module level state, so it can be called from many
+threads or asyncio tasks at once.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from builders_hut.options import InstallerType, SchemaBackend
+from builders_hut.setups import SetupEnv, SetupFiles, SetupGithub, run_steps
+from builders_hut.setups.env_setup import requirements_for
+from builders_hut.setups.scheduler import ErrorCallback, StepCallback
+from builders_hut.setups.staging import staged_build
+from builders_hut.timing import StepTiming, SubprocessCallback
+
+# the steps of a full build, SetupFiles writes the files of every generating step
+BUILD_STEPS = (SetupFiles, SetupGithub, SetupEnv)
+
+
+@dataclass(frozen=True)
+class ProjectSpec:
+    """Everything needed to build one project"""
+
+    name: str
+    path: Path
+    description: str = "A new project"
+    version: str = "0.1.0"
+    database_type: Literal["sql", "nosql"] = "sql"
+    database_provider: Literal["postgres", "mysql", "sqlite", "mongodb"] = "postgres"
+    schema_backend: SchemaBackend = SchemaBackend.PYDANTIC
+    installer: InstallerType = InstallerType.AUTO
+    use_cache: bool = True
+    wheelhouse: Path | None = None
+    offline: bool = False
+
+    def config(self) -> dict:
+        """The keyword arguments handed to every setup step"""
+        config = asdict(self)
+        del config["path"]
+        return config
+
+
+@dataclass
+class BuildResult:
+    path: Path
+    requirements: list[str]
+    dev_requirements: list[str]
+    timings: list[StepTiming] = field(default_factory=list)
+    wall: float = 0.0
+
+
+def build_project(
+    spec: ProjectSpec,
+    *,
+    on_start: StepCallback | None = None,
+    on_finish: StepCallback | None = None,
+    on_error: ErrorCallback | None = None,
+    on_subprocess: SubprocessCallback | None = None,
+) -> BuildResult:
+    """
+    Build a project from the spec.
+
+    The project is built in a staging directory and moved to spec.path
+    only on success. Failures are raised as RuntimeError.
+    """
+    start = time.perf_counter()
+    target = Path(spec.path).resolve()
+    requirements, dev_requirements = requirements_for(
+        spec.database_type, spec.database_provider, spec.schema_backend
+    )
+
+    with staged_build(target) as staging:
+        timings = run_steps(
+            staging,
+            list(BUILD_STEPS),
+            on_start=on_start,
+            on_finish=on_finish,
+            on_error=on_error,
+            on_subprocess=on_subprocess,
+            **spec.config(),
+        )
+
+    return BuildResult(
+        path=target,
+        requirements=requirements,
+        dev_requirements=dev_requirements,
+        timings=timings,
+        wall=time.perf_counter() - start,
+    )
+
+
+async def build_project_async(spec: ProjectSpec) -> BuildResult:
+    """build_project() for asyncio code, the build runs on a worker thread"""
+    return await asyncio.to_thread(build_project, spec)
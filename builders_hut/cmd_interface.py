@@ -1,209 +1,42 @@
-import time
 from pathlib import Path
 
 import typer
-from rich.align import Align
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-)
-from rich.prompt import Prompt
-from rich.text import Text
-
-from builders_hut.setups import (
-    SetupDatabase,
-    SetupEnv,
-    SetupFiles,
-    SetupFileWriter,
-    SetupGithub,
-    SetupStructure,
-)
-from builders_hut.utils import setup_project
+
+from builders_hut import APP_VERSION
+from builders_hut.options import InstallerType, OutputFormat, SchemaBackend
 
 # ------------------------------------------------------------------
 # App setup
 # ------------------------------------------------------------------
+#
+# Only typer is imported up front. Rich, the setup steps and the
+# templates are imported inside the commands that use them, so
+# `hut --version` and `hut --help` stay fast.
 
-console = Console()
 app = typer.Typer(
     invoke_without_command=True,
     no_args_is_help=True,
 )
-
-APP_VERSION = "0.4.3"
-
-BANNER = r"""
- ____        _ _     _                 _   _       _   
-| __ ) _   _(_) | __| | ___ _ __ ___  | | | |_   _| |_ 
-|  _ \| | | | | |/ _` |/ _ \ '__/ __| | |_| | | | | __|
-| |_) | |_| | | | (_| |  __/ |  \__ \ |  _  | |_| | |_ 
-|____/ \__,_|_|_|\__,_|\___|_|  |___/ |_| |_|\__,_|\__|
-"""
-
-# ------------------------------------------------------------------
-# UI helpers
-# ------------------------------------------------------------------
-
-
-def render_header() -> Panel:
-    text = Text()
-    text.append(BANNER, style="bold cyan")
-    text.append(f"\nVersion {APP_VERSION}\n", style="bold cyan")
-
-    return Panel(
-        Align.center(text),
-        border_style="cyan",
-        padding=(1, 2),
-    )
-
-
-def clear_and_render(panel: Panel):
-    console.clear()
-    console.print(render_header())
-    console.print(panel)
-
-
-def ask_question(title: str, question: str, default: str) -> str:
-    body = Text()
-    body.append(f"{title}\n\n", style="bold cyan")
-    body.append(question, style="white")
-
-    panel = Panel(
-        body,
-        border_style="cyan",
-        padding=(1, 2),
-    )
-
-    clear_and_render(panel)
-    return Prompt.ask("", default=default)
-
-
-# ------------------------------------------------------------------
-# Wizard
-# ------------------------------------------------------------------
-
-
-def run_wizard():
-    answers = {}
-
-    answers["name"] = ask_question(
-        "Project Name",
-        "Enter your project name",
-        Path.cwd().name,
-    )
-
-    answers["description"] = ask_question(
-        "Project Description",
-        "Describe your project",
-        "A new project",
-    )
-
-    answers["version"] = ask_question(
-        "Project Version",
-        "Initial project version",
-        "0.1.0",
-    )
-
-    answers["database_type"] = ask_question(
-        "Database Type",
-        "Choose database type (sql / nosql)",
-        "sql",
-    )
-
-    answers["database_provider"] = ask_question(
-        "Database Provider",
-        "postgres / mysql / sqlite / mongodb",
-        "postgres",
-    )
-
-    return answers
-
-
-# ------------------------------------------------------------------
-# Progress runner (INSIDE BOX)
-# ------------------------------------------------------------------
-
-
-"""Steps"""
-
-STEPS = {
-    "SetupStructure": "Setting up project structure",
-    "SetupFiles": "Adding base files",
-    "SetupGithub": "Setting up GitHub repository",
-    "SetupEnv": "Installing packages and creating .env",
-    "SetupFileWriter": "Updating file contents",
-    "SetupDatabase": "Setting up database files",
-}
-
-
-def run_setup_with_progress(
-    project_location: Path,
-    setup_steps: list,
-    **kwargs,
-):
-    progress = Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]{task.description}"),
-        BarColumn(),
-    )
-
-    task = progress.add_task("Initializing project...", total=len(setup_steps))
-
-    panel = Panel(
-        progress,
-        title="Setting up project",
-        border_style="cyan",
-        padding=(1, 2),
-    )
-
-    with Live(panel, console=console, refresh_per_second=10):
-        for step in setup_steps:
-            progress.update(task, description=f"{STEPS[step.__name__]}")
-            setup_project(project_location, step, **kwargs)
-            time.sleep(0.5)
-            progress.advance(task)
-
-
-# ------------------------------------------------------------------
-# Final screen
-# ------------------------------------------------------------------
-
-
-def show_success():
-    text = Text()
-    text.append("✅ Project setup completed successfully!\n\n", style="bold green")
-    text.append("NEXT STEPS\n", style="bold cyan")
-    text.append(
-        "\n1. Update environment variables\n"
-        "   • Open .env and fill required values\n\n"
-        "2. Run database migrations\n"
-        '   • alembic revision --autogenerate -m "initial migration"\n'
-        "   • alembic upgrade head\n\n"
-        "3. Start the server\n"
-        "   • python run.py\n",
-        style="white",
-    )
-
-    text.append(
-        "\nNote:- Sample model with respective repository and service is created along with the project for user reference.\n"
-        "It is suggested to go throw them once before removing anything\n",
-        style="yellow",
-    )
-
-    panel = Panel(
-        Align.left(text),
-        border_style="green",
-        padding=(1, 2),
-        title="🚀 Ready",
-    )
-
-    clear_and_render(panel)
-
+wheelhouse_app = typer.Typer(
+    help="Manage a local wheelhouse for offline builds.",
+    no_args_is_help=True,
+)
+app.add_typer(wheelhouse_app, name="wheelhouse")
+add_app = typer.Typer(
+    help="Add components to an existing project.",
+    no_args_is_help=True,
+)
+app.add_typer(add_app, name="add")
+daemon_app = typer.Typer(
+    help="Keep a warm build process for fast repeated builds.",
+    no_args_is_help=True,
+)
+app.add_typer(daemon_app, name="daemon")
+lock_app = typer.Typer(
+    help="Maintain the hash-pinned lock files shipped for each database provider.",
+    no_args_is_help=True,
+)
+app.add_typer(lock_app, name="lock")
 
 # ------------------------------------------------------------------
 # Typer callbacks & commands
@@ -222,7 +55,7 @@ def main(
     ),
 ):
     if version:
-        console.print(f"[bold green]hut version {APP_VERSION}[/bold green]")
+        typer.secho(f"hut version {APP_VERSION}", fg=typer.colors.GREEN, bold=True)
         raise typer.Exit()
 
     if ctx.invoked_subcommand is None:
@@ -244,11 +77,52 @@ def build(
         "-y",
         help="Run with default values",
     ),
+    schema_backend: SchemaBackend = typer.Option(
+        SchemaBackend.PYDANTIC,
+        "--schema-backend",
+        help="Library of the generated request and response schemas, msgspec "
+        "decodes and encodes faster",
+    ),
+    installer: InstallerType = typer.Option(
+        InstallerType.AUTO,
+        "--installer",
+        help="Package installer to use, auto picks uv when it is available",
+    ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse a cached virtual env with the same packages",
+    ),
+    wheelhouse: Path | None = typer.Option(
+        None,
+        "--wheelhouse",
+        help="Directory of wheels to install from, see `hut wheelhouse sync`",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Install from the wheelhouse only, never from the package index",
+    ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Show how long each setup step took",
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.RICH,
+        "--output",
+        help="rich for the interactive UI, jsonl for one JSON event per line "
+        "(implies --accept-defaults)",
+    ),
+    use_daemon: bool = typer.Option(
+        True,
+        "--daemon/--no-daemon",
+        help="Hand the build to `hut daemon` when one is running",
+    ),
 ):
     """
     Build a new project using an interactive wizard.
     """
-
     DEFAULTS = {
         "name": Path.cwd().name,
         "description": "A new project",
@@ -257,44 +131,328 @@ def build(
         "database_provider": "postgres",
     }
 
+    options = dict(
+        path=path,
+        schema_backend=schema_backend,
+        installer=installer,
+        use_cache=use_cache,
+        wheelhouse=wheelhouse.resolve() if wheelhouse else None,
+        offline=offline,
+    )
+
+    def on_daemon(answers: dict):
+        """The events of the build on `hut daemon`, None to build here"""
+        if not use_daemon:
+            return None
+        from builders_hut.daemon import submit_build
+
+        # the daemon runs in another directory
+        return submit_build({**options, "path": path.resolve(), **answers})
+
+    if output == OutputFormat.JSONL:
+        # headless, nothing is rendered and no Rich is imported
+        if (events := on_daemon(DEFAULTS)) is not None:
+            import sys
+
+            from builders_hut.daemon import forward_events
+
+            if not forward_events(events, sys.stdout):
+                raise typer.Exit(code=1)
+            return
+
+        from builders_hut.api import ProjectSpec
+        from builders_hut.events import JsonlReporter, build_with_events
+
+        try:
+            build_with_events(ProjectSpec(**options, **DEFAULTS), JsonlReporter())
+        except Exception:
+            raise typer.Exit(code=1)
+        return
+
+    from builders_hut import ui
+    from builders_hut.api import ProjectSpec
+
     try:
         if accept_default:
             answers = DEFAULTS
         else:
-            answers = run_wizard()
-
-        setup_steps = [
-            SetupStructure,
-            SetupFiles,
-            SetupGithub,
-            SetupEnv,
-            SetupFileWriter,
-            SetupDatabase,
-        ]
-
-        run_setup_with_progress(
-            project_location=path.resolve(),
-            setup_steps=setup_steps,
-            **answers,
-        )
+            answers = ui.run_wizard()
+
+        if (events := on_daemon(answers)) is not None:
+            step_timings = ui.follow_build_events(events)
+        else:
+            spec = ProjectSpec(**options, **answers)
+            step_timings = ui.run_setup_with_progress(spec).timings
 
-        show_success()
+        ui.show_success()
+        if timings:
+            ui.console.print(ui.render_timings(step_timings))
 
     except Exception as e:
-        error_panel = Panel(
-            Text(f"❌ Project setup failed\n\n{e}", style="red"),
-            border_style="red",
-            padding=(1, 2),
+        ui.show_error("Project setup failed", e)
+        raise typer.Exit(code=1)
+
+
+@app.command("build-many")
+def build_many(
+    manifest: Path = typer.Argument(
+        ...,
+        help="TOML file with one [[project]] table per project",
+    ),
+    jobs: int | None = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Projects to build at once, defaults to the number of CPUs",
+    ),
+    installer: InstallerType = typer.Option(
+        InstallerType.AUTO,
+        "--installer",
+        help="Package installer to use, auto picks uv when it is available",
+    ),
+    wheelhouse: Path | None = typer.Option(
+        None,
+        "--wheelhouse",
+        help="Directory of wheels to install from, see `hut wheelhouse sync`",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Install from the wheelhouse only, never from the package index",
+    ),
+):
+    """
+    Build many projects from a manifest, in parallel.
+    """
+    from builders_hut import ui
+    from builders_hut.fleet import build_many as build_fleet
+    from builders_hut.fleet import load_manifest
+
+    try:
+        specs = load_manifest(
+            manifest.resolve(),
+            installer=installer,
+            wheelhouse=wheelhouse.resolve() if wheelhouse else None,
+            offline=offline,
         )
-        clear_and_render(error_panel)
+        with ui.console.status(f"[bold cyan]Building {len(specs)} projects..."):
+            entries = build_fleet(specs, jobs=jobs)
+
+    except Exception as e:
+        ui.show_error("Fleet build failed", e, clear=False)
+        raise typer.Exit(code=1)
+
+    ui.console.print(ui.render_fleet(entries))
+    if not all(entry.ok for entry in entries):
         raise typer.Exit(code=1)
 
 
 @app.command()
-def add():
-    panel = Panel(
-        Text("Add command not implemented yet", style="yellow"),
-        border_style="yellow",
-        padding=(1, 2),
+def sync(
+    path: Path = typer.Option(
+        Path.cwd(),
+        "--path",
+        "-p",
+        help="Project directory",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Only show what would change",
+    ),
+):
+    """
+    Re-render the generated files whose template or settings changed.
+
+    Files you edited since they were generated are left alone.
+    """
+    from builders_hut import ui
+    from builders_hut.setups.sync import sync_project
+
+    try:
+        result = sync_project(path.resolve(), dry_run=dry_run)
+    except Exception as e:
+        ui.show_error("Sync failed", e, clear=False)
+        raise typer.Exit(code=1)
+
+    ui.console.print(ui.render_sync(result, dry_run))
+
+
+@add_app.command("resource")
+def add_resource(
+    name: str = typer.Argument(
+        ...,
+        help="Name of the resource, like villain or BlogPost",
+    ),
+    plural: str | None = typer.Option(
+        None,
+        "--plural",
+        help="Plural of the name, used for the url, defaults to adding an s",
+    ),
+    path: Path = typer.Option(
+        Path.cwd(),
+        "--path",
+        "-p",
+        help="Project directory",
+    ),
+):
+    """
+    Add a model, schemas, repository, service and v1 router, like the Hero ones.
+    """
+    from builders_hut import ui
+    from builders_hut.setups.resource import add_resource as add
+
+    try:
+        result = add(path.resolve(), name, plural)
+    except Exception as e:
+        ui.show_error("Could not add the resource", e, clear=False)
+        raise typer.Exit(code=1)
+
+    created = "\n".join(f"   • {p.as_posix()}" for p in result.created)
+    wired = "\n".join(f"   • {p.as_posix()}" for p in result.wired)
+    ui.show_notice(
+        f"✅ Added {result.context.class_name} at /v1/{result.context.path}\n\n"
+        f"Created:\n{created}\n\nWired into:\n{wired}",
+        style="green",
+        clear=False,
+    )
+
+
+@daemon_app.command("start")
+def daemon_start(
+    socket: Path | None = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket to listen on, defaults to $HUT_DAEMON_SOCKET "
+        "or one in $XDG_RUNTIME_DIR",
+    ),
+    jobs: int | None = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Builds to run at once, defaults to the number of CPUs",
+    ),
+):
+    """
+    Serve builds from a warm process until stopped, `hut build` uses it.
+    """
+    from builders_hut.daemon_server import serve
+
+    def on_ready(server):
+        typer.secho(
+            f"hut daemon {APP_VERSION} listening on {server.path} "
+            f"with {server.jobs} workers",
+            fg=typer.colors.GREEN,
+        )
+
+    try:
+        serve(socket, jobs, on_ready=on_ready)
+    except Exception as e:
+        typer.secho(f"Could not start the daemon: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+
+
+@daemon_app.command("stop")
+def daemon_stop(
+    socket: Path | None = typer.Option(None, "--socket", help="Unix socket"),
+):
+    """
+    Stop the running daemon once its builds are done.
+    """
+    from builders_hut import daemon
+
+    if not daemon.stop(socket):
+        typer.secho("No hut daemon is running", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=1)
+    typer.secho("hut daemon stopping", fg=typer.colors.GREEN)
+
+
+@daemon_app.command("status")
+def daemon_status(
+    socket: Path | None = typer.Option(None, "--socket", help="Unix socket"),
+):
+    """
+    Show whether a daemon is running.
+    """
+    from builders_hut import daemon
+
+    pong = daemon.ping(socket)
+    if pong is None:
+        typer.secho("No hut daemon is running", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=1)
+    typer.secho(
+        f"hut daemon {pong['version']} running, pid {pong['pid']}",
+        fg=typer.colors.GREEN,
+    )
+
+
+@wheelhouse_app.command("sync")
+def wheelhouse_sync(
+    directory: Path = typer.Argument(
+        Path("wheelhouse"),
+        help="Directory to download the wheels into",
+    ),
+):
+    """
+    Download the wheels of every database provider profile.
+    """
+    from builders_hut import ui
+    from builders_hut.setups.wheelhouse import sync_wheelhouse
+
+    try:
+        with ui.console.status("[bold cyan]Downloading wheels..."):
+            wheels = sync_wheelhouse(directory.resolve())
+
+    except Exception as e:
+        ui.show_error("Wheelhouse sync failed", e, clear=False)
+        raise typer.Exit(code=1)
+
+    ui.show_notice(
+        f"✅ {len(wheels)} wheels in {directory.resolve()}\n\n"
+        f"Build offline with:\n"
+        f"   • hut build --offline --wheelhouse {directory}",
+        style="green",
+        clear=False,
+    )
+
+
+@lock_app.command("refresh")
+def lock_refresh(
+    check: bool = typer.Option(
+        False,
+        "--check",
+        help="Only check that every lock matches the package lists, fails if not",
+    ),
+):
+    """
+    Resolve the lock of every database provider again, needs uv.
+    """
+    from builders_hut import ui
+    from builders_hut.setups.lockfiles import refresh_locks, stale_locks
+
+    if check:
+        stale = stale_locks()
+        if stale:
+            ui.show_notice(
+                f"Out of date locks: {', '.join(stale)}\n\n"
+                f"Refresh them with:\n   • hut lock refresh",
+                clear=False,
+            )
+            raise typer.Exit(code=1)
+        ui.show_notice("✅ Every lock is up to date", style="green", clear=False)
+        return
+
+    try:
+        with ui.console.status("[bold cyan]Resolving locks..."):
+            locks = refresh_locks()
+
+    except Exception as e:
+        ui.show_error("Lock refresh failed", e, clear=False)
+        raise typer.Exit(code=1)
+
+    written = "\n".join(f"   • {lock}" for lock in locks)
+    ui.show_notice(
+        f"✅ {len(locks)} locks resolved\n\n{written}",
+        style="green",
+        clear=False,
     )
-    clear_and_render(panel)
@@ -0,0 +1,153 @@
+"""
+Warm build daemon.
+
+`hut daemon start` imports the build machinery and compiles every
+project template once, then serves builds over a Unix socket from a
+pool of worker threads. `hut build` hands its build to the daemon when
+one is running, so a small scaffold pays neither the imports nor the
+template compilation.
+
+The protocol is one JSON request per connection, answered with JSON
+lines:
+
+    {"op": "build", "version": "...", "spec": {...}}
+        the build events of builders_hut.events, ending in
+        build_finished or build_failed, or a single rejected event
+        when the daemon runs another version of hut
+    {"op": "ping"}   ->  {"event": "pong", "version": "...", "pid": ...}
+    {"op": "stop"}   ->  {"event": "stopping"}
+
+Builds run with the environment of the daemon, HUT_CACHE_DIR included.
+Clients only talk to a socket that belongs to their own user, see
+is_private(), and build locally otherwise.
+
+This module is the client, it imports nothing beyond the standard
+library so a build handed to the daemon starts fast. The server lives
+in builders_hut.daemon_server.
+"""
+
+import itertools
+import json
+import os
+import socket
+import stat
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+from builders_hut import APP_VERSION
+
+
+def socket_path() -> Path:
+    """The daemon socket, HUT_DAEMON_SOCKET overrides it"""
+    if "HUT_DAEMON_SOCKET" in os.environ:
+        return Path(os.environ["HUT_DAEMON_SOCKET"])
+
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / "builders-hut.sock"
+    # a directory of our own, the temp dir itself is shared with every user
+    return Path(tempfile.gettempdir()) / f"builders-hut-{os.getuid()}" / "daemon.sock"
+
+
+def is_private(path: Path) -> bool:
+    """
+    Whether the socket at path belongs to this user and no one else.
+
+    The socket must be ours with no group or other access, and its
+    directory ours and writable by us alone, so another user can neither
+    listen on the path first nor swap the socket later.
+    """
+    try:
+        sock_stat = os.lstat(path)
+        dir_stat = os.stat(path.parent)
+    except OSError:
+        return False
+
+    uid = os.getuid()
+    return (
+        stat.S_ISSOCK(sock_stat.st_mode)
+        and sock_stat.st_uid == uid
+        and not sock_stat.st_mode & 0o077
+        and dir_stat.st_uid == uid
+        and not dir_stat.st_mode & 0o022
+    )
+
+
+def connect(path: Path | None = None) -> socket.socket | None:
+    """A connection to the running daemon, None if there is none or it is not ours"""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    path = path or socket_path()
+    if not is_private(path):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def request(sock: socket.socket, message: dict) -> Iterator[dict]:
+    """Send one request and yield the events of the answer"""
+    try:
+        sock.sendall((json.dumps(message, default=str) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as lines:
+            for line in lines:
+                yield json.loads(line)
+    finally:
+        sock.close()
+
+
+def submit_build(spec: dict, path: Path | None = None) -> Iterator[dict] | None:
+    """
+    Hand a build to the running daemon and yield its events.
+
+    spec holds the ProjectSpec fields, with an absolute path. None when
+    no daemon is running or it runs another version of hut, the caller
+    then builds locally.
+    """
+    sock = connect(path)
+    if sock is None:
+        return None
+
+    events = request(sock, {"op": "build", "version": APP_VERSION, "spec": spec})
+    try:
+        first = next(events, None)
+    except OSError:
+        return None
+    if first is None or first["event"] == "rejected":
+        events.close()
+        return None
+    return itertools.chain([first], events)
+
+
+def forward_events(events: Iterator[dict], stream) -> bool:
+    """Write the events of a daemon build as JSON lines, True if it finished"""
+    finished = False
+    for event in events:
+        stream.write(json.dumps(event, default=str) + "\n")
+        stream.flush()
+        finished = event["event"] == "build_finished"
+    return finished
+
+
+def ping(path: Path | None = None) -> dict | None:
+    """The pong of the running daemon, None if there is none"""
+    sock = connect(path)
+    if sock is None:
+        return None
+    return next(request(sock, {"op": "ping"}), None)
+
+
+def stop(path: Path | None = None) -> bool:
+    """Ask the running daemon to stop, False if there is none"""
+    sock = connect(path)
+    if sock is None:
+        return False
+    for _ in request(sock, {"op": "stop"}):
+        pass
+    return True
@@ -0,0 +1,161 @@
+"""
+Server half of `hut daemon`, see builders_hut.daemon for the protocol.
+
+warm_up() pays for the imports and the template compilation once. Every
+connection is handled on its own thread and its build is run on a pool
+of jobs worker threads, build_project() being safe to call from many
+threads at once.
+"""
+
+import json
+import os
+import signal
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from builders_hut import APP_VERSION
+from builders_hut.daemon import connect, socket_path
+
+
+def warm_up() -> int:
+    """Import the build machinery and compile every template, returns the count"""
+    from builders_hut import api, events  # noqa: F401
+    from builders_hut.setups.templates import PROJECT_TEMPLATES, RESOURCE_TEMPLATES
+
+    count = 0
+    for template_id in PROJECT_TEMPLATES:
+        if template_id.startswith("resource/"):
+            RESOURCE_TEMPLATES.compiled(template_id)
+        else:
+            PROJECT_TEMPLATES.compiled(template_id)
+        count += 1
+    return count
+
+
+class _ClientStream:
+    """Text stream to a client, one that went away does not fail the build"""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+        self.gone = False
+
+    def write(self, text: str) -> None:
+        if self.gone:
+            return
+        try:
+            self.wfile.write(text.encode("utf-8"))
+        except OSError:
+            self.gone = True
+
+    def flush(self) -> None:
+        pass
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            message = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        self.server.dispatch(message, _ClientStream(self.wfile))
+
+
+class BuildDaemon(socketserver.ThreadingUnixStreamServer):
+    """Serves builds on a Unix socket, at most jobs at once"""
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, jobs: int | None = None):
+        self.path = path
+        if path.exists():
+            if connect(path) is not None:
+                raise RuntimeError(f"A hut daemon is already listening on {path}")
+            # left behind by a daemon that did not stop cleanly
+            path.unlink()
+
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        parent = path.parent.stat()
+        if parent.st_uid != os.getuid() or parent.st_mode & 0o022:
+            raise RuntimeError(
+                f"{path.parent} is writable by other users, clients would not trust "
+                "a socket there"
+            )
+        # only the user that started the daemon may connect
+        umask = os.umask(0o177)
+        try:
+            super().__init__(str(path), _Handler)
+        finally:
+            os.umask(umask)
+
+        self.jobs = jobs or os.cpu_count() or 1
+        self.pool = ThreadPoolExecutor(self.jobs, thread_name_prefix="hut-build")
+
+    def dispatch(self, message: dict, stream: _ClientStream) -> None:
+        from builders_hut.events import JsonlReporter
+
+        reporter = JsonlReporter(stream)
+        match message.get("op"):
+            case "build":
+                if message.get("version") != APP_VERSION:
+                    reporter.emit("rejected", reason=f"daemon runs hut {APP_VERSION}")
+                    return
+                self._build(message.get("spec", {}), reporter)
+            case "ping":
+                reporter.emit("pong", version=APP_VERSION, pid=os.getpid())
+            case "stop":
+                reporter.emit("stopping")
+                # shutdown() waits for serve_forever(), which runs elsewhere
+                threading.Thread(target=self.shutdown).start()
+            case op:
+                reporter.emit("error", error=f"Unknown op: {op}")
+
+    def _build(self, fields: dict, reporter) -> None:
+        from builders_hut.api import ProjectSpec
+        from builders_hut.events import build_with_events
+        from builders_hut.options import InstallerType
+
+        try:
+            spec = ProjectSpec(
+                **{
+                    **fields,
+                    "path": Path(fields["path"]),
+                    "installer": InstallerType(
+                        fields.get("installer", InstallerType.AUTO)
+                    ),
+                    "wheelhouse": (
+                        Path(fields["wheelhouse"]) if fields.get("wheelhouse") else None
+                    ),
+                }
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            reporter.emit("build_failed", error=f"Invalid build request: {e}")
+            return
+
+        try:
+            self.pool.submit(build_with_events, spec, reporter).result()
+        except Exception:
+            # already reported as build_failed
+            pass
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(wait=True)
+        self.path.unlink(missing_ok=True)
+
+
+def serve(path: Path | None = None, jobs: int | None = None, on_ready=None) -> None:
+    """Run the daemon until it is asked to stop, or gets SIGINT or SIGTERM"""
+    warm_up()
+    with BuildDaemon(path or socket_path(), jobs) as daemon:
+        signal.signal(
+            signal.SIGTERM,
+            lambda *_: threading.Thread(target=daemon.shutdown).start(),
+        )
+        if on_ready:
+            on_ready(daemon)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
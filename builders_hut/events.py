@@ -0,0 +1,91 @@
+"""
+Machine readable build progress.
+
+Every event is one JSON object per line. t is the time since the build
+started and durations are in seconds, both from the monotonic clock.
+"""
+
+import json
+import sys
+import threading
+import time
+from dataclasses import asdict
+from typing import TextIO
+
+from builders_hut.api import BuildResult, ProjectSpec, build_project
+
+
+class JsonlReporter:
+    """Writes build events as JSON lines, safe to call from any thread"""
+
+    def __init__(self, stream: TextIO | None = None):
+        self.stream = stream or sys.stdout
+        self.start = time.monotonic()
+        self._lock = threading.Lock()
+        self._step_starts: dict[str, float] = {}
+
+    def emit(self, event: str, **fields) -> None:
+        record = {"event": event, "t": round(time.monotonic() - self.start, 6)}
+        record.update(fields)
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def _duration(self, step) -> float:
+        return round(time.monotonic() - self._step_starts[step.__name__], 6)
+
+    def on_start(self, step) -> None:
+        self._step_starts[step.__name__] = time.monotonic()
+        self.emit("step_started", step=step.__name__)
+
+    def on_finish(self, step) -> None:
+        self.emit("step_finished", step=step.__name__, duration=self._duration(step))
+
+    def on_error(self, step, error: BaseException) -> None:
+        self.emit(
+            "step_failed",
+            step=step.__name__,
+            duration=self._duration(step),
+            error=str(error),
+        )
+
+    def on_subprocess(
+        self, step: str, command: str, returncode: int | None, seconds: float
+    ) -> None:
+        self.emit(
+            "subprocess_exited",
+            step=step,
+            command=command,
+            returncode=returncode,
+            duration=round(seconds, 6),
+        )
+
+
+def build_with_events(spec: ProjectSpec, reporter: JsonlReporter) -> BuildResult:
+    """
+    Run build_project() and report every step and subprocess as it happens.
+
+    The build ends with a build_finished event holding the per-step
+    timings, or a build_failed event before the error is raised.
+    """
+    reporter.emit("build_started", name=spec.name, path=str(spec.path))
+    try:
+        result = build_project(
+            spec,
+            on_start=reporter.on_start,
+            on_finish=reporter.on_finish,
+            on_error=reporter.on_error,
+            on_subprocess=reporter.on_subprocess,
+        )
+    except Exception as e:
+        reporter.emit("build_failed", error=str(e))
+        raise
+
+    reporter.emit(
+        "build_finished",
+        path=str(result.path),
+        duration=round(result.wall, 6),
+        timings=[asdict(timing) for timing in result.timings],
+    )
+    return result
@@ -0,0 +1,127 @@
+"""
+Build many projects from one manifest.
+
+Example manifest.toml:
+
+    [defaults]
+    database_provider = "postgres"
+
+    [[project]]
+    name = "orders"
+    description = "Order service"
+
+    [[project]]
+    name = "billing"
+    path = "services/billing"
+    database_provider = "sqlite"
+    schema_backend = "msgspec"
+
+Project paths are relative to the manifest and default to the project name.
+"""
+
+import tomllib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from builders_hut.api import BuildResult, ProjectSpec, build_project
+from builders_hut.setups.env_setup import requirements_for
+from builders_hut.setups.venv_cache import VenvCache
+
+MANIFEST_KEYS = {
+    "name",
+    "path",
+    "description",
+    "version",
+    "database_type",
+    "database_provider",
+    "schema_backend",
+}
+
+
+@dataclass
+class FleetEntry:
+    spec: ProjectSpec
+    result: BuildResult | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def load_manifest(manifest: Path, **overrides) -> list[ProjectSpec]:
+    """Read the project specs, overrides apply to every project"""
+    try:
+        data = tomllib.loads(manifest.read_text(encoding="utf-8"))
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        raise RuntimeError(f"Could not read manifest {manifest}: {e}")
+
+    defaults = data.get("defaults", {})
+    projects = data.get("project", [])
+    if not projects:
+        raise RuntimeError(f"No [[project]] entries in {manifest}")
+
+    specs = []
+    for entry in projects:
+        entry = {**defaults, **entry}
+        unknown = set(entry) - MANIFEST_KEYS
+        if unknown:
+            raise RuntimeError(f"Unknown manifest keys: {', '.join(sorted(unknown))}")
+        if "name" not in entry:
+            raise RuntimeError("Every project in the manifest needs a name")
+
+        entry["path"] = manifest.parent / entry.get("path", entry["name"])
+        specs.append(ProjectSpec(**entry, **overrides))
+
+    return specs
+
+
+def _build_one(spec: ProjectSpec) -> FleetEntry:
+    """Runs in a worker process"""
+    try:
+        return FleetEntry(spec, result=build_project(spec))
+    except Exception as e:
+        return FleetEntry(spec, error=str(e))
+
+
+def _dependency_set(spec: ProjectSpec) -> tuple:
+    try:
+        packages, dev_packages = requirements_for(
+            spec.database_type, spec.database_provider, spec.schema_backend
+        )
+    except RuntimeError:
+        # an invalid spec shares nothing, its own build reports the error
+        return ("invalid", spec.name)
+    return (*sorted(packages), *sorted(dev_packages), spec.installer)
+
+
+def build_many(specs: list[ProjectSpec], jobs: int | None = None) -> list[FleetEntry]:
+    """
+    Build every spec on a process pool.
+
+    Projects with the same dependency set share one install: the first
+    of each set is built first and fills the venv cache, the others
+    then clone the cached venv. Results come back in the order of specs.
+    """
+    sharing = VenvCache.is_supported() and all(spec.use_cache for spec in specs)
+
+    if sharing:
+        leaders: dict[tuple, int] = {}
+        for index, spec in enumerate(specs):
+            leaders.setdefault(_dependency_set(spec), index)
+        waves = [
+            sorted(leaders.values()),
+            [i for i in range(len(specs)) if i not in leaders.values()],
+        ]
+    else:
+        waves = [list(range(len(specs)))]
+
+    entries: list[FleetEntry | None] = [None] * len(specs)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for wave in waves:
+            results = pool.map(_build_one, [specs[i] for i in wave])
+            for index, entry in zip(wave, results):
+                entries[index] = entry
+
+    return entries
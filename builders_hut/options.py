@@ -0,0 +1,30 @@
+"""
+Choices for CLI options.
+
+Lives outside builders_hut.setups so the CLI can declare its options
+without importing the setup steps and templates.
+"""
+
+from enum import Enum
+
+
+class InstallerType(str, Enum):
+    """Which tool creates the virtual env and installs the packages"""
+
+    PIP = "pip"
+    UV = "uv"
+    AUTO = "auto"
+
+
+class OutputFormat(str, Enum):
+    """How build progress is shown"""
+
+    RICH = "rich"
+    JSONL = "jsonl"
+
+
+class SchemaBackend(str, Enum):
+    """Which library the generated request and response schemas use"""
+
+    PYDANTIC = "pydantic"
+    MSGSPEC = "msgspec"
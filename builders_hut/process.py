@@ -0,0 +1,182 @@
+"""
+Subprocess runner.
+
+Commands run without a shell through asyncio. Their combined output is
+kept in a bounded buffer of the last lines, so a failure can say what
+went wrong without holding the whole output of a pip install in memory.
+Every command has a timeout, and the whole process group is killed on
+timeout or cancellation so no child of pip or git is left behind.
+"""
+
+import asyncio
+import os
+import shlex
+import signal
+import subprocess
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+from builders_hut.timing import record_subprocess
+
+# seconds, long enough for a cold pip install of every package
+DEFAULT_TIMEOUT = 900
+
+# lines of output kept per command, and how many of them an error shows
+OUTPUT_LINES = 200
+ERROR_LINES = 20
+
+_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class CommandResult:
+    command: str
+    returncode: int | None
+    duration: float
+    output: str
+
+
+class CommandError(RuntimeError):
+    """A command failed, timed out or could not be started"""
+
+    def __init__(self, reason: str, result: CommandResult):
+        self.result = result
+        message = f"`{result.command}` {reason}"
+        if result.output:
+            message += "\n" + "\n".join(result.output.splitlines()[-ERROR_LINES:])
+        super().__init__(message)
+
+
+def _spawn_options() -> dict:
+    """Start the command in its own process group so it can be killed as a whole"""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def _kill_group(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is not None:
+        return
+    try:
+        if os.name == "nt":
+            process.kill()
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+async def _collect(stream: asyncio.StreamReader, lines: deque) -> None:
+    pending = b""
+    while chunk := await stream.read(_CHUNK_SIZE):
+        *complete, pending = (pending + chunk).split(b"\n")
+        lines.extend(complete)
+        # a single endless line must not grow without bound either
+        pending = pending[-_CHUNK_SIZE:]
+    if pending:
+        lines.append(pending)
+
+
+async def run_command_async(
+    location: Path,
+    args: list[str | Path],
+    *,
+    timeout: float | None = DEFAULT_TIMEOUT,
+    output_lines: int = OUTPUT_LINES,
+) -> CommandResult:
+    """
+    Run a command in location and wait for it.
+
+    Raises CommandError when the command cannot be started, exits with
+    a non zero code or runs longer than timeout.
+    """
+    command = shlex.join(str(arg) for arg in args)
+    lines: deque[bytes] = deque(maxlen=output_lines)
+    start = time.perf_counter()
+
+    def result(returncode: int | None) -> CommandResult:
+        return CommandResult(
+            command=command,
+            returncode=returncode,
+            duration=time.perf_counter() - start,
+            output=b"\n".join(lines).decode("utf-8", errors="replace"),
+        )
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *(str(arg) for arg in args),
+            cwd=location,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            **_spawn_options(),
+        )
+    except OSError as e:
+        failed = result(None)
+        record_subprocess(failed.duration, command, None)
+        raise CommandError(f"could not be started: {e}", failed)
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(_collect(process.stdout, lines), process.wait()),
+            timeout,
+        )
+    except TimeoutError:
+        _kill_group(process)
+        await process.wait()
+        failed = result(process.returncode)
+        record_subprocess(failed.duration, command, failed.returncode)
+        raise CommandError(f"timed out after {timeout}s", failed)
+    except asyncio.CancelledError:
+        _kill_group(process)
+        raise
+
+    done = result(process.returncode)
+    record_subprocess(done.duration, command, done.returncode)
+    if done.returncode != 0:
+        raise CommandError(f"exited with code {done.returncode}", done)
+    return done
+
+
+async def run_commands_async(
+    location: Path,
+    commands: list[list[str | Path]],
+    *,
+    timeout: float | None = DEFAULT_TIMEOUT,
+) -> list[CommandResult]:
+    """
+    Run several commands at the same time.
+
+    If one fails the others are cancelled, which kills their process groups.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(run_command_async(location, args, timeout=timeout))
+                for args in commands
+            ]
+    except ExceptionGroup as e:
+        raise e.exceptions[0]
+    return [task.result() for task in tasks]
+
+
+def run_command(
+    location: Path,
+    args: list[str | Path],
+    *,
+    timeout: float | None = DEFAULT_TIMEOUT,
+) -> CommandResult:
+    """run_command_async() for synchronous code such as the setup steps"""
+    return asyncio.run(run_command_async(location, args, timeout=timeout))
+
+
+def run_commands(
+    location: Path,
+    commands: list[list[str | Path]],
+    *,
+    timeout: float | None = DEFAULT_TIMEOUT,
+) -> list[CommandResult]:
+    """run_commands_async() for synchronous code"""
+    return asyncio.run(run_commands_async(location, commands, timeout=timeout))
@@ -6,6 +6,8 @@ from .files_setup import SetupFiles
 from .structure_setup import SetupStructure
 from .db_setup import SetupDatabase
 from .git_setup import SetupGithub
+from .materializer import Manifest, materialize
+from .scheduler import run_steps
 
 __all__ = [
     SetupEnv,
@@ -16,4 +18,7 @@ __all__ = [
     SetupDatabase,
     SetupGithub,
     FILES_TO_WRITE,
+    Manifest,
+    materialize,
+    run_steps,
 ]
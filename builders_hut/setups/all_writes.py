@@ -1,44 +1,44 @@
 from pathlib import Path
 
-from builders_hut.setups import file_contents
-
+# path -> id of the template rendered into it, see setups/templates.py
 FILES_TO_WRITE: dict[Path, str] = {
     # Main
-    Path("app/main.py"): file_contents.APP_MAIN_CONTENT,
+    Path("app/main.py"): "app/main.py",
     # API
-    Path("app/api/__init__.py"): file_contents.APP_API_INIT_CONTENT,
-    Path("app/api/common.py"): file_contents.APP_API_COMMON_CONTENT,
-    Path("app/api/v1/__init__.py"): file_contents.APP_API_V1_INIT_CONTENT,
-    Path("app/api/v1/hero.py"): file_contents.APP_API_V1_HERO_CONTENT,
+    Path("app/api/__init__.py"): "app/api/__init__.py",
+    Path("app/api/common.py"): "app/api/common.py",
+    Path("app/api/v1/__init__.py"): "app/api/v1/__init__.py",
+    Path("app/api/v1/hero.py"): "app/api/v1/hero.py",
     # Core
-    Path("app/core/__init__.py"): file_contents.APP_CORE_INIT_CONTENT,
-    Path("app/core/config.py"): file_contents.APP_CORE_CONFIG_CONTENT,
-    Path("app/core/errors.py"): file_contents.APP_CORE_ERRORS_CONTENT,
-    Path("app/core/exceptions.py"): file_contents.APP_CORE_EXCEPTIONS_CONTENT,
-    Path("app/core/lifespan.py"): file_contents.APP_CORE_LIFESPAN_CONTENT,
-    Path("app/core/responses.py"): file_contents.APP_CORE_API_RESPONSES_CONTENT,
-    Path(
-        "app/core/response_helper.py"
-    ): file_contents.APP_CORE_API_RESPONSE_HELPER_CONTENT,
+    Path("app/core/__init__.py"): "app/core/__init__.py",
+    Path("app/core/config.py"): "app/core/config.py",
+    Path("app/core/errors.py"): "app/core/errors.py",
+    Path("app/core/exceptions.py"): "app/core/exceptions.py",
+    Path("app/core/lifespan.py"): "app/core/lifespan.py",
+    Path("app/core/responses.py"): "app/core/responses.py",
+    Path("app/core/response_helper.py"): "app/core/response_helper.py",
+    Path("app/core/pagination.py"): "app/core/pagination.py",
     # Models
-    Path("app/models/__init__.py"): file_contents.APP_MODELS_INIT_CONTENT,
-    Path("app/models/hero.py"): file_contents.APP_MODELS_HERO_CONTENT,
-    Path("app/models/common.py"): file_contents.APP_MODELS_COMMON_CONTENT,
+    Path("app/models/__init__.py"): "app/models/__init__.py",
+    Path("app/models/hero.py"): "app/models/hero.py",
+    Path("app/models/common.py"): "app/models/common.py",
     # Repositories
-    Path("app/repositories/__init__.py"): file_contents.APP_REPO_INIT_CONTENT_FOR_SQL,
-    Path("app/repositories/hero.py"): file_contents.APP_REPO_HERO_CONTENT_FOR_SQL,
+    Path("app/repositories/__init__.py"): "app/repositories/__init__.py",
+    Path("app/repositories/hero.py"): "app/repositories/hero.py",
     # Services
-    Path("app/services/__init__.py"): file_contents.APP_SERVICE_INIT_CONTENT,
-    Path("app/services/hero.py"): file_contents.APP_SERVICE_HERO_CONTENT,
+    Path("app/services/__init__.py"): "app/services/__init__.py",
+    Path("app/services/hero.py"): "app/services/hero.py",
     # Templates
-    Path("app/templates/index.html"): file_contents.APP_TEMPLATES_INDEX_CONTENT,
+    Path("app/templates/index.html"): "app/templates/index.html",
     # .env Files
-    Path(".env"): file_contents.ENV_FILE_CONTENT,
+    Path(".env"): ".env",
     # .gitignore File
-    Path(".gitignore"): file_contents.GIT_IGNORE_FILE_CONTENT,
+    Path(".gitignore"): ".gitignore",
     # run.py
-    Path("run.py"): file_contents.RUN_FILE_CONTENT,
+    Path("run.py"): "run.py",
     # Schemas
-    Path("app/schemas/hero.py"): file_contents.APP_SCHEMA_HERO_CONTENT,
-    Path("app/schemas/common.py"): file_contents.APP_SCHEMA_COMMON_CONTENT,
+    Path("app/schemas/hero.py"): "app/schemas/hero.py",
+    Path("app/schemas/common.py"): "app/schemas/common.py",
+    # Tests
+    Path("tests/bench_response_helper.py"): "tests/bench_response_helper.py",
 }
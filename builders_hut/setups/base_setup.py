@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+from builders_hut.setups.materializer import Manifest
+
 
 class BaseSetup(ABC):
+    # Names of the setup steps that must finish before this one can start.
+    # Steps that do not depend on each other are run in parallel.
+    DEPENDS_ON: tuple[str, ...] = ()
+
     def __init__(self, location):
         self.location = Path(location) if not isinstance(location, Path) else location
 
@@ -14,3 +20,32 @@ class BaseSetup(ABC):
     def configure(self, **kwargs):
         """Optional hook"""
         pass
+
+    def manifest(self) -> Manifest:
+        """
+        Optional hook, the directories and files this step generates.
+
+        SetupFiles collects the manifests of every generating step and
+        writes them in a single pass.
+        """
+        return Manifest()
+
+    def templates(self) -> dict[Path, str]:
+        """
+        Optional hook, the files of the manifest rendered from a template,
+        path -> template id.
+
+        They are recorded in .hut/manifest.json so `hut sync` can render
+        them again later.
+        """
+        return {}
+
+    def generated_files(self) -> dict[Path, str]:
+        """
+        Optional hook, the files of the manifest generated without a
+        template, path -> content.
+
+        They are recorded in .hut/manifest.json too, so `hut sync` can
+        update them when what they are generated from changes.
+        """
+        return {}
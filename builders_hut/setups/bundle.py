@@ -0,0 +1,111 @@
+"""
+Template bundle.
+
+All project templates packed into one file, so a build does not import
+and build every template string up front. The file is memory-mapped and
+a template is decoded only when it is first compiled.
+
+Layout, little endian:
+
+    header   magic b"HUTB", format version u16, template count u32,
+             sha256 of the template modules it was packed from
+    index    per template: id length u16, offset u64, size u32, id utf-8
+    data     the utf-8 template sources, offsets are from the file start
+
+Rebuild the bundle after changing anything in setups/file_contents:
+
+    python -m builders_hut.setups.file_contents
+    python -m builders_hut.setups.file_contents --check    # exits 1 if stale
+"""
+
+import hashlib
+import mmap
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+
+BUNDLE_PATH = Path(__file__).resolve().parent / "templates.bundle"
+SOURCES_DIR = Path(__file__).resolve().parent / "file_contents"
+
+MAGIC = b"HUTB"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<4sHI32s")
+_ENTRY = struct.Struct("<HQI")
+
+
+class TemplateBundle(Mapping):
+    """Template id -> source, read from a memory-mapped bundle file"""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, _ = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise RuntimeError(f"Not a template bundle, or an old one: {path}")
+
+        self._index: dict[str, tuple[int, int]] = {}
+        position = _HEADER.size
+        for _ in range(count):
+            id_size, offset, size = _ENTRY.unpack_from(self._map, position)
+            position += _ENTRY.size
+            template_id = self._map[position : position + id_size].decode("utf-8")
+            position += id_size
+            self._index[template_id] = (offset, size)
+
+    def __getitem__(self, template_id: str) -> str:
+        offset, size = self._index[template_id]
+        return self._map[offset : offset + size].decode("utf-8")
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def sources_digest(directory: Path = SOURCES_DIR) -> bytes:
+    """Hash of the template modules, their names and contents"""
+    digest = hashlib.sha256()
+    for source in sorted(directory.glob("*.py")):
+        digest.update(source.name.encode("utf-8") + b"\0")
+        digest.update(source.read_bytes() + b"\0")
+    return digest.digest()
+
+
+def pack(sources: Mapping[str, str], digest: bytes) -> bytes:
+    """The bundle file holding sources, packed from the modules hashing to digest"""
+    ids = [template_id.encode("utf-8") for template_id in sources]
+    data = [source.encode("utf-8") for source in sources.values()]
+
+    offset = _HEADER.size + sum(_ENTRY.size + len(i) for i in ids)
+    index = []
+    for template_id, source in zip(ids, data):
+        index.append(_ENTRY.pack(len(template_id), offset, len(source)) + template_id)
+        offset += len(source)
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(ids), digest)
+    return b"".join([header, *index, *data])
+
+
+def is_stale(path: Path = BUNDLE_PATH, sources: Path = SOURCES_DIR) -> bool:
+    """
+    Whether the bundle is missing or was packed from other template sources.
+
+    The hash of the modules is compared rather than file times, which a
+    git checkout or a copy does not keep in order. Hashing the few
+    modules is still much cheaper than importing them.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+    except FileNotFoundError:
+        return True
+
+    if len(header) < _HEADER.size:
+        return True
+    magic, version, _, digest = _HEADER.unpack(header)
+    return (
+        magic != MAGIC or version != FORMAT_VERSION or digest != sources_digest(sources)
+    )
@@ -1,11 +1,22 @@
 from typing import Literal
-from builders_hut.utils import write_file, run_subprocess, get_python_file
 from pathlib import Path
-from builders_hut.setups.file_contents import (
-    APP_DATABASE_SESSION_CONTENT_FOR_SQL,
-    MIGRATIONS_ENV_FILE_CONTENT,
-    APP_DATABASE_INIT_CONTENT_FOR_SQL,
-)
+from builders_hut.setups.materializer import Manifest, materialize
+from builders_hut.setups.templates import ProjectContext, render
+
+# path -> template id
+SQL_FILES = {
+    Path(template_id): template_id
+    for template_id in [
+        "app/database/session.py",
+        "app/database/replicas.py",
+        "app/database/__init__.py",
+        # the same tree `alembic init -t async migrations` creates
+        "alembic.ini",
+        "migrations/README",
+        "migrations/env.py",
+        "migrations/script.py.mako",
+    ]
+}
 
 
 class DatabaseFactory:
@@ -13,34 +24,30 @@ class DatabaseFactory:
         self,
         database_type: Literal["sql", "nosql"],
         location: Path,
+        context: ProjectContext,
     ):
         self.database_type = database_type
         self.location = location
+        self.context = context
 
     def setup_db(self):
+        materialize(self.location, self.manifest())
+
+    def manifest(self) -> Manifest:
+        manifest = Manifest()
         match self.database_type:
             case "sql":
-                write_file(
-                    self.location / "app" / "database" / "session.py",
-                    APP_DATABASE_SESSION_CONTENT_FOR_SQL,
-                )
-                write_file(
-                    self.location / "app" / "database" / "__init__.py",
-                    APP_DATABASE_INIT_CONTENT_FOR_SQL,
-                )
-
-                command = "alembic init -t async migrations"
-
-                python_file = get_python_file()
-
-                full_command = f"{python_file} {command}"
-
-                run_subprocess(self.location, full_command)
-
-                write_file(
-                    self.location / "migrations" / "env.py", MIGRATIONS_ENV_FILE_CONTENT
-                )
+                # written directly, no need to run alembic from the venv
+                manifest.add_directory("migrations/versions")
             case "nosql":
                 pass
             case _:
                 raise RuntimeError("Invalid Database Type Selected")
+
+        for path, template_id in self.templates().items():
+            manifest.add_file(path, render(template_id, self.context))
+        return manifest
+
+    def templates(self) -> dict[Path, str]:
+        """path -> template id of the files rendered for the database type"""
+        return SQL_FILES if self.database_type == "sql" else {}
@@ -1,13 +1,26 @@
+from pathlib import Path
 from builders_hut.setups import BaseSetup
 from typing import Literal
 from builders_hut.setups.database import DatabaseFactory
+from builders_hut.setups.materializer import Manifest
+from builders_hut.setups.templates import ProjectContext
 
 
 class SetupDatabase(BaseSetup):
     """setup database"""
 
     def create(self):
-        DatabaseFactory(self.database_type, self.location).setup_db()
+        self.factory().setup_db()
+
+    def manifest(self) -> Manifest:
+        return self.factory().manifest()
+
+    def templates(self) -> dict[Path, str]:
+        return self.factory().templates()
+
+    def factory(self) -> DatabaseFactory:
+        return DatabaseFactory(self.database_type, self.location, self.context)
 
     def configure(self, database_type: Literal["sql", "nosql"], **kwargs):
         self.database_type = database_type
+        self.context = ProjectContext.from_config(database_type=database_type, **kwargs)
@@ -1,8 +1,14 @@
 from builders_hut.setups import BaseSetup
-from builders_hut.utils import write_file, run_subprocess, get_python_file
+from builders_hut.options import SchemaBackend
+from builders_hut.setups.installer import InstallerType, get_installer
+from builders_hut.setups.venv_cache import VenvCache, cache_key
+from builders_hut.setups.materializer import Manifest
 from typing import Literal
+import shutil
+from pathlib import Path
 
-PACKAGES = [
+# tuples, so no build can change the package lists of another
+PACKAGES = (
     "fastapi",
     "python-dotenv",
     "email-validator",
@@ -11,63 +17,146 @@ PACKAGES = [
     "scalar-fastapi",
     "uvicorn",
     "jinja2",
-]
+    "orjson",
+)
 
-DEV_PACKAGES = ["pytest"]
+DEV_PACKAGES = ("pytest",)
 
 
 DB_SQL_PACKAGES = {
-    "postgres": ["sqlmodel", "asyncpg", "psycopg2-binary"],
-    "mysql": ["sqlmodel", "aiomysql", "pymysql"],
-    "sqlite": ["sqlmodel", "aiosqlite"],
+    "postgres": ("sqlmodel", "asyncpg", "psycopg2-binary"),
+    "mysql": ("sqlmodel", "aiomysql", "pymysql"),
+    "sqlite": ("sqlmodel", "aiosqlite"),
 }
 
-SQL_COMMON_PACKAGE = ["alembic"]
+# the async engine of app/database/session.py needs greenlet
+SQL_COMMON_PACKAGE = ("alembic", "sqlalchemy[asyncio]")
 
-DEV_PACKAGES_EXTENDED = ["-r requirements.txt"]
+DEV_PACKAGES_EXTENDED = ("-r requirements.txt",)
 
+# pydantic comes with fastapi
+SCHEMA_BACKEND_PACKAGES = {
+    SchemaBackend.PYDANTIC: (),
+    SchemaBackend.MSGSPEC: ("msgspec",),
+}
 
-class SetupEnv(BaseSetup):
-    """Create Env and Install Base Packages"""
 
-    def create(self):
-        try:
-            try:
-                if self.database_type == "sql":
-                    PACKAGES.extend(SQL_COMMON_PACKAGE)
-                    PACKAGES.extend(DB_SQL_PACKAGES[self.database_provider])
+def requirements_for(
+    database_type: Literal["sql", "nosql"],
+    database_provider: str,
+    schema_backend: SchemaBackend | str = SchemaBackend.PYDANTIC,
+) -> tuple[list[str], list[str]]:
+    """
+    The requirements.txt and requirements_dev.txt lines of a project.
 
-                write_file(self.location / "requirements.txt", "\n".join(PACKAGES))
+    Always returns new lists, the module level package lists are never changed.
+    """
+    packages = list(PACKAGES)
+    if database_type == "sql":
+        if database_provider not in DB_SQL_PACKAGES:
+            raise RuntimeError(f"Unsupported SQL database provider: {database_provider}")
+        packages.extend(SQL_COMMON_PACKAGE)
+        packages.extend(DB_SQL_PACKAGES[database_provider])
 
-                DEV_PACKAGES_EXTENDED.extend(DEV_PACKAGES)
-                write_file(
-                    self.location / "requirements_dev.txt",
-                    "\n".join(DEV_PACKAGES_EXTENDED),
-                )
+    if schema_backend not in set(SchemaBackend):
+        raise RuntimeError(f"Unsupported schema backend: {schema_backend}")
+    packages.extend(SCHEMA_BACKEND_PACKAGES[SchemaBackend(schema_backend)])
 
-            except Exception as e:
-                print(e)
-                raise RuntimeError("Could not write to requirements file")
+    return packages, [*DEV_PACKAGES_EXTENDED, *DEV_PACKAGES]
 
-            try:
-                run_subprocess(self.location, "python -m venv .venv")
 
-            except Exception:
-                raise RuntimeError("Could not create virtual env for project")
+class SetupEnv(BaseSetup):
+    """
+    Create Env and Install Base Packages
+
+    The requirements files are part of the manifest written by SetupFiles,
+    with the shipped lock of the provider profile as requirements.lock
+    when it is up to date. The venv is then installed from the lock.
+    """
+
+    DEPENDS_ON = ("SetupFiles",)
 
-            command = "pip install -r requirements_dev.txt"
-            python_file = get_python_file()
+    def create(self):
+        # lockfiles reads the package lists of this module, so it imports it
+        from builders_hut.setups.lockfiles import PROJECT_LOCK, pinned, read_lock
 
-            full_command = f"{python_file} {command}"
+        try:
+            installer = get_installer(self.installer, self.wheelhouse, self.offline)
+
+            cache = VenvCache() if self.use_cache and VenvCache.is_supported() else None
+            lock = read_lock(
+                self.database_type, self.database_provider, self.schema_backend
+            )
+            if lock is not None:
+                requirements = pinned(lock)
+            else:
+                packages, _ = requirements_for(
+                    self.database_type, self.database_provider, self.schema_backend
+                )
+                requirements = [*packages, *DEV_PACKAGES]
+            key = cache_key(requirements, installer.name)
+            if cache and self._restore_from_cache(cache, key):
+                return
 
             try:
-                run_subprocess(self.location, full_command)
-            except Exception:
-                raise RuntimeError("Could not install packages")
+                installer.create_venv(self.location)
+
+            except Exception as e:
+                raise RuntimeError(f"Could not create virtual env for project\n{e}")
+
+            try:
+                if lock is not None:
+                    # pinned and hashed, nothing left to resolve
+                    installer.install(self.location, PROJECT_LOCK, locked=True)
+                else:
+                    installer.install(self.location, "requirements_dev.txt")
+            except Exception as e:
+                raise RuntimeError(f"Could not install packages\n{e}")
+
+            if cache:
+                try:
+                    cache.store(key, self.location / ".venv")
+                except OSError:
+                    # the env is installed, a cache failure must not fail the build
+                    pass
 
         except Exception as e:
             raise RuntimeError(f"Failed to create environment: {str(e)}")
 
+    def manifest(self) -> Manifest:
+        manifest = Manifest()
+        for path, content in self.generated_files().items():
+            manifest.add_file(path, content)
+        return manifest
+
+    def generated_files(self) -> dict[Path, str]:
+        from builders_hut.setups.lockfiles import PROJECT_LOCK, read_lock
+
+        packages, dev_packages = requirements_for(
+            self.database_type, self.database_provider, self.schema_backend
+        )
+        files = {
+            Path("requirements.txt"): "\n".join(packages),
+            Path("requirements_dev.txt"): "\n".join(dev_packages),
+        }
+
+        lock = read_lock(
+            self.database_type, self.database_provider, self.schema_backend
+        )
+        if lock is not None:
+            files[Path(PROJECT_LOCK)] = lock
+        return files
+
+    def _restore_from_cache(self, cache: VenvCache, key: str) -> bool:
+        """Clone a cached env into the project, False if there is none"""
+        venv = self.location / ".venv"
+        try:
+            return cache.restore(key, venv)
+        except OSError:
+            # a broken entry falls back to a normal install
+            shutil.rmtree(venv, ignore_errors=True)
+            return False
+
     def configure(
         self,
         name: str,
@@ -75,6 +164,11 @@ class SetupEnv(BaseSetup):
         version: str,
         database_provider: Literal["postgres", "mysql", "sqlite", "mongodb"],
         database_type: Literal["sql", "nosql"],
+        schema_backend: SchemaBackend | str = SchemaBackend.PYDANTIC,
+        installer: InstallerType | str = InstallerType.AUTO,
+        use_cache: bool = True,
+        wheelhouse: Path | None = None,
+        offline: bool = False,
         **kwargs,
     ):
         self.name = name
@@ -82,3 +176,8 @@ class SetupEnv(BaseSetup):
         self.version = version
         self.database_provider = database_provider
         self.database_type = database_type
+        self.schema_backend = schema_backend
+        self.installer = installer
+        self.use_cache = use_cache
+        self.wheelhouse = wheelhouse
+        self.offline = offline
@@ -1,3 +1,8 @@
+from .alembic_files import (
+    ALEMBIC_INI_CONTENT,
+    MIGRATIONS_README_CONTENT,
+    MIGRATIONS_SCRIPT_MAKO_CONTENT,
+)
 from .app_api import APP_API_COMMON_CONTENT, APP_API_INIT_CONTENT
 from .app_api_v1 import APP_API_V1_HERO_CONTENT, APP_API_V1_INIT_CONTENT
 from .app_core import (
@@ -7,11 +12,13 @@ from .app_core import (
     APP_CORE_ERRORS_CONTENT,
     APP_CORE_EXCEPTIONS_CONTENT,
     APP_CORE_API_RESPONSE_HELPER_CONTENT,
+    APP_CORE_PAGINATION_CONTENT,
     APP_CORE_API_RESPONSES_CONTENT,
 )
 from .app_database import (
-    APP_DATABASE_INIT_CONTENT_FOR_SQL,
-    APP_DATABASE_SESSION_CONTENT_FOR_SQL,
+    APP_DATABASE_INIT_CONTENT,
+    APP_DATABASE_REPLICAS_CONTENT,
+    APP_DATABASE_SESSION_CONTENT,
 )
 from .app_main import APP_MAIN_CONTENT
 from .app_model import (
@@ -19,7 +26,7 @@ from .app_model import (
     APP_MODELS_HERO_CONTENT,
     APP_MODELS_INIT_CONTENT,
 )
-from .app_repository import APP_REPO_HERO_CONTENT_FOR_SQL, APP_REPO_INIT_CONTENT_FOR_SQL
+from .app_repository import APP_REPO_HERO_CONTENT, APP_REPO_INIT_CONTENT
 from .app_services import APP_SERVICE_INIT_CONTENT, APP_SERVICE_HERO_CONTENT
 from .app_templates import APP_TEMPLATES_INDEX_CONTENT
 from .env_file import ENV_FILE_CONTENT
@@ -27,6 +34,14 @@ from .gitignore_file import GIT_IGNORE_FILE_CONTENT
 from .migrations_env_file import MIGRATIONS_ENV_FILE_CONTENT
 from .run_file import RUN_FILE_CONTENT
 from .app_schema import APP_SCHEMA_COMMON_CONTENT, APP_SCHEMA_HERO_CONTENT
+from .tests_files import TESTS_BENCH_RESPONSE_HELPER_CONTENT
+from .resource_files import (
+    RESOURCE_API_V1_CONTENT,
+    RESOURCE_MODEL_CONTENT,
+    RESOURCE_REPOSITORY_CONTENT,
+    RESOURCE_SCHEMA_CONTENT,
+    RESOURCE_SERVICE_CONTENT,
+)
 
 __all__ = [
     # main
@@ -42,8 +57,10 @@ __all__ = [
     APP_CORE_API_RESPONSES_CONTENT,
     APP_CORE_EXCEPTIONS_CONTENT,
     APP_CORE_API_RESPONSE_HELPER_CONTENT,
+    APP_CORE_PAGINATION_CONTENT,
     # Database
-    APP_DATABASE_SESSION_CONTENT_FOR_SQL,
+    APP_DATABASE_SESSION_CONTENT,
+    APP_DATABASE_REPLICAS_CONTENT,
     # Model
     APP_MODELS_COMMON_CONTENT,
     # Templates
@@ -54,17 +71,20 @@ __all__ = [
     GIT_IGNORE_FILE_CONTENT,
     # alemmbic Migrations env file
     MIGRATIONS_ENV_FILE_CONTENT,
+    ALEMBIC_INI_CONTENT,
+    MIGRATIONS_SCRIPT_MAKO_CONTENT,
+    MIGRATIONS_README_CONTENT,
     # API v1
     APP_API_V1_INIT_CONTENT,
     APP_API_V1_HERO_CONTENT,
     # Database init
-    APP_DATABASE_INIT_CONTENT_FOR_SQL,
+    APP_DATABASE_INIT_CONTENT,
     # Model init
     APP_MODELS_HERO_CONTENT,
     APP_MODELS_INIT_CONTENT,
     # Repository
-    APP_REPO_INIT_CONTENT_FOR_SQL,
-    APP_REPO_HERO_CONTENT_FOR_SQL,
+    APP_REPO_INIT_CONTENT,
+    APP_REPO_HERO_CONTENT,
     # Services
     APP_SERVICE_INIT_CONTENT,
     APP_SERVICE_HERO_CONTENT,
@@ -73,4 +93,68 @@ __all__ = [
     # Schemas
     APP_SCHEMA_COMMON_CONTENT,
     APP_SCHEMA_HERO_CONTENT,
+    # Tests
+    TESTS_BENCH_RESPONSE_HELPER_CONTENT,
+    # Resources added by `hut add resource`
+    RESOURCE_MODEL_CONTENT,
+    RESOURCE_SCHEMA_CONTENT,
+    RESOURCE_REPOSITORY_CONTENT,
+    RESOURCE_SERVICE_CONTENT,
+    RESOURCE_API_V1_CONTENT,
 ]
+
+# template id -> source, packed into setups/templates.bundle
+TEMPLATE_SOURCES: dict[str, str] = {
+    # Main
+    "app/main.py": APP_MAIN_CONTENT,
+    # API
+    "app/api/__init__.py": APP_API_INIT_CONTENT,
+    "app/api/common.py": APP_API_COMMON_CONTENT,
+    "app/api/v1/__init__.py": APP_API_V1_INIT_CONTENT,
+    "app/api/v1/hero.py": APP_API_V1_HERO_CONTENT,
+    # Core
+    "app/core/__init__.py": APP_CORE_INIT_CONTENT,
+    "app/core/config.py": APP_CORE_CONFIG_CONTENT,
+    "app/core/errors.py": APP_CORE_ERRORS_CONTENT,
+    "app/core/exceptions.py": APP_CORE_EXCEPTIONS_CONTENT,
+    "app/core/lifespan.py": APP_CORE_LIFESPAN_CONTENT,
+    "app/core/responses.py": APP_CORE_API_RESPONSES_CONTENT,
+    "app/core/response_helper.py": APP_CORE_API_RESPONSE_HELPER_CONTENT,
+    "app/core/pagination.py": APP_CORE_PAGINATION_CONTENT,
+    # Database
+    "app/database/__init__.py": APP_DATABASE_INIT_CONTENT,
+    "app/database/session.py": APP_DATABASE_SESSION_CONTENT,
+    "app/database/replicas.py": APP_DATABASE_REPLICAS_CONTENT,
+    # Models
+    "app/models/__init__.py": APP_MODELS_INIT_CONTENT,
+    "app/models/hero.py": APP_MODELS_HERO_CONTENT,
+    "app/models/common.py": APP_MODELS_COMMON_CONTENT,
+    # Repositories
+    "app/repositories/__init__.py": APP_REPO_INIT_CONTENT,
+    "app/repositories/hero.py": APP_REPO_HERO_CONTENT,
+    # Services
+    "app/services/__init__.py": APP_SERVICE_INIT_CONTENT,
+    "app/services/hero.py": APP_SERVICE_HERO_CONTENT,
+    # Schemas
+    "app/schemas/hero.py": APP_SCHEMA_HERO_CONTENT,
+    "app/schemas/common.py": APP_SCHEMA_COMMON_CONTENT,
+    # Templates
+    "app/templates/index.html": APP_TEMPLATES_INDEX_CONTENT,
+    # Tests
+    "tests/bench_response_helper.py": TESTS_BENCH_RESPONSE_HELPER_CONTENT,
+    # Configuration
+    ".env": ENV_FILE_CONTENT,
+    ".gitignore": GIT_IGNORE_FILE_CONTENT,
+    "run.py": RUN_FILE_CONTENT,
+    # Migrations, the same tree `alembic init -t async migrations` creates
+    "alembic.ini": ALEMBIC_INI_CONTENT,
+    "migrations/README": MIGRATIONS_README_CONTENT,
+    "migrations/env.py": MIGRATIONS_ENV_FILE_CONTENT,
+    "migrations/script.py.mako": MIGRATIONS_SCRIPT_MAKO_CONTENT,
+    # Resources added by `hut add resource`, rendered with a ResourceContext
+    "resource/model.py": RESOURCE_MODEL_CONTENT,
+    "resource/schema.py": RESOURCE_SCHEMA_CONTENT,
+    "resource/repository.py": RESOURCE_REPOSITORY_CONTENT,
+    "resource/service.py": RESOURCE_SERVICE_CONTENT,
+    "resource/api_v1.py": RESOURCE_API_V1_CONTENT,
+}
@@ -0,0 +1,29 @@
+"""
+Pack the template sources into the template bundle.
+
+    python -m builders_hut.setups.file_contents            # rebuild
+    python -m builders_hut.setups.file_contents --check    # exits 1 if stale
+"""
+
+import sys
+
+from builders_hut.setups.bundle import BUNDLE_PATH, pack, sources_digest
+from builders_hut.setups.file_contents import TEMPLATE_SOURCES
+
+
+def main(argv: list[str]) -> int:
+    packed = pack(TEMPLATE_SOURCES, sources_digest())
+    if "--check" in argv:
+        current = BUNDLE_PATH.read_bytes() if BUNDLE_PATH.exists() else b""
+        if current != packed:
+            print(f"{BUNDLE_PATH} is out of date, rebuild it")
+            return 1
+        return 0
+
+    BUNDLE_PATH.write_bytes(packed)
+    print(f"wrote {len(TEMPLATE_SOURCES)} templates to {BUNDLE_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
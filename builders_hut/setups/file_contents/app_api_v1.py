@@ -17,11 +17,29 @@ __all__ = ["router"]
 
 
 APP_API_V1_HERO_CONTENT = dedent("""
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, status
 from uuid import UUID as uuid
 from app.core import success_response
+from app.core.pagination import DEFAULT_LIMIT, MAX_LIMIT
 from app.services import HeroServiceDeps
-from app.schemas.hero import CreateHeroSchema, HeroResponse, UpdateHeroSchema
+{% if schema_backend == "msgspec" %}
+from app.schemas.common import struct_openapi
+from app.schemas.hero import (
+    CreateHeroBody,
+    CreateHeroSchema,
+    HeroListResponse,
+    HeroResponse,
+    UpdateHeroBody,
+    UpdateHeroSchema,
+)
+{% else %}
+from app.schemas.hero import (
+    CreateHeroSchema,
+    HeroListResponse,
+    HeroResponse,
+    UpdateHeroSchema,
+)
+{% endif %}
 from app.core.responses import (
     SUCCESS_201_RESPONSE,
     CONFLICT_RESPONSES,
@@ -40,7 +58,15 @@ route = APIRouter(prefix="/heroes", tags=["Heroes"])
     summary="Create A Hero",
     description="Create a new hero with the given name.",
     status_code=status.HTTP_201_CREATED,
+    {% if schema_backend == "msgspec" %}
+    openapi_extra=struct_openapi(
+        body=CreateHeroSchema,
+        response=HeroResponse,
+        status_code=status.HTTP_201_CREATED,
+    ),
+    {% else %}
     response_model=HeroResponse,
+    {% endif %}
     responses={
         **SUCCESS_201_RESPONSE,
         **CONFLICT_RESPONSES,
@@ -48,7 +74,11 @@ route = APIRouter(prefix="/heroes", tags=["Heroes"])
         **SERVER_ERROR_RESPONSES,
     },
 )
+{% if schema_backend == "msgspec" %}
+async def create_hero(payload: CreateHeroBody, service: HeroServiceDeps):
+{% else %}
 async def create_hero(payload: CreateHeroSchema, service: HeroServiceDeps):
+{% endif %}
     hero = await service.create_hero(name=payload.name)
     return success_response(
         message="Hero created successfully",
@@ -57,12 +87,48 @@ async def create_hero(payload: CreateHeroSchema, service: HeroServiceDeps):
     )
 
 
+@route.get(
+    "/",
+    summary="List Heroes",
+    description=(
+        "List heroes, oldest first, a page at a time. Pass the next_cursor "
+        "of a page as the cursor of the request for the page after it."
+    ),
+    status_code=status.HTTP_200_OK,
+    {% if schema_backend == "msgspec" %}
+    openapi_extra=struct_openapi(response=HeroListResponse),
+    {% else %}
+    response_model=HeroListResponse,
+    {% endif %}
+    responses={
+        **SUCCESS_200_RESPONSE,
+        **VALIDATION_ERROR_RESPONSES,
+        **SERVER_ERROR_RESPONSES,
+    },
+)
+async def list_heroes(
+    service: HeroServiceDeps,
+    cursor: str | None = Query(None, description="The next_cursor of the previous page."),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Heroes per page."),
+):
+    page = await service.list_heroes(cursor=cursor, limit=limit)
+    return success_response(
+        message="Heroes retrieved successfully",
+        data=page,
+        status_code=status.HTTP_200_OK,
+    )
+
+
 @route.get(
     "/{hero_id}",
     summary="Get A Hero Details",
     description="Get a Hero By ID.",
     status_code=status.HTTP_200_OK,
+    {% if schema_backend == "msgspec" %}
+    openapi_extra=struct_openapi(response=HeroResponse),
+    {% else %}
     response_model=HeroResponse,
+    {% endif %}
     responses={
         **SUCCESS_200_RESPONSE,
         **VALIDATION_ERROR_RESPONSES,
@@ -84,7 +150,11 @@ async def get_hero(hero_id: uuid, service: HeroServiceDeps):
     summary="Update A Hero Details",
     description="Update hero name by hero ID",
     status_code=status.HTTP_200_OK,
+    {% if schema_backend == "msgspec" %}
+    openapi_extra=struct_openapi(body=UpdateHeroSchema, response=HeroResponse),
+    {% else %}
     response_model=HeroResponse,
+    {% endif %}
     responses={
         **SUCCESS_200_RESPONSE,
         **VALIDATION_ERROR_RESPONSES,
@@ -93,7 +163,11 @@ async def get_hero(hero_id: uuid, service: HeroServiceDeps):
         **SERVER_ERROR_RESPONSES,
     },
 )
+{% if schema_backend == "msgspec" %}
+async def update_hero(payload: UpdateHeroBody, service: HeroServiceDeps):
+{% else %}
 async def update_hero(payload: UpdateHeroSchema, service: HeroServiceDeps):
+{% endif %}
     hero = await service.update_hero(hero_id=payload.id, name=payload.name)
     return success_response(
         message="Hero updated successfully",
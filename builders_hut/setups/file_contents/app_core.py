@@ -15,11 +15,27 @@ __all__ = ["settings", "lifespan", "success_response", "error_response"]
 APP_CORE_CONFIG_CONTENT = dedent("""
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
+{% if database_type == "sql" %}
+from pydantic import Field, model_validator
+from functools import lru_cache
+from typing import Any, Literal
+{% else %}
 from pydantic import Field
 from functools import lru_cache
 from typing import Literal
+{% endif %}
 
 load_dotenv()
+{% if database_type == "sql" %}
+
+# connection pool defaults per DB_TYPE: size, max overflow, timeout, recycle
+POOL_DEFAULTS = {
+{% for provider, pool in db_pools %}
+    "{{ provider }}": ({{ pool.size }}, {{ pool.max_overflow }}, {{ pool.timeout }}, {{ pool.recycle }}),
+{% endfor %}
+}
+POOL_SETTINGS = ("DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_POOL_TIMEOUT", "DB_POOL_RECYCLE")
+{% endif %}
 
 
 class Settings(BaseSettings):
@@ -68,13 +84,87 @@ class Settings(BaseSettings):
     DB_NAME: str = Field(..., description="Database Name", validation_alias="DB_NAME")
 
     DB_TYPE: Literal["postgres", "mysql", "sqlite", "mongodb"] = Field(
-        "postgres", description="Which database to use for the project", validation_alias="DB_TYPE"
+        "{{ database_provider }}", description="Which database to use for the project", validation_alias="DB_TYPE"
+    )
+{% if database_type == "sql" %}
+
+    DB_POOL_SIZE: int = Field(
+        {{ db_pool_size }},
+        ge=0,
+        description="Connections kept open in the pool of each worker, 0 for no limit",
+        validation_alias="DB_POOL_SIZE",
+    )
+
+    DB_MAX_OVERFLOW: int = Field(
+        {{ db_max_overflow }},
+        ge=-1,
+        description="Connections opened past the pool size under load, -1 for no limit",
+        validation_alias="DB_MAX_OVERFLOW",
+    )
+
+    DB_POOL_TIMEOUT: float = Field(
+        {{ db_pool_timeout }},
+        gt=0,
+        description="Seconds to wait for a free connection before giving up",
+        validation_alias="DB_POOL_TIMEOUT",
+    )
+
+    DB_POOL_RECYCLE: int = Field(
+        {{ db_pool_recycle }},
+        ge=-1,
+        description="Seconds before a connection is replaced, -1 for never",
+        validation_alias="DB_POOL_RECYCLE",
+    )
+
+    DB_READ_REPLICAS: str = Field(
+        "",
+        description="Comma separated SQLAlchemy URLs of the read replicas, "
+        "reads go to the primary without any",
+        validation_alias="DB_READ_REPLICAS",
+    )
+
+    DB_REPLICA_STRATEGY: Literal["round_robin", "least_busy"] = Field(
+        "round_robin",
+        description="How a replica is picked for a read",
+        validation_alias="DB_REPLICA_STRATEGY",
+    )
+
+    DB_REPLICA_RETRY_AFTER: float = Field(
+        30,
+        gt=0,
+        description="Seconds an unreachable replica is skipped for",
+        validation_alias="DB_REPLICA_RETRY_AFTER",
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def pool_defaults_of_db_type(cls, data: Any) -> Any:
+        '''
+        Pool settings missing from the environment take the defaults of
+        DB_TYPE, the field defaults above are those of {{ database_provider }}
+        '''
+        if isinstance(data, dict):
+            db_type = data.get("DB_TYPE", "{{ database_provider }}")
+            for name, value in zip(POOL_SETTINGS, POOL_DEFAULTS.get(db_type, ())):
+                data.setdefault(name, value)
+        return data
+{% endif %}
+
     @property
     def db_url(self) -> str:
         if self.DB_TYPE == "postgres":
             return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASS}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        if self.DB_TYPE == "mysql":
+            return f"mysql+aiomysql://{self.DB_USER}:{self.DB_PASS}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        if self.DB_TYPE == "sqlite":
+            # DB_NAME is the path of the database file
+            return f"sqlite+aiosqlite:///{self.DB_NAME}"
+{% if database_type == "sql" %}
+
+    @property
+    def db_replica_urls(self) -> list[str]:
+        return [url.strip() for url in self.DB_READ_REPLICAS.split(",") if url.strip()]
+{% endif %}
 
 
 @lru_cache(maxsize=1)
@@ -91,21 +181,106 @@ settings = get_settings()
 APP_CORE_LIFESPAN_CONTENT = dedent("""
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
-from app.database.session import engine
+from app.database.session import engine, replicas
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     yield
     await engine.dispose()
+    await replicas.dispose()
 """)
 
 APP_CORE_API_RESPONSE_HELPER_CONTENT = dedent(
     """
+'''
+JSON responses of the API.
+
+The envelope is built as a plain dict and serialized in one pass, with
+orjson when it is installed and the standard library json otherwise.
+UUIDs, datetimes, enums and Pydantic models can be returned as they are,
+the encoder formats them.
+'''
+
+import json
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
 from fastapi import status
 from fastapi.responses import JSONResponse
-from typing import Any
-from app.schemas.common import APIResponse
+from pydantic import BaseModel
+{% if schema_backend == "msgspec" %}
+import msgspec
+{% endif %}
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ENCODER = "orjson" if orjson else "json"
+
+
+def _default(obj: Any) -> Any:
+    '''
+    The types the encoder does not serialize itself
+    '''
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    {% if schema_backend == "msgspec" %}
+    if isinstance(obj, msgspec.Struct):
+        # the fields stay native, the encoder formats them
+        return msgspec.structs.asdict(obj)
+    {% endif %}
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+
+    if orjson is None:
+        # what orjson does natively, naive datetimes are UTC
+        if isinstance(obj, datetime):
+            if obj.tzinfo is None:
+                obj = obj.replace(tzinfo=timezone.utc)
+            return obj.isoformat().replace("+00:00", "Z")
+        if isinstance(obj, (date, time)):
+            return obj.isoformat()
+        if isinstance(obj, UUID):
+            return str(obj)
+        if isinstance(obj, Enum):
+            return obj.value
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def dumps(content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+else:
+
+    def dumps(content: Any) -> bytes:
+        return json.dumps(
+            content,
+            default=_default,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    '''
+    JSONResponse serialized with dumps()
+    '''
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
 
 
 def api_response(
@@ -117,18 +292,18 @@ def api_response(
     error_code: str | None = None,
     stack_trace: str | None = None,
 ) -> JSONResponse:
-    payload = APIResponse(
-        success=success,
-        message=message,
-        data=data,
-        error_code=error_code,
-        stack_trace=stack_trace,
-    )
+    # the fields of APIResponse in its order, None values left out
+    payload: dict[str, Any] = {"success": success}
+    if message is not None:
+        payload["message"] = message
+    if data is not None:
+        payload["data"] = data
+    if error_code is not None:
+        payload["error_code"] = error_code
+    if stack_trace is not None:
+        payload["stack_trace"] = stack_trace
 
-    return JSONResponse(
-        status_code=status_code,
-        content=payload.model_dump(exclude_none=True),
-    )
+    return FastJSONResponse(status_code=status_code, content=payload)
 
 
 def success_response(
@@ -162,6 +337,48 @@ def error_response(
 """
 )
 
+APP_CORE_PAGINATION_CONTENT = dedent(
+    """
+'''
+Opaque cursors of keyset pagination.
+
+A page is ordered by (created_at, id) and the next one starts after the
+key of its last row, so the database seeks to it through the index
+instead of counting past every earlier row. Clients get the key as an
+opaque url-safe string and hand it back as it is.
+'''
+
+import base64
+from datetime import datetime
+from uuid import UUID
+
+from .errors import ValidationError
+
+# default and largest page sizes
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    '''
+    The (created_at, id) key of a cursor
+    '''
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = raw.decode("utf-8").split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except ValueError as e:
+        raise ValidationError(
+            "Invalid cursor", data={"field": "cursor"}, capture_trace=False
+        ) from e
+"""
+)
+
 APP_CORE_ERRORS_CONTENT = dedent('''
 from typing import Any, Optional
 from fastapi import status
@@ -362,51 +579,62 @@ def register_exception_handlers(app: FastAPI):
 APP_CORE_API_RESPONSES_CONTENT = dedent(
     """
 from fastapi import status
+{% if schema_backend == "msgspec" %}
+from app.schemas.common import SuccessResponseSchema, ErrorResponseSchema, struct_content
+
+# FastAPI documents Pydantic models only, Structs go in as their schema
+ERROR_BODY = {"content": struct_content(ErrorResponseSchema)}
+SUCCESS_BODY = {"content": struct_content(SuccessResponseSchema)}
+{% else %}
 from app.schemas.common import SuccessResponseSchema, ErrorResponseSchema
 
+ERROR_BODY = {"model": ErrorResponseSchema}
+SUCCESS_BODY = {"model": SuccessResponseSchema}
+{% endif %}
+
 
 # -------- Error responses --------
 
 VALIDATION_ERROR_RESPONSES = {
     status.HTTP_400_BAD_REQUEST: {
         "description": "Domain validation error",
-        "model": ErrorResponseSchema,
+        **ERROR_BODY,
     },
     status.HTTP_422_UNPROCESSABLE_ENTITY: {
         "description": "Request validation error",
-        "model": ErrorResponseSchema,
+        **ERROR_BODY,
     },
 }
 
 AUTH_ERROR_RESPONSES = {
     status.HTTP_401_UNAUTHORIZED: {
         "description": "Authentication required or failed",
-        "model": ErrorResponseSchema,
+        **ERROR_BODY,
     },
     status.HTTP_403_FORBIDDEN: {
         "description": "Permission denied",
-        "model": ErrorResponseSchema,
+        **ERROR_BODY,
     },
 }
 
 NOT_FOUND_RESPONSES = {
     status.HTTP_404_NOT_FOUND: {
         "description": "Resource not found",
-        "model": ErrorResponseSchema,
+        **ERROR_BODY,
     },
 }
 
 CONFLICT_RESPONSES = {
     status.HTTP_409_CONFLICT: {
         "description": "Resource already exists",
-        "model": ErrorResponseSchema,
+        **ERROR_BODY,
     },
 }
 
 SERVER_ERROR_RESPONSES = {
     status.HTTP_500_INTERNAL_SERVER_ERROR: {
         "description": "Internal server error",
-        "model": ErrorResponseSchema,
+        **ERROR_BODY,
     },
 }
 
@@ -416,21 +644,21 @@ SERVER_ERROR_RESPONSES = {
 SUCCESS_200_RESPONSE = {
     status.HTTP_200_OK: {
         "description": "Successful operation",
-        "model": SuccessResponseSchema,
+        **SUCCESS_BODY,
     }
 }
 
 SUCCESS_201_RESPONSE = {
     status.HTTP_201_CREATED: {
         "description": "Resource created successfully",
-        "model": SuccessResponseSchema,
+        **SUCCESS_BODY,
     }
 }
 
 SUCCESS_202_RESPONSE = {
     status.HTTP_202_ACCEPTED: {
         "description": "Request accepted",
-        "model": SuccessResponseSchema,
+        **SUCCESS_BODY,
     }
 }
 
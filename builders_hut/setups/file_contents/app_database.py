@@ -2,13 +2,13 @@
 
 from textwrap import dedent
 
-APP_DATABASE_INIT_CONTENT_FOR_SQL = dedent("""
-from .session import SessionDeps
+APP_DATABASE_INIT_CONTENT = dedent("""
+from .session import ReadSessionDeps, SessionDeps
 
-__all__ = ["SessionDeps"]
+__all__ = ["ReadSessionDeps", "SessionDeps"]
 """)
 
-APP_DATABASE_SESSION_CONTENT_FOR_SQL = dedent('''
+APP_DATABASE_SESSION_CONTENT = dedent('''
 """
 Database Connections Management
 """
@@ -24,14 +24,30 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.core import settings
+from app.database.replicas import ReplicaSet
+
+
+def new_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        pool_pre_ping=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
 
 
 """ database engine """
-engine: AsyncEngine = create_async_engine(
-    settings.db_url,
-    echo=False,
-    future=True,
-    pool_pre_ping=True,
+engine: AsyncEngine = new_engine(settings.db_url)
+
+""" read replicas, none without DB_READ_REPLICAS """
+replicas = ReplicaSet(
+    [new_engine(url) for url in settings.db_replica_urls],
+    strategy=settings.DB_REPLICA_STRATEGY,
+    retry_after=settings.DB_REPLICA_RETRY_AFTER,
 )
 
 """ databse session """
@@ -50,4 +66,111 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 
 """ session dependency to use when needed """
 SessionDeps = Annotated[AsyncSession, Depends(get_session)]
+
+
+async def get_read_session(session: SessionDeps) -> AsyncGenerator[AsyncSession, None]:
+    """
+    a replica session for reads, the primary one of the request when no
+    replica is configured or healthy
+
+    replicas lag behind the primary, read what the request wrote from
+    the primary session
+    """
+    async with replicas.session(fallback=session) as read_session:
+        yield read_session
+
+
+""" read-only session dependency, on a replica when there is one """
+ReadSessionDeps = Annotated[AsyncSession, Depends(get_read_session)]
+''')
+
+APP_DATABASE_REPLICAS_CONTENT = dedent('''
+"""
+Read replica routing
+
+ReplicaSet.session() opens a session on a replica picked by the
+strategy, round_robin takes turns and least_busy takes the replica with
+the fewest open sessions. A replica that cannot be connected to is
+skipped for retry_after seconds and the next one is tried, the fallback
+session of the primary is used when none is left.
+"""
+
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Literal
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+
+class Replica:
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.sessionmaker = async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        # sessions open on the replica, a worker runs one event loop so
+        # the counters need no lock
+        self.in_use = 0
+        # time.monotonic() before which the replica is skipped
+        self.down_until = 0.0
+
+
+class ReplicaSet:
+    def __init__(
+        self,
+        engines: list[AsyncEngine],
+        strategy: Literal["round_robin", "least_busy"] = "round_robin",
+        retry_after: float = 30.0,
+    ):
+        self.replicas = [Replica(engine) for engine in engines]
+        self.strategy = strategy
+        self.retry_after = retry_after
+        self._turns = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    def candidates(self) -> list[Replica]:
+        """the healthy replicas, in the order to try them"""
+        now = time.monotonic()
+        healthy = [replica for replica in self.replicas if replica.down_until <= now]
+        if not healthy:
+            return []
+
+        start = next(self._turns) % len(healthy)
+        candidates = healthy[start:] + healthy[:start]
+        if self.strategy == "least_busy":
+            # a stable sort, replicas as busy as each other take turns
+            candidates.sort(key=lambda replica: replica.in_use)
+        return candidates
+
+    @asynccontextmanager
+    async def session(self, fallback: AsyncSession) -> AsyncIterator[AsyncSession]:
+        for replica in self.candidates():
+            session = replica.sessionmaker()
+            try:
+                # checks out a connection, pool_pre_ping replaces a stale one
+                await session.connection()
+            except (DBAPIError, OSError):
+                await session.close()
+                replica.down_until = time.monotonic() + self.retry_after
+                continue
+
+            replica.in_use += 1
+            try:
+                yield session
+            finally:
+                replica.in_use -= 1
+                await session.close()
+            return
+
+        yield fallback
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
 ''')
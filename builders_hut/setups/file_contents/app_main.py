@@ -7,6 +7,9 @@ from fastapi import FastAPI
 from app.core import settings, lifespan
 from app.api import common_router, v1_router
 from app.core.exceptions import register_exception_handlers
+{% if schema_backend == "msgspec" %}
+from app.schemas.common import add_struct_schemas
+{% endif %}
 
 
 def create_app() -> FastAPI:
@@ -24,6 +27,9 @@ def create_app() -> FastAPI:
 
     app.include_router(common_router)
     app.include_router(v1_router)
+    {% if schema_backend == "msgspec" %}
+    add_struct_schemas(app)
+    {% endif %}
 
     register_exception_handlers(app)
 
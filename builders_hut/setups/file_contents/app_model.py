@@ -13,25 +13,30 @@ __all__ = ["Hero"]
 APP_MODELS_HERO_CONTENT = dedent(
     """
 from .common import BaseModel
+from sqlalchemy import Index
 from sqlmodel import Field
 
 
 class Hero(BaseModel, table=True):
+    # keyset pagination walks (created_at, id) in this index
+    __table_args__ = (Index("ix_hero_created_at_id", "created_at", "id"),)
+
     name: str = Field(index=True, default="", description="The name of the hero", unique=True)
 
     def to_dict(self) -> dict:
+        # the response encoder formats the UUID and the datetimes
         return {
-            "id": str(self.id),
+            "id": self.id,
             "name": self.name,
-            "created_at": self.created_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-            "updated_at": self.updated_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 """
 )
 
 APP_MODELS_COMMON_CONTENT = dedent("""
 from sqlmodel import Field, SQLModel
-from sqlalchemy import Column, DateTime
+from sqlalchemy import DateTime
 from datetime import datetime, timezone
 import uuid
 
@@ -39,19 +44,16 @@ import uuid
 class BaseModel(SQLModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
+    # sa_type rather than sa_column, a Column object can belong to one table only
     created_at: datetime = Field(
-        sa_column=Column(
-            DateTime(timezone=True),
-            nullable=False,
-        ),
+        sa_type=DateTime(timezone=True),
+        nullable=False,
         default_factory=lambda: datetime.now(timezone.utc),
     )
 
     updated_at: datetime = Field(
-        sa_column=Column(
-            DateTime(timezone=True),
-            nullable=False,
-        ),
+        sa_type=DateTime(timezone=True),
+        nullable=False,
         default_factory=lambda: datetime.now(timezone.utc),
     )
 """)
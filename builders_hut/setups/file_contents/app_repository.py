@@ -1,18 +1,20 @@
-"app/database/*"
+"app/repositories/*"
 
 from textwrap import dedent
 
-APP_REPO_INIT_CONTENT_FOR_SQL = dedent("""
+APP_REPO_INIT_CONTENT = dedent("""
 from .hero import HeroRepoDeps, HeroRepository
 
 __all__ = ["HeroRepoDeps", "HeroRepository"]
 """)
 
-APP_REPO_HERO_CONTENT_FOR_SQL = dedent("""
+APP_REPO_HERO_CONTENT = dedent("""
+from datetime import datetime
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.exc import IntegrityError as SAIntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,16 +23,18 @@ from app.core.errors import (
     DuplicateKeyError,
     NotFoundError,
 )
-from app.database import SessionDeps
+from app.database import ReadSessionDeps, SessionDeps
 from app.models import Hero
 
 
 class HeroRepository:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, read_session: AsyncSession | None = None):
         self.session = session
+        # read-only queries, on a replica when one is configured
+        self.read_session = read_session or session
 
-    async def get_hero_by_id(self, hero_id) -> Hero:
-        result = await self.session.execute(select(Hero).where(Hero.id == hero_id))
+    async def _get_hero(self, session: AsyncSession, hero_id) -> Hero:
+        result = await session.execute(select(Hero).where(Hero.id == hero_id))
         hero = result.scalar_one_or_none()
 
         if not hero:
@@ -38,6 +42,25 @@ class HeroRepository:
 
         return hero
 
+    async def get_hero_by_id(self, hero_id) -> Hero:
+        return await self._get_hero(self.read_session, hero_id)
+
+    async def list_heroes(
+        self, after: tuple[datetime, UUID] | None = None, limit: int = 20
+    ) -> list[Hero]:
+        '''
+        Heroes in (created_at, id) order, the first `limit` after the key.
+
+        The key comparison seeks into ix_hero_created_at_id, so a deep page
+        reads as few rows as the first one.
+        '''
+        query = select(Hero).order_by(Hero.created_at, Hero.id).limit(limit)
+        if after is not None:
+            query = query.where(tuple_(Hero.created_at, Hero.id) > tuple_(*after))
+
+        result = await self.read_session.execute(query)
+        return list(result.scalars())
+
     async def create_hero(self, name: str) -> Hero:
         hero = Hero(name=name)
         self.session.add(hero)
@@ -56,7 +79,7 @@ class HeroRepository:
             raise DatabaseError("Failed to create hero") from e
 
     async def update_hero(self, hero_id, name: str | None = None) -> Hero:
-        hero = await self.get_hero_by_id(hero_id)
+        hero = await self._get_hero(self.session, hero_id)
 
         if name is not None:
             hero.name = name
@@ -75,7 +98,7 @@ class HeroRepository:
             raise DatabaseError("Failed to update hero") from e
 
     async def delete_hero(self, hero_id) -> Hero:
-        hero = await self.get_hero_by_id(hero_id)
+        hero = await self._get_hero(self.session, hero_id)
 
         try:
             await self.session.delete(hero)
@@ -89,8 +112,9 @@ class HeroRepository:
 
 def get_hero_repo(
     session: SessionDeps,
+    read_session: ReadSessionDeps,
 ):
-    return HeroRepository(session)
+    return HeroRepository(session, read_session)
 
 
 HeroRepoDeps = Annotated[HeroRepository, Depends(get_hero_repo)]
@@ -4,6 +4,126 @@ from textwrap import dedent
 
 APP_SCHEMA_COMMON_CONTENT = dedent(
     """
+{% if schema_backend == "msgspec" %}
+'''
+Response envelopes, and the glue that lets FastAPI use msgspec Structs.
+
+FastAPI validates bodies and documents schemas with Pydantic only, so:
+
+    payload: Annotated[CreateHeroSchema, struct_body(CreateHeroSchema)]
+        decodes and validates the JSON body with msgspec, errors are
+        raised as RequestValidationError like Pydantic ones
+    openapi_extra=struct_openapi(body=..., response=..., status_code=...)
+        documents the request and response Structs of a route
+    add_struct_schemas(app)
+        adds the schemas of every documented Struct to the OpenAPI
+        components, call it once the routers are included
+'''
+
+from typing import Any, Generic, TypeVar
+
+import msgspec
+from fastapi import Depends, FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+
+T = TypeVar("T")
+S = TypeVar("S", bound=msgspec.Struct)
+
+SCHEMA_REF = "#/components/schemas/{name}"
+
+# the schemas of every Struct documented so far, by name
+STRUCT_SCHEMAS: dict[str, dict] = {}
+
+
+class APIResponse(msgspec.Struct, Generic[T], kw_only=True, omit_defaults=True):
+    success: bool
+    message: str | None
+    data: T | None = None
+    error_code: str | None = None
+    stack_trace: str | None = None
+
+
+class SuccessResponseSchema(msgspec.Struct, Generic[T], kw_only=True):
+    success: bool = True
+    message: str
+    data: T | None = None
+
+
+class ErrorResponseSchema(msgspec.Struct, kw_only=True):
+    success: bool = False
+    message: str
+    data: Any | None = None
+    error_code: str | None = None
+
+
+def struct_body(struct_type: type[S]) -> Any:
+    '''
+    A dependency decoding the JSON request body into struct_type
+    '''
+    decoder = msgspec.json.Decoder(struct_type)
+
+    async def decode(request: Request) -> S:
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.ValidationError as e:
+            error_type = "value_error"
+            message = str(e)
+        except msgspec.DecodeError as e:
+            error_type = "json_invalid"
+            message = str(e)
+        raise RequestValidationError(
+            [{"type": error_type, "loc": ("body",), "msg": message, "input": None}]
+        )
+
+    return Depends(decode)
+
+
+def struct_schema(struct_type: type) -> dict:
+    '''
+    The OpenAPI schema of a Struct, a reference to its component
+    '''
+    (schema,), components = msgspec.json.schema_components(
+        [struct_type], ref_template=SCHEMA_REF
+    )
+    STRUCT_SCHEMAS.update(components)
+    return schema
+
+
+def struct_content(struct_type: type) -> dict:
+    return {"application/json": {"schema": struct_schema(struct_type)}}
+
+
+def struct_openapi(
+    body: type | None = None,
+    response: type | None = None,
+    status_code: int = 200,
+) -> dict:
+    '''
+    The openapi_extra of a route taking and returning Structs
+    '''
+    extra: dict[str, Any] = {}
+    if body is not None:
+        extra["requestBody"] = {"required": True, "content": struct_content(body)}
+    if response is not None:
+        extra["responses"] = {str(status_code): {"content": struct_content(response)}}
+    return extra
+
+
+def add_struct_schemas(app: FastAPI) -> None:
+    '''
+    Add the documented Structs to the OpenAPI schema of the app
+    '''
+    openapi = app.openapi
+
+    def openapi_with_structs() -> dict[str, Any]:
+        if app.openapi_schema is None:
+            schema = openapi()
+            components = schema.setdefault("components", {})
+            components.setdefault("schemas", {}).update(STRUCT_SCHEMAS)
+        return app.openapi_schema
+
+    app.openapi = openapi_with_structs
+{% else %}
 from typing import Generic, TypeVar, Optional, Any
 from pydantic import BaseModel
 
@@ -29,11 +149,73 @@ class ErrorResponseSchema(BaseModel):
     message: str
     data: Optional[Any] = None
     error_code: Optional[str] = None
+{% endif %}
 """
 )
 
 APP_SCHEMA_HERO_CONTENT = dedent(
     """
+{% if schema_backend == "msgspec" %}
+from typing import Annotated
+from uuid import UUID
+from datetime import datetime
+
+from msgspec import Meta, Struct
+
+from app.schemas.common import SuccessResponseSchema, struct_body
+
+
+# ---------- REQUEST SCHEMAS ----------
+
+
+class CreateHeroSchema(Struct):
+    name: Annotated[
+        str, Meta(min_length=1, max_length=100, description="The name of the hero.")
+    ]
+
+
+class UpdateHeroSchema(Struct):
+    id: Annotated[UUID, Meta(description="The unique identifier of the hero.")]
+    name: (
+        Annotated[
+            str,
+            Meta(min_length=1, max_length=100, description="The new name of the hero."),
+        ]
+        | None
+    ) = None
+
+
+CreateHeroBody = Annotated[CreateHeroSchema, struct_body(CreateHeroSchema)]
+UpdateHeroBody = Annotated[UpdateHeroSchema, struct_body(UpdateHeroSchema)]
+
+
+# ---------- RESPONSE SCHEMAS ----------
+class HeroSchema(Struct):
+    id: Annotated[UUID, Meta(description="The unique identifier of the hero.")]
+    name: Annotated[str, Meta(description="The name of the hero.")]
+    created_at: Annotated[
+        datetime, Meta(description="The creation timestamp of the hero.")
+    ]
+    updated_at: Annotated[
+        datetime, Meta(description="The last update timestamp of the hero.")
+    ]
+
+
+class HeroResponse(SuccessResponseSchema, kw_only=True):
+    data: HeroSchema
+
+
+class HeroPageSchema(Struct):
+    items: list[HeroSchema]
+    next_cursor: Annotated[
+        str | None,
+        Meta(description="The cursor of the next page, null on the last page."),
+    ]
+
+
+class HeroListResponse(SuccessResponseSchema, kw_only=True):
+    data: HeroPageSchema
+{% else %}
 from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
@@ -68,5 +250,17 @@ class HeroSchema(BaseModel):
 
 class HeroResponse(SuccessResponseSchema):
     data: HeroSchema
+
+
+class HeroPageSchema(BaseModel):
+    items: list[HeroSchema]
+    next_cursor: str | None = Field(
+        ..., description="The cursor of the next page, null on the last page."
+    )
+
+
+class HeroListResponse(SuccessResponseSchema):
+    data: HeroPageSchema
+{% endif %}
 """
 )
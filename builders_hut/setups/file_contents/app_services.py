@@ -17,6 +17,7 @@ from typing import Annotated
 from fastapi import Depends
 
 from app.core.errors import ValidationError
+from app.core.pagination import DEFAULT_LIMIT, decode_cursor, encode_cursor
 from app.repositories import HeroRepoDeps, HeroRepository
 
 
@@ -28,6 +29,21 @@ class HeroService:
         hero = await self.repo.get_hero_by_id(hero_id)
         return hero.to_dict()
 
+    async def list_heroes(self, cursor: str | None = None, limit: int = DEFAULT_LIMIT):
+        after = decode_cursor(cursor) if cursor else None
+        # one row more than the page tells whether another page follows
+        heroes = await self.repo.list_heroes(after=after, limit=limit + 1)
+        page = heroes[:limit]
+
+        next_cursor = None
+        if len(heroes) > limit:
+            next_cursor = encode_cursor(page[-1].created_at, page[-1].id)
+
+        return {
+            "items": [hero.to_dict() for hero in page],
+            "next_cursor": next_cursor,
+        }
+
     async def create_hero(self, name: str):
         if not name or not name.strip():
             raise ValidationError(
@@ -0,0 +1,511 @@
+"""Files of a resource added by `hut add resource`, modeled on the Hero files"""
+
+from textwrap import dedent
+
+RESOURCE_MODEL_CONTENT = dedent(
+    """
+from .common import BaseModel
+from sqlalchemy import Index
+from sqlmodel import Field
+
+
+class {{ class_name }}(BaseModel, table=True):
+    # keyset pagination walks (created_at, id) in this index
+    __table_args__ = (
+        Index("ix_{{ class_name.lower() }}_created_at_id", "created_at", "id"),
+    )
+
+    name: str = Field(index=True, default="", description="The name of the {{ label }}", unique=True)
+
+    def to_dict(self) -> dict:
+        # the response encoder formats the UUID and the datetimes
+        return {
+            "id": self.id,
+            "name": self.name,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+"""
+)
+
+RESOURCE_SCHEMA_CONTENT = dedent(
+    """
+{% if schema_backend == "msgspec" %}
+from typing import Annotated
+from uuid import UUID
+from datetime import datetime
+
+from msgspec import Meta, Struct
+
+from app.schemas.common import SuccessResponseSchema, struct_body
+
+
+# ---------- REQUEST SCHEMAS ----------
+
+
+class Create{{ class_name }}Schema(Struct):
+    name: Annotated[
+        str, Meta(min_length=1, max_length=100, description="The name of the {{ label }}.")
+    ]
+
+
+class Update{{ class_name }}Schema(Struct):
+    id: Annotated[UUID, Meta(description="The unique identifier of the {{ label }}.")]
+    name: (
+        Annotated[
+            str,
+            Meta(min_length=1, max_length=100, description="The new name of the {{ label }}."),
+        ]
+        | None
+    ) = None
+
+
+Create{{ class_name }}Body = Annotated[Create{{ class_name }}Schema, struct_body(Create{{ class_name }}Schema)]
+Update{{ class_name }}Body = Annotated[Update{{ class_name }}Schema, struct_body(Update{{ class_name }}Schema)]
+
+
+# ---------- RESPONSE SCHEMAS ----------
+class {{ class_name }}Schema(Struct):
+    id: Annotated[UUID, Meta(description="The unique identifier of the {{ label }}.")]
+    name: Annotated[str, Meta(description="The name of the {{ label }}.")]
+    created_at: Annotated[
+        datetime, Meta(description="The creation timestamp of the {{ label }}.")
+    ]
+    updated_at: Annotated[
+        datetime, Meta(description="The last update timestamp of the {{ label }}.")
+    ]
+
+
+class {{ class_name }}Response(SuccessResponseSchema, kw_only=True):
+    data: {{ class_name }}Schema
+
+
+class {{ class_name }}PageSchema(Struct):
+    items: list[{{ class_name }}Schema]
+    next_cursor: Annotated[
+        str | None,
+        Meta(description="The cursor of the next page, null on the last page."),
+    ]
+
+
+class {{ class_name }}ListResponse(SuccessResponseSchema, kw_only=True):
+    data: {{ class_name }}PageSchema
+{% else %}
+from pydantic import BaseModel, Field
+from uuid import UUID
+from datetime import datetime
+from app.schemas.common import SuccessResponseSchema
+
+
+# ---------- REQUEST SCHEMAS ----------
+
+
+class Create{{ class_name }}Schema(BaseModel):
+    name: str = Field(
+        ..., min_length=1, max_length=100, description="The name of the {{ label }}."
+    )
+
+
+class Update{{ class_name }}Schema(BaseModel):
+    id: UUID = Field(..., description="The unique identifier of the {{ label }}.")
+    name: str | None = Field(
+        None, min_length=1, max_length=100, description="The new name of the {{ label }}."
+    )
+
+
+# ---------- RESPONSE SCHEMAS ----------
+class {{ class_name }}Schema(BaseModel):
+    id: UUID = Field(..., description="The unique identifier of the {{ label }}.")
+    name: str = Field(..., description="The name of the {{ label }}.")
+    created_at: datetime = Field(..., description="The creation timestamp of the {{ label }}.")
+    updated_at: datetime = Field(
+        ..., description="The last update timestamp of the {{ label }}."
+    )
+
+
+class {{ class_name }}Response(SuccessResponseSchema):
+    data: {{ class_name }}Schema
+
+
+class {{ class_name }}PageSchema(BaseModel):
+    items: list[{{ class_name }}Schema]
+    next_cursor: str | None = Field(
+        ..., description="The cursor of the next page, null on the last page."
+    )
+
+
+class {{ class_name }}ListResponse(SuccessResponseSchema):
+    data: {{ class_name }}PageSchema
+{% endif %}
+"""
+)
+
+RESOURCE_REPOSITORY_CONTENT = dedent("""
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import select, tuple_
+from sqlalchemy.exc import IntegrityError as SAIntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.errors import (
+    DatabaseError,
+    DuplicateKeyError,
+    NotFoundError,
+)
+from app.database import ReadSessionDeps, SessionDeps
+from app.models import {{ class_name }}
+
+
+class {{ class_name }}Repository:
+    def __init__(self, session: AsyncSession, read_session: AsyncSession | None = None):
+        self.session = session
+        # read-only queries, on a replica when one is configured
+        self.read_session = read_session or session
+
+    async def _get_{{ module }}(self, session: AsyncSession, {{ module }}_id) -> {{ class_name }}:
+        result = await session.execute(
+            select({{ class_name }}).where({{ class_name }}.id == {{ module }}_id)
+        )
+        {{ module }} = result.scalar_one_or_none()
+
+        if not {{ module }}:
+            raise NotFoundError("{{ title }} not found")
+
+        return {{ module }}
+
+    async def get_{{ module }}_by_id(self, {{ module }}_id) -> {{ class_name }}:
+        return await self._get_{{ module }}(self.read_session, {{ module }}_id)
+
+    async def list_{{ plural_module }}(
+        self, after: tuple[datetime, UUID] | None = None, limit: int = 20
+    ) -> list[{{ class_name }}]:
+        '''
+        {{ plural_title }} in (created_at, id) order, the first `limit` after the key.
+
+        The key comparison seeks into ix_{{ class_name.lower() }}_created_at_id, so
+        a deep page reads as few rows as the first one.
+        '''
+        query = (
+            select({{ class_name }})
+            .order_by({{ class_name }}.created_at, {{ class_name }}.id)
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.where(
+                tuple_({{ class_name }}.created_at, {{ class_name }}.id) > tuple_(*after)
+            )
+
+        result = await self.read_session.execute(query)
+        return list(result.scalars())
+
+    async def create_{{ module }}(self, name: str) -> {{ class_name }}:
+        {{ module }} = {{ class_name }}(name=name)
+        self.session.add({{ module }})
+
+        try:
+            await self.session.commit()
+            await self.session.refresh({{ module }})
+            return {{ module }}
+
+        except SAIntegrityError as e:
+            await self.session.rollback()
+            raise DuplicateKeyError("{{ title }} with this name already exists") from e
+
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseError("Failed to create {{ label }}") from e
+
+    async def update_{{ module }}(self, {{ module }}_id, name: str | None = None) -> {{ class_name }}:
+        {{ module }} = await self._get_{{ module }}(self.session, {{ module }}_id)
+
+        if name is not None:
+            {{ module }}.name = name
+
+        try:
+            await self.session.commit()
+            await self.session.refresh({{ module }})
+            return {{ module }}
+
+        except SAIntegrityError as e:
+            await self.session.rollback()
+            raise DuplicateKeyError("{{ title }} with this name already exists") from e
+
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseError("Failed to update {{ label }}") from e
+
+    async def delete_{{ module }}(self, {{ module }}_id) -> {{ class_name }}:
+        {{ module }} = await self._get_{{ module }}(self.session, {{ module }}_id)
+
+        try:
+            await self.session.delete({{ module }})
+            await self.session.commit()
+            return {{ module }}
+
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseError("Failed to delete {{ label }}") from e
+
+
+def get_{{ module }}_repo(
+    session: SessionDeps,
+    read_session: ReadSessionDeps,
+):
+    return {{ class_name }}Repository(session, read_session)
+
+
+{{ class_name }}RepoDeps = Annotated[{{ class_name }}Repository, Depends(get_{{ module }}_repo)]
+""")
+
+RESOURCE_SERVICE_CONTENT = dedent(
+    """
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.core.errors import ValidationError
+from app.core.pagination import DEFAULT_LIMIT, decode_cursor, encode_cursor
+from app.repositories import {{ class_name }}RepoDeps, {{ class_name }}Repository
+
+
+class {{ class_name }}Service:
+    def __init__(self, repo: {{ class_name }}Repository):
+        self.repo = repo
+
+    async def get_{{ module }}(self, {{ module }}_id):
+        {{ module }} = await self.repo.get_{{ module }}_by_id({{ module }}_id)
+        return {{ module }}.to_dict()
+
+    async def list_{{ plural_module }}(self, cursor: str | None = None, limit: int = DEFAULT_LIMIT):
+        after = decode_cursor(cursor) if cursor else None
+        # one row more than the page tells whether another page follows
+        {{ plural_module }} = await self.repo.list_{{ plural_module }}(after=after, limit=limit + 1)
+        page = {{ plural_module }}[:limit]
+
+        next_cursor = None
+        if len({{ plural_module }}) > limit:
+            next_cursor = encode_cursor(page[-1].created_at, page[-1].id)
+
+        return {
+            "items": [{{ module }}.to_dict() for {{ module }} in page],
+            "next_cursor": next_cursor,
+        }
+
+    async def create_{{ module }}(self, name: str):
+        if not name or not name.strip():
+            raise ValidationError(
+                message="{{ title }} name cannot be empty",
+                data={"field": "name"},
+            )
+
+        {{ module }} = await self.repo.create_{{ module }}(name=name.strip())
+        return {{ module }}.to_dict()
+
+    async def update_{{ module }}(self, {{ module }}_id, name: str | None = None):
+        if name is not None and not name.strip():
+            raise ValidationError(
+                message="{{ title }} name cannot be empty",
+                data={"field": "name"},
+            )
+
+        {{ module }} = await self.repo.update_{{ module }}(
+            {{ module }}_id, name=name.strip() if name else None
+        )
+        return {{ module }}.to_dict()
+
+    async def delete_{{ module }}(self, {{ module }}_id):
+        return await self.repo.delete_{{ module }}({{ module }}_id)
+
+
+def get_{{ module }}_service(
+    repo: {{ class_name }}RepoDeps,
+):
+    return {{ class_name }}Service(repo)
+
+
+{{ class_name }}ServiceDeps = Annotated[{{ class_name }}Service, Depends(get_{{ module }}_service)]
+"""
+)
+
+RESOURCE_API_V1_CONTENT = dedent("""
+from fastapi import APIRouter, Query, status
+from uuid import UUID as uuid
+from app.core import success_response
+from app.core.pagination import DEFAULT_LIMIT, MAX_LIMIT
+from app.services import {{ class_name }}ServiceDeps
+{% if schema_backend == "msgspec" %}
+from app.schemas.common import struct_openapi
+from app.schemas.{{ module }} import (
+    Create{{ class_name }}Body,
+    Create{{ class_name }}Schema,
+    {{ class_name }}ListResponse,
+    {{ class_name }}Response,
+    Update{{ class_name }}Body,
+    Update{{ class_name }}Schema,
+)
+{% else %}
+from app.schemas.{{ module }} import (
+    Create{{ class_name }}Schema,
+    {{ class_name }}ListResponse,
+    {{ class_name }}Response,
+    Update{{ class_name }}Schema,
+)
+{% endif %}
+from app.core.responses import (
+    SUCCESS_201_RESPONSE,
+    CONFLICT_RESPONSES,
+    VALIDATION_ERROR_RESPONSES,
+    SERVER_ERROR_RESPONSES,
+    SUCCESS_200_RESPONSE,
+    NOT_FOUND_RESPONSES,
+    SUCCESS_204_RESPONSE,
+)
+
+route = APIRouter(prefix="/{{ path }}", tags=["{{ plural_title }}"])
+
+
+@route.post(
+    "/",
+    summary="Create A {{ title }}",
+    description="Create a new {{ label }} with the given name.",
+    status_code=status.HTTP_201_CREATED,
+    {% if schema_backend == "msgspec" %}
+    openapi_extra=struct_openapi(
+        body=Create{{ class_name }}Schema,
+        response={{ class_name }}Response,
+        status_code=status.HTTP_201_CREATED,
+    ),
+    {% else %}
+    response_model={{ class_name }}Response,
+    {% endif %}
+    responses={
+        **SUCCESS_201_RESPONSE,
+        **CONFLICT_RESPONSES,
+        **VALIDATION_ERROR_RESPONSES,
+        **SERVER_ERROR_RESPONSES,
+    },
+)
+{% if schema_backend == "msgspec" %}
+async def create_{{ module }}(payload: Create{{ class_name }}Body, service: {{ class_name }}ServiceDeps):
+{% else %}
+async def create_{{ module }}(payload: Create{{ class_name }}Schema, service: {{ class_name }}ServiceDeps):
+{% endif %}
+    {{ module }} = await service.create_{{ module }}(name=payload.name)
+    return success_response(
+        message="{{ title }} created successfully",
+        data={{ module }},
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@route.get(
+    "/",
+    summary="List {{ plural_title }}",
+    description=(
+        "List {{ plural_title.lower() }}, oldest first, a page at a time. Pass the "
+        "next_cursor of a page as the cursor of the request for the page after it."
+    ),
+    status_code=status.HTTP_200_OK,
+    {% if schema_backend == "msgspec" %}
+    openapi_extra=struct_openapi(response={{ class_name }}ListResponse),
+    {% else %}
+    response_model={{ class_name }}ListResponse,
+    {% endif %}
+    responses={
+        **SUCCESS_200_RESPONSE,
+        **VALIDATION_ERROR_RESPONSES,
+        **SERVER_ERROR_RESPONSES,
+    },
+)
+async def list_{{ plural_module }}(
+    service: {{ class_name }}ServiceDeps,
+    cursor: str | None = Query(None, description="The next_cursor of the previous page."),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="{{ plural_title }} per page."),
+):
+    page = await service.list_{{ plural_module }}(cursor=cursor, limit=limit)
+    return success_response(
+        message="{{ plural_title }} retrieved successfully",
+        data=page,
+        status_code=status.HTTP_200_OK,
+    )
+
+
+@route.get(
+    "/{{ path_param }}",
+    summary="Get A {{ title }} Details",
+    description="Get a {{ title }} By ID.",
+    status_code=status.HTTP_200_OK,
+    {% if schema_backend == "msgspec" %}
+    openapi_extra=struct_openapi(response={{ class_name }}Response),
+    {% else %}
+    response_model={{ class_name }}Response,
+    {% endif %}
+    responses={
+        **SUCCESS_200_RESPONSE,
+        **VALIDATION_ERROR_RESPONSES,
+        **NOT_FOUND_RESPONSES,
+        **SERVER_ERROR_RESPONSES,
+    },
+)
+async def get_{{ module }}({{ module }}_id: uuid, service: {{ class_name }}ServiceDeps):
+    {{ module }} = await service.get_{{ module }}({{ module }}_id)
+    return success_response(
+        message="{{ title }} retrieved successfully",
+        data={{ module }},
+        status_code=status.HTTP_200_OK,
+    )
+
+
+@route.put(
+    "/{{ path_param }}",
+    summary="Update A {{ title }} Details",
+    description="Update {{ label }} name by {{ label }} ID",
+    status_code=status.HTTP_200_OK,
+    {% if schema_backend == "msgspec" %}
+    openapi_extra=struct_openapi(
+        body=Update{{ class_name }}Schema, response={{ class_name }}Response
+    ),
+    {% else %}
+    response_model={{ class_name }}Response,
+    {% endif %}
+    responses={
+        **SUCCESS_200_RESPONSE,
+        **VALIDATION_ERROR_RESPONSES,
+        **NOT_FOUND_RESPONSES,
+        **CONFLICT_RESPONSES,
+        **SERVER_ERROR_RESPONSES,
+    },
+)
+{% if schema_backend == "msgspec" %}
+async def update_{{ module }}(payload: Update{{ class_name }}Body, service: {{ class_name }}ServiceDeps):
+{% else %}
+async def update_{{ module }}(payload: Update{{ class_name }}Schema, service: {{ class_name }}ServiceDeps):
+{% endif %}
+    {{ module }} = await service.update_{{ module }}({{ module }}_id=payload.id, name=payload.name)
+    return success_response(
+        message="{{ title }} updated successfully",
+        data={{ module }},
+        status_code=status.HTTP_200_OK,
+    )
+
+
+@route.delete(
+    "/{{ path_param }}",
+    summary="Delete A {{ title }}",
+    description="Delete {{ label }} by {{ label }} ID",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None,
+    responses={
+        **SUCCESS_204_RESPONSE,
+        **VALIDATION_ERROR_RESPONSES,
+        **NOT_FOUND_RESPONSES,
+        **SERVER_ERROR_RESPONSES,
+    },
+)
+async def delete_{{ module }}({{ module }}_id: uuid, service: {{ class_name }}ServiceDeps):
+    await service.delete_{{ module }}({{ module }}_id)
+    return
+""")
@@ -0,0 +1,94 @@
+"""tests/*"""
+
+from textwrap import dedent
+
+TESTS_BENCH_RESPONSE_HELPER_CONTENT = dedent(
+    """
+'''
+Micro-benchmark of the JSON responses of app/core/response_helper.py.
+
+Compares success_response() with the path it replaced: Hero.to_dict()
+formatting every field as a string, a Pydantic APIResponse dumped with
+model_dump(exclude_none=True), and JSONResponse serializing the result
+again with the standard library json.
+
+Run it from the project directory:
+
+    python -m tests.bench_response_helper
+'''
+
+import timeit
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.response_helper import ENCODER, success_response
+from app.models import Hero
+
+REPEATS = 5
+
+
+class LegacyAPIResponse(BaseModel):
+    success: bool
+    message: str | None
+    data: Any = None
+    error_code: str | None = None
+    stack_trace: str | None = None
+
+
+def legacy_to_dict(hero: Hero) -> dict:
+    return {
+        "id": str(hero.id),
+        "name": hero.name,
+        "created_at": hero.created_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        "updated_at": hero.updated_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+    }
+
+
+def legacy_success_response(message: str, data) -> JSONResponse:
+    payload = LegacyAPIResponse(success=True, message=message, data=data)
+    return JSONResponse(status_code=200, content=payload.model_dump(exclude_none=True))
+
+
+def per_call(function, number: int) -> float:
+    '''
+    Best time of one call, in seconds
+    '''
+    return min(timeit.repeat(function, number=number, repeat=REPEATS)) / number
+
+
+def main():
+    heroes = [Hero(name=f"hero {i}") for i in range(10_000)]
+    hero = heroes[0]
+
+    cases = {
+        "single object": (
+            lambda: legacy_success_response("Hero retrieved", legacy_to_dict(hero)),
+            lambda: success_response("Hero retrieved", hero.to_dict()),
+            20_000,
+        ),
+        f"list of {len(heroes)}": (
+            lambda: legacy_success_response(
+                "Heroes retrieved", [legacy_to_dict(h) for h in heroes]
+            ),
+            lambda: success_response("Heroes retrieved", [h.to_dict() for h in heroes]),
+            5,
+        ),
+    }
+
+    print(f"encoder: {ENCODER}\\n")
+    print(f"{'payload':<16}{'previous':>14}{'current':>14}{'speedup':>10}")
+    for name, (legacy, current, number) in cases.items():
+        before = per_call(legacy, number)
+        after = per_call(current, number)
+        print(
+            f"{name:<16}{before * 1e6:>11.1f} us{after * 1e6:>11.1f} us"
+            f"{before / after:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
+"""
+)
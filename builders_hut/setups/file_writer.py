@@ -1,5 +1,8 @@
+from pathlib import Path
+
 from builders_hut.setups import FILES_TO_WRITE, BaseSetup
-from builders_hut.utils import write_file
+from builders_hut.setups.materializer import Manifest, materialize
+from builders_hut.setups.templates import ProjectContext, render
 
 
 class SetupFileWriter(BaseSetup):
@@ -8,29 +11,16 @@ class SetupFileWriter(BaseSetup):
     """
 
     def create(self):
-        self._write_files()
+        materialize(self.location, self.manifest())
+
+    def manifest(self) -> Manifest:
+        manifest = Manifest()
+        for path, template_id in self.templates().items():
+            manifest.add_file(path, render(template_id, self.context))
+        return manifest
 
-    def _write_files(self) -> None:
-        for path, content in FILES_TO_WRITE.items():
-            if path.name == ".env":
-                content = content.format(
-                    title=self.name,
-                    description=self.description,
-                    version=self.version,
-                    DB_TYPE=self.database_provider,
-                )
-            path = self.location / path
-            write_file(path, content)
+    def templates(self) -> dict[Path, str]:
+        return FILES_TO_WRITE
 
-    def configure(
-        self,
-        name: str,
-        description: str,
-        version: str,
-        database_provider: str,
-        **kwargs,
-    ):
-        self.name = name
-        self.description = description
-        self.version = version
-        self.database_provider = database_provider
+    def configure(self, **kwargs):
+        self.context = ProjectContext.from_config(**kwargs)
@@ -1,12 +1,28 @@
+from pathlib import Path
+
 from builders_hut.setups import BaseSetup
-from builders_hut.utils import make_file
+from builders_hut.setups.db_setup import SetupDatabase
+from builders_hut.setups.env_setup import SetupEnv
+from builders_hut.setups.file_writer import SetupFileWriter
+from builders_hut.setups.materializer import Manifest, materialize
+from builders_hut.setups.structure_setup import SetupStructure
+from builders_hut.setups.sync import HUT_MANIFEST, dump_manifest, record_files
+from builders_hut.setups.templates import ProjectContext
 
 
 class SetupFiles(BaseSetup):
     """
     Create all the required files for the project.
+
+    The directories and file contents of every generating step are
+    collected into one manifest and written in a single pass, so each
+    file is written exactly once. The files rendered from templates are
+    recorded in .hut/manifest.json for `hut sync`.
     """
 
+    # steps whose manifest is written by this one
+    GENERATORS = (SetupStructure, SetupFileWriter, SetupEnv, SetupDatabase)
+
     FILES_TO_CREATE = [
         # Main application file
         "app/main.py",
@@ -22,6 +38,7 @@ class SetupFiles(BaseSetup):
         "app/core/exceptions.py",
         "app/core/lifespan.py",
         "app/core/logger.py",
+        "app/core/pagination.py",
         "app/core/response_helper.py",
         "app/core/responses.py",
         # database files
@@ -49,6 +66,7 @@ class SetupFiles(BaseSetup):
         "app/workers/__init__.py",
         # Test initialization file
         "tests/__init__.py",
+        "tests/bench_response_helper.py",
         # Configuration
         ".env",
         ".gitignore",
@@ -58,6 +76,30 @@ class SetupFiles(BaseSetup):
     ]
 
     def create(self):
+        materialize(self.location, self.manifest())
+
+    def manifest(self) -> Manifest:
+        manifest = Manifest()
+        templates: dict[Path, str] = {}
+        generated: list[Path] = []
+        for step_cls in self.GENERATORS:
+            step = step_cls(self.location)
+            step.configure(**self.config)
+            manifest.merge(step.manifest())
+            templates.update(step.templates())
+            generated.extend(step.generated_files())
+
         for file_path in self.FILES_TO_CREATE:
-            full_path = self.location / file_path
-            make_file(full_path)
+            manifest.touch(file_path)
+
+        records = record_files(
+            templates,
+            manifest.files,
+            ProjectContext.from_config(**self.config),
+            generated,
+        )
+        manifest.add_file(HUT_MANIFEST, dump_manifest(self.config, records))
+        return manifest
+
+    def configure(self, **kwargs):
+        self.config = kwargs
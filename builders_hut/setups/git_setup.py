@@ -1,5 +1,5 @@
 from builders_hut.setups import BaseSetup
-from builders_hut.utils import run_subprocess
+from builders_hut.process import run_command
 
 
 class SetupGithub(BaseSetup):
@@ -7,8 +7,10 @@ class SetupGithub(BaseSetup):
     Setup github for this project
     """
 
+    DEPENDS_ON = ("SetupFiles",)
+
     def create(self):
         try:
-            run_subprocess(self.location, "git init")
-        except Exception:
-            raise RuntimeError("Could Not Initialize Git")
+            run_command(self.location, ["git", "init"], timeout=60)
+        except Exception as e:
+            raise RuntimeError(f"Could Not Initialize Git\n{e}")
@@ -0,0 +1,97 @@
+import shutil
+from pathlib import Path
+
+from builders_hut.options import InstallerType
+from builders_hut.process import run_command
+from builders_hut.utils import get_venv_python
+
+
+class BaseInstaller:
+    """
+    Creates the venv and installs packages into it.
+
+    With a wheelhouse, packages are looked up there first. Offline
+    installs use the wheelhouse only and never reach the package index.
+    """
+
+    name: str
+
+    def __init__(self, wheelhouse: Path | None = None, offline: bool = False):
+        if offline and wheelhouse is None:
+            raise RuntimeError("Offline installs need a wheelhouse directory")
+
+        self.wheelhouse = wheelhouse
+        self.offline = offline
+
+    def _source_args(self, locked: bool = False) -> list[str | Path]:
+        # a lock pins and hashes every package, dependencies included
+        args = ["--no-deps", "--require-hashes"] if locked else []
+        if self.wheelhouse is not None:
+            args += ["--find-links", self.wheelhouse]
+        if self.offline:
+            args.append("--no-index")
+        return args
+
+
+class PipInstaller(BaseInstaller):
+    """venv + pip, always available"""
+
+    name = "pip"
+
+    def create_venv(self, location: Path) -> None:
+        run_command(location, ["python", "-m", "venv", ".venv"], timeout=120)
+
+    def install(
+        self, location: Path, requirements_file: str, locked: bool = False
+    ) -> None:
+        run_command(
+            location,
+            [
+                get_venv_python(location),
+                *("-m", "pip", "install", "-r", requirements_file),
+                *self._source_args(locked),
+            ],
+        )
+
+
+class UvInstaller(BaseInstaller):
+    """uv, much faster when it is on PATH"""
+
+    name = "uv"
+
+    def create_venv(self, location: Path) -> None:
+        run_command(location, ["uv", "venv", ".venv"], timeout=120)
+
+    def install(
+        self, location: Path, requirements_file: str, locked: bool = False
+    ) -> None:
+        run_command(
+            location,
+            [
+                *("uv", "pip", "install", "--python", ".venv"),
+                *("-r", requirements_file),
+                *self._source_args(locked),
+            ],
+        )
+
+
+def get_installer(
+    installer: InstallerType | str = InstallerType.AUTO,
+    wheelhouse: Path | None = None,
+    offline: bool = False,
+) -> BaseInstaller:
+    """
+    Get the installer backend.
+
+    auto picks uv when it is on PATH and falls back to pip otherwise.
+    """
+    match InstallerType(installer):
+        case InstallerType.PIP:
+            return PipInstaller(wheelhouse, offline)
+        case InstallerType.UV:
+            if shutil.which("uv") is None:
+                raise RuntimeError("uv installer selected but uv is not on PATH")
+            return UvInstaller(wheelhouse, offline)
+        case InstallerType.AUTO:
+            backend = UvInstaller if shutil.which("uv") else PipInstaller
+            return backend(wheelhouse, offline)
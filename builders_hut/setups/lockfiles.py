@@ -0,0 +1,166 @@
+"""
+Pre-resolved, hash-pinned lock files of the provider profiles.
+
+One lock per profile ships in setups/locks. It pins every package the
+project venv gets, dev packages included, for every platform and for
+Python LOCK_PYTHON and up, with the hash of every distribution file.
+Profiles are per database provider and schema backend.
+SetupEnv copies it into the project as requirements.lock and installs
+it with --no-deps and --require-hashes, so no build resolves
+dependencies and the venv cache key follows the exact pins.
+
+The first lines of a lock record a hash of the package lists it was
+resolved from. A lock whose lists changed since is ignored and builds
+resolve as before, until `hut lock refresh` resolves them again.
+"""
+
+import hashlib
+import shutil
+import tempfile
+from pathlib import Path
+
+from builders_hut.options import SchemaBackend
+from builders_hut.process import run_commands
+from builders_hut.setups.env_setup import DB_SQL_PACKAGES, requirements_for
+
+LOCK_DIR = Path(__file__).parent / "locks"
+
+# the oldest Python the locks resolve for, the one builders-hut requires
+LOCK_PYTHON = "3.13"
+
+# the lock inside a generated project
+PROJECT_LOCK = "requirements.lock"
+
+_INPUTS_PREFIX = "# inputs: "
+
+
+def lock_profiles() -> dict[str, tuple[str, str, str]]:
+    """Profile name -> database type, provider and schema backend"""
+    profiles = {}
+    for backend in SchemaBackend:
+        databases = [("sql", provider) for provider in DB_SQL_PACKAGES]
+        # nosql projects get no database packages, whatever the provider
+        databases.append(("nosql", "mongodb"))
+        for database_type, provider in databases:
+            name = profile_name(database_type, provider, backend)
+            profiles[name] = (database_type, provider, backend.value)
+    return profiles
+
+
+def profile_name(
+    database_type: str,
+    database_provider: str,
+    schema_backend: SchemaBackend | str = SchemaBackend.PYDANTIC,
+) -> str:
+    name = database_provider if database_type == "sql" else "nosql"
+    backend = SchemaBackend(schema_backend)
+    return name if backend == SchemaBackend.PYDANTIC else f"{name}-{backend.value}"
+
+
+def lock_inputs(
+    database_type: str,
+    database_provider: str,
+    schema_backend: SchemaBackend | str = SchemaBackend.PYDANTIC,
+) -> list[str]:
+    """The packages the lock of a profile is resolved from"""
+    packages, dev_packages = requirements_for(
+        database_type, database_provider, schema_backend
+    )
+    # requirements_dev.txt pulls in requirements.txt with -r
+    dev_packages = [line for line in dev_packages if not line.startswith("-r")]
+    return sorted({*packages, *dev_packages})
+
+
+def inputs_hash(inputs: list[str]) -> str:
+    data = "\n".join([f"python>={LOCK_PYTHON}", *inputs])
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def _recorded_hash(lock: str) -> str | None:
+    for line in lock.splitlines()[:5]:
+        if line.startswith(_INPUTS_PREFIX):
+            return line.removeprefix(_INPUTS_PREFIX).strip()
+    return None
+
+
+def read_lock(
+    database_type: str,
+    database_provider: str,
+    schema_backend: SchemaBackend | str = SchemaBackend.PYDANTIC,
+    directory: Path = LOCK_DIR,
+) -> str | None:
+    """The lock of a profile, None if there is none or it is out of date"""
+    profile = profile_name(database_type, database_provider, schema_backend)
+    try:
+        lock = (directory / f"{profile}.txt").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+    expected = inputs_hash(
+        lock_inputs(database_type, database_provider, schema_backend)
+    )
+    return lock if _recorded_hash(lock) == expected else None
+
+
+def pinned(lock: str) -> list[str]:
+    """The name==version lines of a lock, with their markers"""
+    return [
+        line.removesuffix("\\").strip()
+        for line in lock.splitlines()
+        if line and not line[0].isspace() and not line.startswith("#")
+    ]
+
+
+def stale_locks(directory: Path = LOCK_DIR) -> list[str]:
+    """Profiles whose lock is missing or out of date"""
+    return [
+        profile
+        for profile, (database_type, provider, backend) in lock_profiles().items()
+        if read_lock(database_type, provider, backend, directory) is None
+    ]
+
+
+def refresh_locks(directory: Path = LOCK_DIR) -> list[Path]:
+    """
+    Resolve the lock of every profile again, with uv.
+
+    Needs uv on PATH and the package index, every profile is resolved
+    at the same time.
+    """
+    if shutil.which("uv") is None:
+        raise RuntimeError("Refreshing the locks needs uv on PATH")
+
+    profiles = lock_profiles()
+    with tempfile.TemporaryDirectory(prefix="hut-lock-") as tmp:
+        work = Path(tmp)
+        commands = []
+        for profile, spec in profiles.items():
+            inputs = lock_inputs(*spec)
+            (work / f"{profile}.in").write_text("\n".join(inputs) + "\n")
+            commands.append(
+                [
+                    *("uv", "pip", "compile", f"{profile}.in"),
+                    *("--universal", "--generate-hashes", "--no-header"),
+                    *("--python-version", LOCK_PYTHON),
+                    *("--output-file", f"{profile}.txt"),
+                ]
+            )
+
+        try:
+            run_commands(work, commands)
+        except Exception as e:
+            raise RuntimeError(f"Could not resolve the locks\n{e}")
+
+        directory.mkdir(parents=True, exist_ok=True)
+        written = []
+        for profile, spec in profiles.items():
+            header = (
+                f"# Lock of the {profile} profile, refresh with `hut lock refresh`\n"
+                f"{_INPUTS_PREFIX}{inputs_hash(lock_inputs(*spec))}\n"
+            )
+            resolved = (work / f"{profile}.txt").read_text(encoding="utf-8")
+            target = directory / f"{profile}.txt"
+            target.write_text(header + resolved, encoding="utf-8")
+            written.append(target)
+
+    return written
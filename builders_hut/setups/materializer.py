@@ -0,0 +1,78 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from builders_hut.timing import record_io
+
+
+@dataclass
+class Manifest:
+    """Directories and rendered files a setup step generates, relative to the project"""
+
+    directories: set[Path] = field(default_factory=set)
+    files: dict[Path, str] = field(default_factory=dict)
+
+    def add_directory(self, path: str | Path) -> None:
+        self.directories.add(Path(path))
+
+    def add_file(self, path: str | Path, content: str) -> None:
+        self.files[Path(path)] = content
+
+    def touch(self, path: str | Path) -> None:
+        """Add an empty file, unless some step already gave it content"""
+        self.files.setdefault(Path(path), "")
+
+    def merge(self, other: "Manifest") -> None:
+        self.directories |= other.directories
+        for path, content in other.files.items():
+            if content or path not in self.files:
+                self.files[path] = content
+
+
+@dataclass
+class MaterializeStats:
+    directories: int = 0
+    files: int = 0
+    bytes_written: int = 0
+    # estimated from what is done, the calls themselves are not counted
+    file_ops: int = 0
+
+
+def _all_directories(manifest: Manifest) -> list[Path]:
+    """Every directory the manifest needs, parents before children"""
+    needed: set[Path] = set()
+    for path in [*manifest.directories, *(f.parent for f in manifest.files)]:
+        while path != Path("."):
+            needed.add(path)
+            path = path.parent
+
+    return sorted(needed, key=lambda p: len(p.parts))
+
+
+def materialize(location: Path, manifest: Manifest) -> MaterializeStats:
+    """
+    Write the whole manifest in one pass.
+
+    Every directory is created with a single mkdir, parents first, and
+    every file is opened and written exactly once.
+    """
+    stats = MaterializeStats()
+
+    for directory in _all_directories(manifest):
+        try:
+            (location / directory).mkdir()
+        except FileExistsError:
+            pass
+        stats.directories += 1
+        stats.file_ops += 1
+
+    for path, content in manifest.files.items():
+        data = content.encode("utf-8")
+        # open, write, close
+        with open(location / path, "wb") as f:
+            f.write(data)
+        stats.files += 1
+        stats.bytes_written += len(data)
+        stats.file_ops += 3
+
+    record_io(stats.bytes_written, stats.file_ops)
+    return stats
@@ -0,0 +1,205 @@
+"""
+Symbol index of a generated project.
+
+The top level symbols and __all__ exports of the modules in the packages
+resources live in are kept in .hut/index.json. A module is parsed again
+only when its mtime or size changed and its content hash did too, so
+refreshing the index of a project with hundreds of resources costs a
+directory scan and a stat per module.
+
+For a package __init__.py the index also keeps the anchors wiring edits
+it at. An edit made through record_edit() updates the entry directly,
+so the growing __init__.py files are never parsed again after adding a
+resource.
+"""
+
+import ast
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from builders_hut.setups.wiring import Anchors, find_anchors, normalize
+
+INDEX_PATH = Path(".hut/index.json")
+
+INDEX_VERSION = 1
+
+# the packages whose modules are indexed
+INDEXED_PACKAGES = (
+    "app/models",
+    "app/schemas",
+    "app/repositories",
+    "app/services",
+    "app/api/v1",
+)
+
+
+@dataclass
+class ModuleInfo:
+    mtime_ns: int
+    size: int
+    hash: str
+    # top level classes, functions and assigned names
+    symbols: list[str] = field(default_factory=list)
+    # the names in __all__
+    exports: list[str] = field(default_factory=list)
+    # the wiring anchors of a package __init__.py
+    anchors: dict | None = None
+
+
+def _parse(data: bytes, anchored: bool) -> tuple[list[str], list[str], dict | None]:
+    """Top level symbols, __all__ and, if anchored, the wiring anchors of a module"""
+    try:
+        source = normalize(data.decode("utf-8"))
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        # left to the user to fix, the module just defines nothing known
+        return [], [], None
+
+    symbols, exports = [], []
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols.append(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                if target.id == "__all__" and isinstance(
+                    node.value, (ast.List, ast.Tuple)
+                ):
+                    exports = [
+                        element.value
+                        for element in node.value.elts
+                        if isinstance(element, ast.Constant)
+                    ]
+                else:
+                    symbols.append(target.id)
+
+    anchors = vars(find_anchors(tree, source)) if anchored else None
+    return symbols, exports, anchors
+
+
+class ProjectIndex:
+    def __init__(self, location: Path):
+        self.location = location
+        # posix path relative to the project -> info
+        self.modules: dict[str, ModuleInfo] = {}
+        # modules parsed by the last refresh()
+        self.parsed = 0
+        self._dirty = False
+
+    @classmethod
+    def load(cls, location: Path) -> "ProjectIndex":
+        """The stored index, or an empty one if there is none or it is unreadable"""
+        index = cls(location)
+        try:
+            stored = json.loads((location / INDEX_PATH).read_text(encoding="utf-8"))
+            if stored.get("version") == INDEX_VERSION:
+                index.modules = {
+                    path: ModuleInfo(**info) for path, info in stored["modules"].items()
+                }
+        except (OSError, ValueError, TypeError, KeyError):
+            index._dirty = True
+        return index
+
+    def refresh(self) -> None:
+        """Bring the index up to date with every module on disk"""
+        self.parsed = 0
+        seen = set()
+
+        for package in INDEXED_PACKAGES:
+            try:
+                entries = list(os.scandir(self.location / package))
+            except FileNotFoundError:
+                continue
+
+            for entry in entries:
+                if not entry.name.endswith(".py") or not entry.is_file():
+                    continue
+                path = f"{package}/{entry.name}"
+                seen.add(path)
+                self._refresh_module(path, entry.stat())
+
+        for path in self.modules.keys() - seen:
+            del self.modules[path]
+            self._dirty = True
+
+    def update(self, paths: list[Path]) -> None:
+        """Bring the index up to date with the given modules, after writing them"""
+        self.parsed = 0
+        for path in paths:
+            if path.suffix == ".py" and path.parent.as_posix() in INDEXED_PACKAGES:
+                self._refresh_module(path.as_posix(), (self.location / path).stat())
+
+    def _refresh_module(self, path: str, stat: os.stat_result) -> None:
+        info = self.modules.get(path)
+        if info and info.mtime_ns == stat.st_mtime_ns and info.size == stat.st_size:
+            return
+
+        data = (self.location / path).read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if info is None or info.hash != digest:
+            symbols, exports, anchors = _parse(data, path.endswith("/__init__.py"))
+            self.parsed += 1
+            info = ModuleInfo(0, 0, digest, symbols, exports, anchors)
+
+        # touched but not changed, only the stat is refreshed
+        info.mtime_ns, info.size = stat.st_mtime_ns, stat.st_size
+        self.modules[path] = info
+        self._dirty = True
+
+    def anchors(self, path: Path) -> Anchors | None:
+        """The stored anchors of a package __init__.py, valid after refresh()"""
+        info = self.modules.get(path.as_posix())
+        return Anchors(**info.anchors) if info and info.anchors else None
+
+    def record_edit(
+        self, path: Path, source: str, exports: list[str], anchors: Anchors
+    ) -> None:
+        """
+        Record the new source of a package __init__.py before it is written.
+
+        The hash then matches what update() reads back, which only takes
+        the new stat instead of parsing the file.
+        """
+        info = self.modules.get(path.as_posix()) or ModuleInfo(0, 0, "")
+        self.modules[path.as_posix()] = ModuleInfo(
+            0,
+            0,
+            hashlib.sha256(source.encode("utf-8")).hexdigest(),
+            info.symbols,
+            # names land in __all__ only if there is one
+            info.exports + exports if anchors.all_end is not None else info.exports,
+            vars(anchors),
+        )
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+
+        index = {
+            "version": INDEX_VERSION,
+            # vars() rather than asdict(), which deep copies every list
+            "modules": {
+                path: vars(info) for path, info in sorted(self.modules.items())
+            },
+        }
+        target = self.location / INDEX_PATH
+        target.parent.mkdir(exist_ok=True)
+        target.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+        self._dirty = False
+
+    def defined_in(self, symbol: str) -> str | None:
+        """The module defining symbol at its top level, if any"""
+        for path, info in self.modules.items():
+            if symbol in info.symbols:
+                return path
+        return None
+
+    def exports(self, package: str) -> list[str]:
+        info = self.modules.get(f"{package}/__init__.py")
+        return info.exports if info else []
@@ -0,0 +1,168 @@
+"""
+`hut add resource`.
+
+A resource is a model, its schemas, a repository, a service and an
+api/v1 router, rendered from templates modeled on the Hero files and
+wired into the package __init__.py files with minimal source edits.
+Conflicts and the places to edit are found through the project's symbol
+index, so adding a resource parses only its own new modules and those
+the user changed since the last one.
+"""
+
+import keyword
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from builders_hut.options import SchemaBackend
+from builders_hut.setups.materializer import Manifest, materialize
+from builders_hut.setups.project_index import ProjectIndex
+from builders_hut.setups.sync import load_manifest
+from builders_hut.setups.templates import RESOURCE_TEMPLATES, ResourceContext
+from builders_hut.setups.wiring import add_exports, add_router, anchors_of
+
+# path, with the module name as {module} -> template id
+RESOURCE_FILES = {
+    "app/models/{module}.py": "resource/model.py",
+    "app/schemas/{module}.py": "resource/schema.py",
+    "app/repositories/{module}.py": "resource/repository.py",
+    "app/services/{module}.py": "resource/service.py",
+    "app/api/v1/{module}.py": "resource/api_v1.py",
+}
+
+V1_ROUTER = Path("app/api/v1/__init__.py")
+
+_WORDS = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+
+@dataclass
+class AddResourceResult:
+    context: ResourceContext
+    created: list[Path] = field(default_factory=list)
+    wired: list[Path] = field(default_factory=list)
+    # modules parsed to bring the symbol index up to date
+    parsed: int = 0
+
+
+def pluralize(word: str) -> str:
+    if re.search(r"[^aeiou]y$", word):
+        return word[:-1] + "ies"
+    if re.search(r"(s|x|z|ch|sh)$", word):
+        return word + "es"
+    return word + "s"
+
+
+def resource_context(
+    name: str,
+    plural: str | None = None,
+    schema_backend: SchemaBackend | str = SchemaBackend.PYDANTIC,
+) -> ResourceContext:
+    """The names of a resource from something like villain, BlogPost or blog-post"""
+    words = [word.lower() for word in _WORDS.findall(name)]
+    if not words or not re.fullmatch(r"[A-Za-z][A-Za-z0-9_\- ]*", name):
+        raise RuntimeError(f"Invalid resource name: {name!r}")
+
+    module = "_".join(words)
+    if keyword.iskeyword(module):
+        raise RuntimeError(f"Invalid resource name, {module} is a Python keyword")
+
+    plural_words = (
+        [word.lower() for word in _WORDS.findall(plural)]
+        if plural
+        else [*words[:-1], pluralize(words[-1])]
+    )
+    return ResourceContext(
+        class_name="".join(word.capitalize() for word in words),
+        module=module,
+        plural_module="_".join(plural_words),
+        label=" ".join(words),
+        title=" ".join(word.capitalize() for word in words),
+        plural_title=" ".join(word.capitalize() for word in plural_words),
+        path="-".join(plural_words),
+        path_param=f"{{{module}_id}}",
+        schema_backend=SchemaBackend(schema_backend).value,
+    )
+
+
+def schema_backend_of(location: Path) -> str:
+    """The schema backend the project was built with, from .hut/manifest.json"""
+    try:
+        config, _ = load_manifest(location)
+    except RuntimeError:
+        # built before the manifest existed
+        return SchemaBackend.PYDANTIC.value
+    return config.get("schema_backend", SchemaBackend.PYDANTIC.value)
+
+
+def _exports(context: ResourceContext) -> dict[str, list[str]]:
+    """Package -> the names the resource adds to it"""
+    name = context.class_name
+    return {
+        "app/models": [name],
+        "app/repositories": [f"{name}RepoDeps", f"{name}Repository"],
+        "app/services": [f"{name}ServiceDeps"],
+    }
+
+
+def add_resource(
+    location: Path, name: str, plural: str | None = None
+) -> AddResourceResult:
+    if not (location / V1_ROUTER).is_file():
+        raise RuntimeError(f"{location} is not a project built with hut")
+
+    context = resource_context(name, plural, schema_backend_of(location))
+    result = AddResourceResult(context)
+
+    index = ProjectIndex.load(location)
+    index.refresh()
+    result.parsed = index.parsed
+
+    files = {
+        Path(path.format(module=context.module)): template_id
+        for path, template_id in RESOURCE_FILES.items()
+    }
+    for path in files:
+        if (location / path).exists():
+            raise RuntimeError(f"{path} already exists")
+
+    new_symbols = [
+        f"{context.class_name}{suffix}"
+        for suffix in ("", "Repository", "RepoDeps", "Service", "ServiceDeps")
+    ]
+    for symbol in new_symbols:
+        if defined_in := index.defined_in(symbol):
+            raise RuntimeError(f"{symbol} is already defined in {defined_in}")
+
+    manifest = Manifest()
+    for path, template_id in files.items():
+        manifest.add_file(path, RESOURCE_TEMPLATES.render(template_id, context))
+        result.created.append(path)
+
+    # package __init__.py -> names to export, None for the v1 router
+    wiring: dict[Path, list[str] | None] = {
+        Path(package) / "__init__.py": names
+        for package, names in _exports(context).items()
+    }
+    wiring[V1_ROUTER] = None
+
+    for path, names in wiring.items():
+        init = location / path
+        source = init.read_text(encoding="utf-8") if init.exists() else ""
+        anchors = index.anchors(path) or anchors_of(source, path.as_posix())
+        if names is None:
+            edited, anchors = add_router(
+                source, anchors, context.module, path.as_posix()
+            )
+        else:
+            edited, anchors = add_exports(source, anchors, context.module, names)
+
+        index.record_edit(path, edited, names or [], anchors)
+        manifest.add_file(path, edited)
+        result.wired.append(path)
+
+    materialize(location, manifest)
+
+    index.update([*result.created, *result.wired])
+    result.parsed += index.parsed
+    index.save()
+    return result
@@ -0,0 +1,123 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable
+
+from builders_hut.setups.base_setup import BaseSetup
+from builders_hut.timing import StepTiming, SubprocessCallback, measure
+from builders_hut.utils import setup_project
+
+StepCallback = Callable[[type[BaseSetup]], None]
+ErrorCallback = Callable[[type[BaseSetup], BaseException], None]
+
+
+def _check_dependencies(steps: dict[str, type[BaseSetup]]) -> None:
+    """
+    Make sure the dependency graph has no cycles.
+
+    Dependencies on steps that are not part of this run are ignored,
+    they are assumed to be done already.
+    """
+    visiting: set[str] = set()
+    visited: set[str] = set()
+
+    def visit(name: str, chain: list[str]):
+        if name in visited:
+            return
+        if name in visiting:
+            cycle = " -> ".join(chain[chain.index(name) :] + [name])
+            raise RuntimeError(f"Circular setup dependency: {cycle}")
+
+        visiting.add(name)
+        for dep in steps[name].DEPENDS_ON:
+            if dep in steps:
+                visit(dep, chain + [name])
+        visiting.discard(name)
+        visited.add(name)
+
+    for name in steps:
+        visit(name, [])
+
+
+def _run_step(
+    location: Path,
+    step: type[BaseSetup],
+    config: dict,
+    on_subprocess: SubprocessCallback | None,
+) -> StepTiming:
+    """Run a single step on a worker thread and time it"""
+    with measure(step.__name__, on_subprocess) as timing:
+        setup_project(location, step, **config)
+    return timing
+
+
+def run_steps(
+    location: Path,
+    setup_steps: list[type[BaseSetup]],
+    *,
+    max_workers: int | None = None,
+    on_start: StepCallback | None = None,
+    on_finish: StepCallback | None = None,
+    on_error: ErrorCallback | None = None,
+    on_subprocess: SubprocessCallback | None = None,
+    **config,
+) -> list[StepTiming]:
+    """
+    Run the setup steps on a thread pool.
+
+    A step starts as soon as every step it depends on has finished, so
+    independent steps run at the same time. The step callbacks are
+    always called from the calling thread, on_subprocess is called from
+    the worker thread that ran the subprocess.
+
+    If a step fails no new steps are started, the running ones are
+    allowed to finish and the first error is raised.
+
+    Returns the timing of every step, in the order they finished.
+    """
+    steps = {step.__name__: step for step in setup_steps}
+    _check_dependencies(steps)
+
+    pending = dict(steps)
+    done: set[str] = set()
+    running: dict[Future, type[BaseSetup]] = {}
+    error: BaseException | None = None
+    timings: list[StepTiming] = []
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers or len(steps) or 1,
+        thread_name_prefix="hut-setup",
+    ) as pool:
+        while pending or running:
+            if error is None:
+                for name, step in list(pending.items()):
+                    if all(dep in done or dep not in steps for dep in step.DEPENDS_ON):
+                        del pending[name]
+                        if on_start:
+                            on_start(step)
+                        running[
+                            pool.submit(_run_step, location, step, config, on_subprocess)
+                        ] = step
+
+            if not running:
+                # a failure stopped the scheduling and everything running is done
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                step = running.pop(future)
+                exc = future.exception()
+                if exc is not None:
+                    error = error or exc
+                    if on_error:
+                        on_error(step, exc)
+                    continue
+
+                done.add(step.__name__)
+                timings.append(future.result())
+                if on_finish:
+                    on_finish(step)
+
+    if error is not None:
+        raise error
+
+    return timings
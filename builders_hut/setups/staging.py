@@ -0,0 +1,122 @@
+import os
+import subprocess
+import sys
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+from builders_hut.setups.venv_cache import VenvCache, relocate_venv
+
+# conflicting paths listed in the error before it is cut short
+_MAX_LISTED = 5
+
+
+def _staging_dir(target: Path) -> Path:
+    """
+    A fresh directory on the filesystem of target.
+
+    Inside an existing target, so publishing needs no write access to
+    its parent, next to a missing one, whose parent is written anyway.
+    """
+    name = f".hut-staging-{uuid.uuid4().hex[:8]}"
+    if target.is_dir():
+        return target / name
+    return target.parent / f".{target.name}{name}"
+
+
+def _conflicts(src: Path, dst: Path) -> list[Path]:
+    """Entries of src that would replace something already in dst"""
+    conflicts = []
+    for entry in src.iterdir():
+        dest = dst / entry.name
+        if not dest.exists() and not dest.is_symlink():
+            continue
+        if entry.is_dir() and not entry.is_symlink() and dest.is_dir():
+            conflicts += _conflicts(entry, dest)
+        else:
+            conflicts.append(dest)
+    return conflicts
+
+
+def _merge_into(src: Path, dst: Path) -> None:
+    """Move every entry of src into an existing dst, one rename per entry"""
+    for entry in src.iterdir():
+        dest = dst / entry.name
+        if entry.is_dir() and not entry.is_symlink() and dest.is_dir():
+            _merge_into(entry, dest)
+        else:
+            os.rename(entry, dest)
+    src.rmdir()
+
+
+def _publish(staging: Path, target: Path) -> None:
+    """
+    Move the finished build into place.
+
+    A missing target is created with a single atomic rename. An existing
+    target is never replaced, the entries are moved into it one by one,
+    and only when none of them would overwrite a file already there.
+    """
+    if not target.exists():
+        os.rename(staging, target)
+    else:
+        conflicts = _conflicts(staging, target)
+        if conflicts:
+            listed = ", ".join(str(p.relative_to(target)) for p in conflicts[:_MAX_LISTED])
+            more = len(conflicts) - _MAX_LISTED
+            raise RuntimeError(
+                f"{target} already has files the build would overwrite: {listed}"
+                + (f" and {more} more" if more > 0 else "")
+            )
+        _merge_into(staging, target)
+
+    venv = target / ".venv"
+    if venv.is_dir():
+        relocate_venv(venv, staging / ".venv")
+
+
+def discard_in_background(path: Path) -> None:
+    """Delete a directory from a detached process, so the CLI can exit right away"""
+    if not path.exists():
+        return
+
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import shutil, sys; shutil.rmtree(sys.argv[1], ignore_errors=True)",
+            str(path),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+@contextmanager
+def staged_build(target: Path):
+    """
+    Build into a staging directory and publish it only on success.
+
+    A failed build never leaves a partial tree at target, its staging
+    directory is deleted in the background.
+
+    Where a moved venv cannot be relocated, Windows, the build runs in
+    target itself as it always did.
+    """
+    if not VenvCache.is_supported():
+        target.mkdir(parents=True, exist_ok=True)
+        yield target
+        return
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = _staging_dir(target)
+    staging.mkdir()
+
+    try:
+        yield staging
+        _publish(staging, target)
+    except BaseException:
+        discard_in_background(staging)
+        raise
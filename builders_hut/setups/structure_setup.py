@@ -1,5 +1,5 @@
 from builders_hut.setups import BaseSetup
-from builders_hut.utils import make_folder
+from builders_hut.setups.materializer import Manifest, materialize
 
 
 class SetupStructure(BaseSetup):
@@ -39,7 +39,12 @@ class SetupStructure(BaseSetup):
     ]
 
     def create(self):
-        make_folder(self.location / "app")
-        make_folder(self.location / "tests")
+        materialize(self.location, self.manifest())
+
+    def manifest(self) -> Manifest:
+        manifest = Manifest()
+        manifest.add_directory("app")
+        manifest.add_directory("tests")
         for dir_name in self.ALL_DIRS:
-            make_folder(self.location / "app" / dir_name)
+            manifest.add_directory(f"app/{dir_name}")
+        return manifest
@@ -0,0 +1,233 @@
+"""
+Record of the generated files, and `hut sync`.
+
+`hut build` writes .hut/manifest.json with the configuration the project
+was rendered from and, for every file rendered from a template, the
+template id and the hashes of the template, of the render context and
+of the output. Files generated without a template, the requirements
+files and the lock, are recorded with an empty template id and only
+the hash of their output.
+
+sync_project() renders again only the files whose template or context
+hash changed, regenerates the others, and writes a file only if it
+still holds the output recorded for it, so files edited by the user are
+never overwritten.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from builders_hut import APP_VERSION
+from builders_hut.setups.materializer import Manifest, materialize
+from builders_hut.setups.templates import PROJECT_TEMPLATES, ProjectContext
+
+HUT_MANIFEST = Path(".hut/manifest.json")
+
+MANIFEST_VERSION = 1
+
+# the configuration keys the templates are rendered from
+RENDER_CONFIG = (
+    "name",
+    "description",
+    "version",
+    "database_type",
+    "database_provider",
+    "schema_backend",
+)
+
+
+@dataclass(frozen=True)
+class FileRecord:
+    # "" for a file generated without a template
+    template: str
+    template_hash: str
+    context_hash: str
+    output_hash: str
+
+
+@dataclass
+class SyncResult:
+    updated: list[Path] = field(default_factory=list)
+    added: list[Path] = field(default_factory=list)
+    # edited since they were generated, left alone
+    skipped: list[Path] = field(default_factory=list)
+    # no longer generated, left in place
+    orphaned: list[Path] = field(default_factory=list)
+    unchanged: int = 0
+
+
+def output_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def context_hash(context: ProjectContext) -> str:
+    data = json.dumps(asdict(context), sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def render_config(config: dict) -> dict:
+    return {key: config[key] for key in RENDER_CONFIG if key in config}
+
+
+def dump_manifest(config: dict, records: dict[Path, FileRecord]) -> str:
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "builders_hut": APP_VERSION,
+        "config": render_config(config),
+        "files": {
+            path.as_posix(): asdict(record) for path, record in sorted(records.items())
+        },
+    }
+    return json.dumps(manifest, indent=2) + "\n"
+
+
+def load_manifest(location: Path) -> tuple[dict, dict[Path, FileRecord]]:
+    """The configuration and file records of the project at location"""
+    try:
+        manifest = json.loads((location / HUT_MANIFEST).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise RuntimeError(
+            f"No {HUT_MANIFEST} in {location}, was the project built with hut?"
+        )
+    except ValueError as e:
+        raise RuntimeError(f"Unreadable {HUT_MANIFEST}: {e}")
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise RuntimeError(
+            f"Unsupported {HUT_MANIFEST} version: {manifest.get('version')}"
+        )
+
+    records = {
+        Path(path): FileRecord(**record) for path, record in manifest["files"].items()
+    }
+    return manifest["config"], records
+
+
+def generated_record(content: str, hashed_context: str) -> FileRecord:
+    """The record of a file generated without a template"""
+    return FileRecord("", "", hashed_context, output_hash(content.encode("utf-8")))
+
+
+def record_files(
+    templates: dict[Path, str],
+    files: dict[Path, str],
+    context: ProjectContext,
+    generated: Iterable[Path] = (),
+) -> dict[Path, FileRecord]:
+    """
+    Records of the files hut generated in a manifest.
+
+    templates is path -> template id of the rendered files, generated
+    the paths of the files generated without a template.
+    """
+    hashed_context = context_hash(context)
+    records = {
+        path: FileRecord(
+            template=template_id,
+            template_hash=PROJECT_TEMPLATES.digest(template_id),
+            context_hash=hashed_context,
+            output_hash=output_hash(files[path].encode("utf-8")),
+        )
+        for path, template_id in templates.items()
+    }
+    for path in generated:
+        records[path] = generated_record(files[path], hashed_context)
+    return records
+
+
+def _file_hash(path: Path) -> str | None:
+    try:
+        return output_hash(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def sync_project(location: Path, dry_run: bool = False) -> SyncResult:
+    """
+    Bring the generated files of the project at location up to date.
+
+    With dry_run nothing is written, the result tells what would be.
+    """
+    # SetupFiles writes the manifest, so it imports this module
+    from builders_hut.setups.files_setup import SetupFiles
+
+    config, records = load_manifest(location)
+    context = ProjectContext.from_config(**config)
+    hashed_context = context_hash(context)
+
+    templates: dict[Path, str] = {}
+    generated: dict[Path, str] = {}
+    for step_cls in SetupFiles.GENERATORS:
+        step = step_cls(location)
+        step.configure(**config)
+        templates.update(step.templates())
+        generated.update(step.generated_files())
+
+    result = SyncResult()
+    writes = Manifest()
+    new_records: dict[Path, FileRecord] = {}
+
+    def reconcile(path: Path, old: FileRecord | None, new: FileRecord, content: str):
+        on_disk = _file_hash(location / path)
+
+        if on_disk == new.output_hash:
+            # already what it would be, only the record changes
+            new_records[path] = new
+            result.unchanged += 1
+        elif old is None and on_disk is None:
+            writes.add_file(path, content)
+            new_records[path] = new
+            result.added.append(path)
+        elif old is not None and on_disk == old.output_hash:
+            writes.add_file(path, content)
+            new_records[path] = new
+            result.updated.append(path)
+        else:
+            # edited, deleted or created by the user, keep the last record
+            # so a later sync still knows what hut wrote
+            if old is not None:
+                new_records[path] = old
+            result.skipped.append(path)
+
+    for path, template_id in templates.items():
+        old = records.get(path)
+        template_hash = PROJECT_TEMPLATES.digest(template_id)
+        if (
+            old is not None
+            and old.template == template_id
+            and old.template_hash == template_hash
+            and old.context_hash == hashed_context
+        ):
+            new_records[path] = old
+            result.unchanged += 1
+            continue
+
+        content = PROJECT_TEMPLATES.render(template_id, context)
+        new = FileRecord(
+            template_id,
+            template_hash,
+            hashed_context,
+            output_hash(content.encode("utf-8")),
+        )
+        reconcile(path, old, new, content)
+
+    for path, content in generated.items():
+        old = records.get(path)
+        new = generated_record(content, hashed_context)
+        if old == new:
+            new_records[path] = old
+            result.unchanged += 1
+            continue
+        reconcile(path, old, new, content)
+
+    result.orphaned = sorted(
+        path for path in records if path not in templates and path not in generated
+    )
+
+    if not dry_run and (writes.files or new_records != records):
+        writes.add_file(HUT_MANIFEST, dump_manifest(config, new_records))
+        materialize(location, writes)
+    return result
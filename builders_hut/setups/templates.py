@@ -0,0 +1,155 @@
+"""
+The templates of a generated project, by id.
+
+A template id is the path the template is usually written to. Variants,
+such as a database provider, are conditionals on the context inside one
+template rather than copies of it.
+
+The sources are read from the packed bundle, see setups/bundle.py, and
+only fall back to importing setups/file_contents when the bundle is
+missing or older than them.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from builders_hut.options import SchemaBackend
+from builders_hut.setups.bundle import BUNDLE_PATH, TemplateBundle, is_stale
+from builders_hut.setups.templating import TemplateRegistry
+
+# default database port written to .env, per database provider
+DB_DEFAULT_PORTS = {
+    "postgres": 5432,
+    "mysql": 3306,
+    "sqlite": 0,
+    "mongodb": 27017,
+}
+
+
+class PoolDefaults(NamedTuple):
+    size: int
+    max_overflow: int
+    # seconds to wait for a connection
+    timeout: int
+    # seconds before a connection is replaced, -1 for never
+    recycle: int
+
+
+# default SQLAlchemy connection pool settings written to .env, per database
+# provider. Servers and proxies drop idle connections, so they are recycled
+# before that happens. SQLite files have no server to time out.
+DB_DEFAULT_POOLS = {
+    "postgres": PoolDefaults(size=5, max_overflow=10, timeout=30, recycle=1800),
+    # below the 8 hour wait_timeout of the server
+    "mysql": PoolDefaults(size=5, max_overflow=10, timeout=30, recycle=3600),
+    "sqlite": PoolDefaults(size=5, max_overflow=10, timeout=30, recycle=-1),
+}
+
+# the defaults of SQLAlchemy itself, for providers without their own
+DEFAULT_POOL = PoolDefaults(size=5, max_overflow=10, timeout=30, recycle=-1)
+
+
+@dataclass(frozen=True)
+class ProjectContext:
+    """Everything a project template can use"""
+
+    name: str
+    description: str
+    version: str
+    database_type: str
+    database_provider: str
+    # "pydantic" or "msgspec"
+    schema_backend: str
+    db_user: str
+    db_pass: str
+    db_host: str
+    db_port: int
+    db_name: str
+    db_pool_size: int
+    db_max_overflow: int
+    db_pool_timeout: int
+    db_pool_recycle: int
+    # (provider, pool defaults) of every provider, for a DB_TYPE changed later
+    db_pools: tuple[tuple[str, PoolDefaults], ...]
+
+    @classmethod
+    def from_config(
+        cls,
+        name: str,
+        description: str,
+        version: str,
+        database_type: str = "sql",
+        database_provider: str = "postgres",
+        schema_backend: SchemaBackend | str = SchemaBackend.PYDANTIC,
+        **kwargs,
+    ) -> "ProjectContext":
+        """The context of a build, from the configuration of the setup steps"""
+        if database_provider not in DB_DEFAULT_PORTS:
+            raise RuntimeError(f"Unsupported database provider: {database_provider}")
+        if schema_backend not in set(SchemaBackend):
+            raise RuntimeError(f"Unsupported schema backend: {schema_backend}")
+
+        pool = DB_DEFAULT_POOLS.get(database_provider, DEFAULT_POOL)
+        return cls(
+            name=name,
+            description=description,
+            version=version,
+            database_type=database_type,
+            database_provider=database_provider,
+            schema_backend=SchemaBackend(schema_backend).value,
+            db_user="your_username",
+            db_pass="your_password",
+            db_host="localhost",
+            db_port=DB_DEFAULT_PORTS[database_provider],
+            # SQLite databases are files
+            db_name=f"{name}.db" if database_provider == "sqlite" else name,
+            db_pool_size=pool.size,
+            db_max_overflow=pool.max_overflow,
+            db_pool_timeout=pool.timeout,
+            db_pool_recycle=pool.recycle,
+            db_pools=tuple(DB_DEFAULT_POOLS.items()),
+        )
+
+
+@dataclass(frozen=True)
+class ResourceContext:
+    """Names of a resource added by `hut add resource`, e.g. BlogPost"""
+
+    # BlogPost
+    class_name: str
+    # blog_post
+    module: str
+    # blog_posts
+    plural_module: str
+    # blog post
+    label: str
+    # Blog Post
+    title: str
+    # Blog Posts
+    plural_title: str
+    # blog-posts, the url path of the router
+    path: str
+    # {blog_post_id}
+    path_param: str
+    # the schema backend of the project, "pydantic" or "msgspec"
+    schema_backend: str = SchemaBackend.PYDANTIC.value
+
+
+def _sources() -> Mapping[str, str]:
+    """The packed bundle, or the template modules while it is out of date"""
+    if is_stale():
+        from builders_hut.setups.file_contents import TEMPLATE_SOURCES
+
+        return TEMPLATE_SOURCES
+    return TemplateBundle(BUNDLE_PATH)
+
+
+_SOURCES = _sources()
+
+PROJECT_TEMPLATES = TemplateRegistry(ProjectContext, _SOURCES)
+RESOURCE_TEMPLATES = TemplateRegistry(ResourceContext, _SOURCES)
+
+
+def render(template_id: str, context: ProjectContext) -> str:
+    return PROJECT_TEMPLATES.render(template_id, context)
@@ -0,0 +1,263 @@
+"""
+Template engine for the generated files.
+
+    {{ expression }}                     the value of a Python expression
+    {% if expression %} ... {% elif expression %} ... {% else %} ... {% endif %}
+    {% for name in expression %} ... {% endfor %}
+    {% include "template-id" %}          another template of the same registry
+    {% raw %} ... {% endraw %}           text written as is
+
+A block tag alone on its line takes the whole line with it, so tags can
+be indented like the code around them without leaving blank lines.
+
+Every template is compiled once into a Python function, on first use,
+and kept by its registry. Templates are rendered with a typed context,
+a dataclass instance, and every name a template uses is checked against
+its fields when it is compiled.
+"""
+
+import ast
+import builtins
+import hashlib
+import re
+import threading
+from collections import ChainMap
+from collections.abc import Mapping
+from dataclasses import fields
+from typing import Callable
+
+# builtins a template expression may call
+ALLOWED_BUILTINS = frozenset(
+    {"len", "str", "int", "repr", "sorted", "enumerate", "range", "zip"}
+)
+
+_TOKEN = re.compile(
+    r"\{%\s*raw\s*%\}(?P<raw>.*?)\{%\s*endraw\s*%\}"
+    r"|^[ \t]*\{%(?P<line_tag>(?:(?!%\}).)*)%\}[ \t]*(?:\n|\Z)"
+    r"|\{%(?P<tag>(?:(?!%\}).)*)%\}"
+    r"|\{\{(?P<expr>(?:(?!\}\}).)*)\}\}",
+    re.MULTILINE | re.DOTALL,
+)
+
+_FOR = re.compile(r"for\s+(?P<target>.+?)\s+in\s+(?P<iter>.+)", re.DOTALL)
+_INCLUDE = re.compile(r"""include\s+(["'])(?P<id>[^"']+)\1""")
+
+Renderer = Callable[[object, Callable[[str, object], str]], str]
+
+
+class TemplateError(RuntimeError):
+    """A template could not be compiled or rendered"""
+
+
+class _Compiler:
+    def __init__(self, template_id: str, source: str, names: frozenset[str]):
+        self.template_id = template_id
+        self.source = source
+        self.names = names
+        self.used: set[str] = set()
+        self.includes: list[str] = []
+        self.code: list[str] = []
+        # open blocks as (keyword, names bound by it)
+        self.blocks: list[tuple[str, set[str]]] = []
+
+    def error(self, message: str, position: int) -> TemplateError:
+        line = self.source.count("\n", 0, position) + 1
+        return TemplateError(f"{self.template_id}, line {line}: {message}")
+
+    def emit(self, line: str) -> None:
+        self.code.append("    " * (len(self.blocks) + 1) + line)
+
+    def bound(self) -> set[str]:
+        return set().union(*(names for _, names in self.blocks))
+
+    def expression(self, text: str, position: int) -> ast.AST:
+        try:
+            tree = ast.parse(text.strip(), mode="eval")
+        except SyntaxError as e:
+            raise self.error(f"invalid expression {text.strip()!r}: {e.msg}", position)
+
+        bound = self.bound()
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Name) or not isinstance(node.ctx, ast.Load):
+                continue
+            if node.id in bound or node.id in ALLOWED_BUILTINS:
+                continue
+            if node.id not in self.names:
+                raise self.error(f"unknown name {node.id!r}", position)
+            self.used.add(node.id)
+        return tree
+
+    def tag(self, text: str, position: int) -> None:
+        keyword, _, rest = text.strip().partition(" ")
+        rest = rest.strip()
+
+        match keyword:
+            case "if":
+                self.expression(rest, position)
+                self.emit(f"if {rest}:")
+                self.blocks.append(("if", set()))
+            case "elif" | "else":
+                if not self.blocks or self.blocks[-1][0] != "if":
+                    raise self.error(f"{keyword} outside of an if block", position)
+                if keyword == "elif":
+                    self.expression(rest, position)
+                self.emit("pass")
+                self.blocks.pop()
+                self.emit(f"elif {rest}:" if keyword == "elif" else "else:")
+                self.blocks.append(("if", set()))
+            case "for":
+                loop = _FOR.fullmatch(text.strip())
+                if not loop:
+                    raise self.error(f"invalid for loop {text.strip()!r}", position)
+                self.expression(loop["iter"], position)
+                target = self.target(loop["target"], position)
+                self.emit(f"for {loop['target']} in {loop['iter']}:")
+                self.blocks.append(("for", target))
+            case "endif" | "endfor":
+                if not self.blocks or self.blocks[-1][0] != keyword[3:]:
+                    raise self.error(f"unexpected {keyword}", position)
+                self.emit("pass")
+                self.blocks.pop()
+            case "include":
+                include = _INCLUDE.fullmatch(text.strip())
+                if not include:
+                    raise self.error(f"invalid include {text.strip()!r}", position)
+                self.includes.append(include["id"])
+                self.emit(f"_w(_include({include['id']!r}, _ctx))")
+            case _:
+                raise self.error(f"unknown tag {keyword!r}", position)
+
+    def target(self, text: str, position: int) -> set[str]:
+        """The names a for loop binds"""
+        try:
+            tree = ast.parse(text.strip(), mode="eval").body
+        except SyntaxError:
+            tree = None
+
+        elements = tree.elts if isinstance(tree, ast.Tuple) else [tree]
+        if not all(isinstance(element, ast.Name) for element in elements):
+            raise self.error(f"invalid loop variable {text.strip()!r}", position)
+
+        names = {element.id for element in elements}
+        if names & self.names:
+            shadowed = ", ".join(sorted(names & self.names))
+            raise self.error(f"loop variable shadows the context: {shadowed}", position)
+        return names
+
+    def compile(self) -> Renderer:
+        position = 0
+        for token in _TOKEN.finditer(self.source):
+            if token.start() > position:
+                self.emit(f"_w({self.source[position : token.start()]!r})")
+            position = token.end()
+
+            if token["raw"] is not None:
+                self.emit(f"_w({token['raw']!r})")
+            elif token["expr"] is not None:
+                self.expression(token["expr"], token.start())
+                self.emit(f"_w(_str({token['expr'].strip()}))")
+            else:
+                tag = token["tag"] if token["tag"] is not None else token["line_tag"]
+                self.tag(tag, token.start())
+
+        if position < len(self.source):
+            self.emit(f"_w({self.source[position:]!r})")
+        if self.blocks:
+            raise self.error(f"unclosed {self.blocks[-1][0]} block", len(self.source))
+
+        header = [
+            "def _render(_ctx, _include):",
+            "    _out = []",
+            "    _w = _out.append",
+            *(f"    {name} = _ctx.{name}" for name in sorted(self.used)),
+        ]
+        code = "\n".join([*header, *self.code, "    return ''.join(_out)"])
+
+        namespace = {"_str": str, "__builtins__": builtins}
+        exec(compile(code, f"<template {self.template_id}>", "exec"), namespace)
+        return namespace["_render"]
+
+
+class TemplateRegistry:
+    """
+    Templates sharing one context type, by id.
+
+    Templates are compiled on first render and the compiled function is
+    reused for every render after that, from any thread. sources may be
+    a lazy mapping such as a TemplateBundle, a source is only read when
+    its template is compiled.
+    """
+
+    def __init__(self, context: type, sources: Mapping[str, str] | None = None):
+        self.context = context
+        self._names = frozenset(field.name for field in fields(context))
+        # templates added later take precedence over sources
+        self._sources = ChainMap({}, sources if sources is not None else {})
+        self._compiled: dict[str, Renderer] = {}
+        self._includes: dict[str, list[str]] = {}
+        self._digests: dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def add(self, template_id: str, source: str) -> None:
+        with self._lock:
+            self._sources[template_id] = source
+            # anything compiled so far may include this template
+            self._compiled.clear()
+            self._digests.clear()
+
+    def __contains__(self, template_id: str) -> bool:
+        return template_id in self._sources
+
+    def __iter__(self):
+        return iter(self._sources)
+
+    def source(self, template_id: str) -> str:
+        try:
+            return self._sources[template_id]
+        except KeyError:
+            raise TemplateError(f"Unknown template: {template_id}")
+
+    def compiled(self, template_id: str) -> Renderer:
+        renderer = self._compiled.get(template_id)
+        if renderer is None:
+            with self._lock:
+                renderer = self._compile(template_id, ())
+        return renderer
+
+    def _compile(self, template_id: str, including: tuple[str, ...]) -> Renderer:
+        if template_id in including:
+            cycle = " -> ".join([*including, template_id])
+            raise TemplateError(f"Templates include each other: {cycle}")
+        if template_id in self._compiled:
+            return self._compiled[template_id]
+
+        compiler = _Compiler(template_id, self.source(template_id), self._names)
+        renderer = compiler.compile()
+        for include in compiler.includes:
+            self._compile(include, (*including, template_id))
+
+        self._includes[template_id] = compiler.includes
+        self._compiled[template_id] = renderer
+        return renderer
+
+    def digest(self, template_id: str) -> str:
+        """Hash of the template source and of every template it includes"""
+        digest = self._digests.get(template_id)
+        if digest is None:
+            self.compiled(template_id)
+            hasher = hashlib.sha256(self.source(template_id).encode("utf-8"))
+            for include in self._includes[template_id]:
+                hasher.update(self.digest(include).encode("ascii"))
+            digest = self._digests[template_id] = hasher.hexdigest()
+        return digest
+
+    def render(self, template_id: str, context) -> str:
+        if not isinstance(context, self.context):
+            raise TemplateError(
+                f"{template_id} is rendered with a {self.context.__name__}, "
+                f"got {type(context).__name__}"
+            )
+        return self.compiled(template_id)(context, self._include)
+
+    def _include(self, template_id: str, context) -> str:
+        return self.compiled(template_id)(context, self._include)
@@ -0,0 +1,161 @@
+import hashlib
+import json
+import os
+import platform
+import shutil
+import sys
+import uuid
+from pathlib import Path
+
+# total size of all cached virtual envs before the least recently used are evicted
+DEFAULT_MAX_SIZE = 2 * 1024**3
+
+# files that hold absolute paths to the venv and are rewritten on restore
+_BIN_DIR = "bin"
+_PATH_FILES = ("pyvenv.cfg",)
+
+_META_FILE = "hut-cache.json"
+
+
+def get_cache_dir() -> Path:
+    """Directory of the virtual env cache, HUT_CACHE_DIR overrides it"""
+    if "HUT_CACHE_DIR" in os.environ:
+        return Path(os.environ["HUT_CACHE_DIR"])
+
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "builders-hut" / "venvs"
+
+
+def cache_key(requirements: list[str], installer: str) -> str:
+    """
+    Hash of everything that decides what ends up in the venv.
+
+    The base interpreter is part of the key since the venv links to it.
+    """
+    base_python = shutil.which("python") or sys.executable
+    parts = [
+        *sorted(set(requirements)),
+        f"python={platform.python_version()}",
+        f"base={os.path.realpath(base_python)}",
+        f"platform={sys.platform}-{platform.machine()}",
+        f"installer={installer}",
+    ]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:32]
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink when the filesystem allows it, copy otherwise"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _tree_size(path: Path) -> int:
+    return sum(
+        f.stat().st_size for f in path.rglob("*") if f.is_file() and not f.is_symlink()
+    )
+
+
+def _rewrite_prefix(file: Path, old: bytes, new: bytes) -> None:
+    """Point a file at the new venv, without touching a linked original"""
+    data = file.read_bytes()
+    if old not in data:
+        return
+
+    mode = file.stat().st_mode
+    file.unlink()
+    file.write_bytes(data.replace(old, new))
+    file.chmod(mode)
+
+
+def relocate_venv(venv: Path, old_prefix: Path | str) -> None:
+    """Fix the absolute paths of a venv that was moved from old_prefix"""
+    old, new = str(old_prefix).encode(), str(venv).encode()
+    for name in _PATH_FILES:
+        if (venv / name).exists():
+            _rewrite_prefix(venv / name, old, new)
+    for file in (venv / _BIN_DIR).iterdir():
+        if file.is_file() and not file.is_symlink():
+            _rewrite_prefix(file, old, new)
+
+
+class VenvCache:
+    """
+    Content addressed cache of fully installed virtual envs.
+
+    Only used on POSIX, the Windows script launchers embed the venv path
+    in binaries which cannot be rewritten safely.
+    """
+
+    def __init__(self, root: Path | None = None, max_size: int = DEFAULT_MAX_SIZE):
+        self.root = root or get_cache_dir()
+        self.max_size = max_size
+
+    @staticmethod
+    def is_supported() -> bool:
+        return os.name == "posix"
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key
+
+    def restore(self, key: str, target: Path) -> bool:
+        """
+        Materialize the cached venv at target.
+
+        Returns False on a cache miss.
+        """
+        entry = self._entry(key)
+        meta_file = entry / _META_FILE
+        if not meta_file.exists():
+            return False
+
+        meta = json.loads(meta_file.read_text(encoding="utf-8"))
+        venv = entry / "venv"
+
+        shutil.copytree(venv, target, symlinks=True, copy_function=_link_or_copy)
+        relocate_venv(target, meta["prefix"])
+
+        # the mtime of the entry is the last time it was used
+        os.utime(entry)
+        return True
+
+    def store(self, key: str, venv: Path) -> None:
+        """Add an installed venv to the cache and evict old entries"""
+        entry = self._entry(key)
+        if entry.exists():
+            return
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = self.root / f".{key}.{uuid.uuid4().hex}"
+        try:
+            # a real copy, so later edits inside the project never leak into the cache
+            shutil.copytree(venv, staging / "venv", symlinks=True)
+            meta = {"prefix": str(venv), "size": _tree_size(staging / "venv")}
+            (staging / _META_FILE).write_text(json.dumps(meta), encoding="utf-8")
+            os.rename(staging, entry)
+        except OSError:
+            # another build stored the same key first
+            shutil.rmtree(staging, ignore_errors=True)
+            if not entry.exists():
+                raise
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Drop the least recently used entries until the cache fits max_size"""
+        entries = []
+        for entry in self.root.iterdir():
+            meta_file = entry / _META_FILE
+            if entry.name.startswith(".") or not meta_file.exists():
+                continue
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            entries.append((entry.stat().st_mtime, meta["size"], entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+
+from builders_hut.setups.env_setup import (
+    DB_SQL_PACKAGES,
+    DEV_PACKAGES,
+    PACKAGES,
+    SCHEMA_BACKEND_PACKAGES,
+    SQL_COMMON_PACKAGE,
+)
+from builders_hut.process import run_command
+from builders_hut.setups.lockfiles import LOCK_DIR, lock_profiles, stale_locks
+from builders_hut.utils import make_folder
+
+
+def all_profile_packages() -> list[str]:
+    """Every package any provider profile can install"""
+    packages = [*PACKAGES, *SQL_COMMON_PACKAGE, *DEV_PACKAGES]
+    for provider_packages in DB_SQL_PACKAGES.values():
+        packages.extend(provider_packages)
+    for backend_packages in SCHEMA_BACKEND_PACKAGES.values():
+        packages.extend(backend_packages)
+
+    # keep the order stable, drop duplicates
+    return list(dict.fromkeys(packages))
+
+
+def sync_wheelhouse(directory: Path) -> list[Path]:
+    """
+    Download wheels for every provider profile, with their dependencies.
+
+    With up to date locks the pinned versions are downloaded and checked
+    against their hashes, so offline builds install exactly the locks.
+    Wheels are resolved for the interpreter running hut, which is the one
+    the project venvs are created from.
+    """
+    make_folder(directory)
+
+    if stale_locks():
+        downloads = [all_profile_packages()]
+    else:
+        # one at a time, the profiles may pin different versions of a package
+        downloads = [
+            ["--no-deps", "--require-hashes", "-r", LOCK_DIR / f"{profile}.txt"]
+            for profile in lock_profiles()
+        ]
+
+    try:
+        for requirements in downloads:
+            run_command(
+                directory,
+                [
+                    *(sys.executable, "-m", "pip", "download"),
+                    *("--only-binary=:all:", "--dest", "."),
+                    *requirements,
+                ],
+            )
+    except Exception as e:
+        raise RuntimeError(f"Could not download wheels into the wheelhouse\n{e}")
+
+    return sorted(directory.glob("*.whl"))
@@ -0,0 +1,179 @@
+"""
+Minimal source edits to wire a new resource into a project.
+
+A package __init__.py is parsed once to find its anchors, the places new
+lines and __all__ elements go. Only the new text is spliced in there, so
+the formatting and comments of the user's file are left as they are.
+
+Anchors are character offsets and are moved along with every insertion,
+so the anchors of the edited file are known without parsing it again.
+The project index stores them, and wiring the 200th resource into an
+__init__.py costs the same as wiring the first.
+"""
+
+import ast
+from dataclasses import dataclass
+
+
+@dataclass
+class Anchors:
+    # start of the line after the last relative import
+    imports: int
+    # where new __all__ elements go, None without an __all__ list
+    all_end: int | None = None
+    # "empty", "inline", "lines" or "lines_trailing", with a trailing comma
+    all_style: str = ""
+    all_indent: str = ""
+    # start of the line after the last router.include_router() call
+    router: int | None = None
+
+
+def _parse(source: str, filename: str) -> ast.Module:
+    try:
+        return ast.parse(source, filename=filename)
+    except SyntaxError as e:
+        raise RuntimeError(f"Could not parse {filename}, line {e.lineno}: {e.msg}")
+
+
+def normalize(source: str) -> str:
+    """Anchors at the end of the file need it to end with a newline"""
+    return source + "\n" if source and not source.endswith("\n") else source
+
+
+def _is_name(node: ast.AST, name: str) -> bool:
+    return isinstance(node, ast.Name) and node.id == name
+
+
+def find_anchors(tree: ast.Module, source: str) -> Anchors:
+    """Anchors of the parsed, normalized source"""
+    lines = source.splitlines(keepends=True)
+    starts = [0]
+    for line in lines:
+        starts.append(starts[-1] + len(line))
+
+    def offset(lineno: int, col_offset: int) -> int:
+        # col_offset counts utf-8 bytes
+        column = lines[lineno - 1].encode("utf-8")[:col_offset].decode("utf-8")
+        return starts[lineno - 1] + len(column)
+
+    relative, imports, all_value, router = [], [], None, None
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level:
+            relative.append(node)
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.append(node)
+        elif isinstance(node, ast.Assign) and len(node.targets) == 1:
+            if _is_name(node.targets[0], "__all__") and isinstance(
+                node.value, (ast.List, ast.Tuple)
+            ):
+                all_value = node.value
+            elif _is_name(node.targets[0], "router"):
+                router = node.end_lineno
+        elif (
+            isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute)
+            and node.value.func.attr == "include_router"
+            and _is_name(node.value.func.value, "router")
+        ):
+            router = node.end_lineno
+
+    if relative or imports:
+        import_line = (relative or imports)[-1].end_lineno
+    elif tree.body and isinstance(tree.body[0], ast.Expr):
+        # after the module docstring
+        import_line = tree.body[0].end_lineno
+    else:
+        import_line = 0
+
+    anchors = Anchors(
+        imports=starts[import_line],
+        router=starts[router] if router is not None else None,
+    )
+    if all_value is None:
+        return anchors
+
+    # the offset of the closing bracket
+    end = offset(all_value.end_lineno, all_value.end_col_offset) - 1
+    if not all_value.elts:
+        anchors.all_end, anchors.all_style = end, "empty"
+        return anchors
+
+    last = all_value.elts[-1]
+    after_last = offset(last.end_lineno, last.end_col_offset)
+    if all_value.lineno == all_value.end_lineno:
+        anchors.all_end, anchors.all_style = after_last, "inline"
+        return anchors
+
+    if source[after_last:end].lstrip().startswith(","):
+        anchors.all_end = source.index(",", after_last) + 1
+        anchors.all_style = "lines_trailing"
+    else:
+        anchors.all_end, anchors.all_style = after_last, "lines"
+    indent = offset(last.lineno, last.col_offset) - starts[last.lineno - 1]
+    anchors.all_indent = " " * indent
+    return anchors
+
+
+def anchors_of(source: str, filename: str) -> Anchors:
+    source = normalize(source)
+    return find_anchors(_parse(source, filename), source)
+
+
+def _insert(source: str, anchors: Anchors, at: str, text: str) -> str:
+    """Insert text at an anchor, moving every anchor at or after it"""
+    position = getattr(anchors, at)
+    for name in ("imports", "all_end", "router"):
+        value = getattr(anchors, name)
+        if value is not None and value >= position:
+            setattr(anchors, name, value + len(text))
+    return source[:position] + text + source[position:]
+
+
+def _all_elements(anchors: Anchors, names: list[str]) -> str:
+    quoted = [f'"{name}"' for name in names]
+    match anchors.all_style:
+        case "empty":
+            anchors.all_style = "inline"
+            return ", ".join(quoted)
+        case "inline":
+            return "".join(f", {q}" for q in quoted)
+        case "lines_trailing":
+            return "".join(f"\n{anchors.all_indent}{q}," for q in quoted)
+        case _:
+            return "".join(f",\n{anchors.all_indent}{q}" for q in quoted)
+
+
+def add_exports(
+    source: str, anchors: Anchors, module: str, names: list[str]
+) -> tuple[str, Anchors]:
+    """
+    Import names from the sibling module and add them to __all__.
+
+    A module without an __all__ exports everything it imports already.
+    """
+    source = normalize(source)
+    anchors = Anchors(**vars(anchors))
+    source = _insert(
+        source, anchors, "imports", f"from .{module} import {', '.join(names)}\n"
+    )
+    if anchors.all_end is not None:
+        source = _insert(source, anchors, "all_end", _all_elements(anchors, names))
+    return source, anchors
+
+
+def add_router(
+    source: str, anchors: Anchors, module: str, filename: str
+) -> tuple[str, Anchors]:
+    """Include the `route` of the sibling module in the package's `router`"""
+    if anchors.router is None:
+        raise RuntimeError(f"Could not find `router = APIRouter(...)` in {filename}")
+
+    source = normalize(source)
+    anchors = Anchors(**vars(anchors))
+    alias = f"{module}_router"
+    source = _insert(
+        source, anchors, "imports", f"from .{module} import route as {alias}\n"
+    )
+    source = _insert(source, anchors, "router", f"router.include_router({alias})\n")
+    return source, anchors
@@ -0,0 +1,71 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable
+
+# called with the step name, command, return code and duration of every
+# subprocess, from the thread that ran it
+SubprocessCallback = Callable[[str, str, int | None, float], None]
+
+
+@dataclass
+class StepTiming:
+    """Where the time of a single setup step went"""
+
+    name: str
+    wall: float = 0.0
+    cpu: float = 0.0
+    subprocess: float = 0.0
+    bytes_written: int = 0
+    # an estimate, not a count: a mkdir is one, a file write three
+    file_ops: int = 0
+
+
+# the timing of the step running on the current thread, if any
+_current = threading.local()
+
+
+@contextmanager
+def measure(name: str, on_subprocess: SubprocessCallback | None = None):
+    """
+    Measure the wall, CPU and subprocess time of the code in the block.
+
+    CPU time is the time of the current thread only, so steps running
+    in parallel do not count each other.
+    """
+    timing = StepTiming(name)
+    previous = getattr(_current, "timing", None), getattr(_current, "on_subprocess", None)
+    _current.timing = timing
+    _current.on_subprocess = on_subprocess
+
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield timing
+    finally:
+        timing.wall = time.perf_counter() - wall_start
+        timing.cpu = time.thread_time() - cpu_start
+        _current.timing, _current.on_subprocess = previous
+
+
+def record_subprocess(
+    seconds: float, command: str = "", returncode: int | None = None
+) -> None:
+    """Add time spent waiting on a subprocess to the running step"""
+    timing = getattr(_current, "timing", None)
+    if timing is None:
+        return
+
+    timing.subprocess += seconds
+    on_subprocess = getattr(_current, "on_subprocess", None)
+    if on_subprocess is not None:
+        on_subprocess(timing.name, command, returncode, seconds)
+
+
+def record_io(bytes_written: int, file_ops: int) -> None:
+    """Add file writes done by the running step"""
+    timing = getattr(_current, "timing", None)
+    if timing is not None:
+        timing.bytes_written += bytes_written
+        timing.file_ops += file_ops
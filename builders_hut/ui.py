@@ -0,0 +1,342 @@
+"""
+Rich based terminal UI of the CLI.
+
+Kept out of cmd_interface so that commands which print nothing fancy,
+like `hut --version`, never import Rich.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from rich.align import Align
+from rich.console import Console
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+)
+from rich.prompt import Prompt
+from rich.table import Table
+from rich.text import Text
+
+from builders_hut import APP_VERSION
+from builders_hut.api import BUILD_STEPS, BuildResult, ProjectSpec, build_project
+from builders_hut.fleet import FleetEntry
+from builders_hut.setups.sync import SyncResult
+from builders_hut.timing import StepTiming
+
+console = Console()
+
+BANNER = r"""
+ ____        _ _     _                 _   _       _   
+| __ ) _   _(_) | __| | ___ _ __ ___  | | | |_   _| |_ 
+|  _ \| | | | | |/ _` |/ _ \ '__/ __| | |_| | | | | __|
+| |_) | |_| | | | (_| |  __/ |  \__ \ |  _  | |_| | |_ 
+|____/ \__,_|_|_|\__,_|\___|_|  |___/ |_| |_|\__,_|\__|
+"""
+
+# ------------------------------------------------------------------
+# UI helpers
+# ------------------------------------------------------------------
+
+
+def render_header() -> Panel:
+    text = Text()
+    text.append(BANNER, style="bold cyan")
+    text.append(f"\nVersion {APP_VERSION}\n", style="bold cyan")
+
+    return Panel(
+        Align.center(text),
+        border_style="cyan",
+        padding=(1, 2),
+    )
+
+
+def clear_and_render(panel: Panel):
+    console.clear()
+    console.print(render_header())
+    console.print(panel)
+
+
+def ask_question(title: str, question: str, default: str) -> str:
+    body = Text()
+    body.append(f"{title}\n\n", style="bold cyan")
+    body.append(question, style="white")
+
+    panel = Panel(
+        body,
+        border_style="cyan",
+        padding=(1, 2),
+    )
+
+    clear_and_render(panel)
+    return Prompt.ask("", default=default)
+
+
+# ------------------------------------------------------------------
+# Wizard
+# ------------------------------------------------------------------
+
+
+def run_wizard():
+    answers = {}
+
+    answers["name"] = ask_question(
+        "Project Name",
+        "Enter your project name",
+        Path.cwd().name,
+    )
+
+    answers["description"] = ask_question(
+        "Project Description",
+        "Describe your project",
+        "A new project",
+    )
+
+    answers["version"] = ask_question(
+        "Project Version",
+        "Initial project version",
+        "0.1.0",
+    )
+
+    answers["database_type"] = ask_question(
+        "Database Type",
+        "Choose database type (sql / nosql)",
+        "sql",
+    )
+
+    answers["database_provider"] = ask_question(
+        "Database Provider",
+        "postgres / mysql / sqlite / mongodb",
+        "postgres",
+    )
+
+    return answers
+
+
+# ------------------------------------------------------------------
+# Progress runner (INSIDE BOX)
+# ------------------------------------------------------------------
+
+
+STEPS = {
+    "SetupFiles": "Writing project files",
+    "SetupGithub": "Setting up GitHub repository",
+    "SetupEnv": "Installing packages",
+}
+
+
+@contextmanager
+def _progress_box():
+    """
+    The progress box, yields the callbacks a step name starts and finishes with.
+
+    The box is only redrawn when a step starts or finishes.
+    """
+    progress = Progress(
+        SpinnerColumn(finished_text="[bold green]✔"),
+        TextColumn("[bold cyan]{task.description}"),
+        BarColumn(),
+    )
+
+    task = progress.add_task("Initializing project...", total=len(BUILD_STEPS))
+    step_tasks = {}
+
+    panel = Panel(
+        progress,
+        title="Setting up project",
+        border_style="cyan",
+        padding=(1, 2),
+    )
+
+    with Live(panel, console=console, auto_refresh=False) as live:
+
+        def on_start(name: str):
+            step_tasks[name] = progress.add_task(f"  {STEPS[name]}", total=1)
+            live.refresh()
+
+        def on_finish(name: str):
+            progress.advance(step_tasks[name])
+            progress.advance(task)
+            live.refresh()
+
+        yield on_start, on_finish
+
+
+def run_setup_with_progress(spec: ProjectSpec) -> BuildResult:
+    """Build the project inside the progress box"""
+    with _progress_box() as (on_start, on_finish):
+        return build_project(
+            spec,
+            on_start=lambda step: on_start(step.__name__),
+            on_finish=lambda step: on_finish(step.__name__),
+        )
+
+
+def follow_build_events(events: Iterator[dict]) -> list[StepTiming]:
+    """
+    Show a build `hut daemon` runs inside the progress box.
+
+    Returns the step timings, failures are raised as RuntimeError.
+    """
+    with _progress_box() as (on_start, on_finish):
+        for event in events:
+            match event["event"]:
+                case "step_started":
+                    on_start(event["step"])
+                case "step_finished":
+                    on_finish(event["step"])
+                case "build_finished":
+                    return [StepTiming(**timing) for timing in event["timings"]]
+                case "build_failed":
+                    raise RuntimeError(event["error"])
+
+    raise RuntimeError("The daemon closed the connection before the build finished")
+
+
+# ------------------------------------------------------------------
+# Final screen
+# ------------------------------------------------------------------
+
+
+def render_timings(timings: list[StepTiming]) -> Table:
+    table = Table(title="Step timings", title_style="bold cyan", border_style="cyan")
+    table.add_column("Step", style="bold")
+    table.add_column("Wall (s)", justify="right")
+    table.add_column("CPU (s)", justify="right")
+    table.add_column("Subprocess (s)", justify="right")
+    table.add_column("Written (B)", justify="right")
+    table.add_column("File ops (est.)", justify="right")
+
+    for timing in timings:
+        table.add_row(
+            timing.name,
+            f"{timing.wall:.3f}",
+            f"{timing.cpu:.3f}",
+            f"{timing.subprocess:.3f}",
+            str(timing.bytes_written),
+            str(timing.file_ops),
+        )
+
+    table.add_section()
+    table.add_row(
+        "Total",
+        f"{sum(t.wall for t in timings):.3f}",
+        f"{sum(t.cpu for t in timings):.3f}",
+        f"{sum(t.subprocess for t in timings):.3f}",
+        str(sum(t.bytes_written for t in timings)),
+        str(sum(t.file_ops for t in timings)),
+        style="bold",
+    )
+    return table
+
+
+def render_fleet(entries: list[FleetEntry]) -> Table:
+    table = Table(title="Fleet build", title_style="bold cyan", border_style="cyan")
+    table.add_column("Project", style="bold")
+    table.add_column("Status")
+    table.add_column("Wall (s)", justify="right")
+    table.add_column("Path / Error")
+
+    for entry in entries:
+        if entry.ok:
+            table.add_row(
+                entry.spec.name,
+                "[green]✔ built[/green]",
+                f"{entry.result.wall:.3f}",
+                str(entry.result.path),
+            )
+        else:
+            table.add_row(
+                entry.spec.name, "[red]✘ failed[/red]", "-", f"[red]{entry.error}[/red]"
+            )
+
+    built = sum(entry.ok for entry in entries)
+    table.add_section()
+    table.add_row(
+        "Total",
+        f"{built}/{len(entries)} built",
+        f"{sum(e.result.wall for e in entries if e.ok):.3f}",
+        "",
+        style="bold",
+    )
+    return table
+
+
+def render_sync(result: SyncResult, dry_run: bool = False) -> Table:
+    title = "Sync (dry run)" if dry_run else "Sync"
+    table = Table(title=title, title_style="bold cyan", border_style="cyan")
+    table.add_column("File", style="bold")
+    table.add_column("Status")
+
+    for path in result.updated:
+        table.add_row(path.as_posix(), "[green]✔ updated[/green]")
+    for path in result.added:
+        table.add_row(path.as_posix(), "[green]✚ added[/green]")
+    for path in result.skipped:
+        table.add_row(path.as_posix(), "[yellow]skipped, edited by you[/yellow]")
+    for path in result.orphaned:
+        table.add_row(path.as_posix(), "[dim]no longer generated, kept[/dim]")
+
+    table.add_section()
+    table.add_row(f"{result.unchanged} unchanged", "", style="bold")
+    return table
+
+
+def show_success():
+    text = Text()
+    text.append("✅ Project setup completed successfully!\n\n", style="bold green")
+    text.append("NEXT STEPS\n", style="bold cyan")
+    text.append(
+        "\n1. Update environment variables\n"
+        "   • Open .env and fill required values\n\n"
+        "2. Run database migrations\n"
+        '   • alembic revision --autogenerate -m "initial migration"\n'
+        "   • alembic upgrade head\n\n"
+        "3. Start the server\n"
+        "   • python run.py\n",
+        style="white",
+    )
+
+    text.append(
+        "\nNote:- Sample model with respective repository and service is created along with the project for user reference.\n"
+        "It is suggested to go throw them once before removing anything\n",
+        style="yellow",
+    )
+
+    panel = Panel(
+        Align.left(text),
+        border_style="green",
+        padding=(1, 2),
+        title="🚀 Ready",
+    )
+
+    clear_and_render(panel)
+
+
+def show_error(title: str, error: Exception | str, clear: bool = True):
+    error_panel = Panel(
+        Text(f"❌ {title}\n\n{error}", style="red"),
+        border_style="red",
+        padding=(1, 2),
+    )
+    if clear:
+        clear_and_render(error_panel)
+    else:
+        console.print(error_panel)
+
+
+def show_notice(message: str, style: str = "yellow", clear: bool = True):
+    panel = Panel(
+        Text(message, style=style),
+        border_style=style,
+        padding=(1, 2),
+    )
+    if clear:
+        clear_and_render(panel)
+    else:
+        console.print(panel)
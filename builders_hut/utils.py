@@ -2,7 +2,6 @@ from pathlib import Path
 from builders_hut.setups.base_setup import BaseSetup
 import platform
 import tomlkit
-import subprocess
 
 
 def write_pyproject(
@@ -94,29 +93,9 @@ def write_file(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
-def run_subprocess(location: Path, command: str):
-    """
-    Run subprocess command
-    """
-    subprocess.run(
-        command,
-        cwd=location,
-        shell=True,
-        check=True,
-        stderr=subprocess.DEVNULL,
-        stdout=subprocess.DEVNULL,
-    )
-
-
-def get_python_file():
-    """use the python file in the venv"""
-    platform = get_platform()
-
-    python_file = (
-        ".venv/bin/python -m"
-        if platform == "linux"
-        else ".venv\\Scripts\\python.exe -m"
-    )
-
-    return python_file
+def get_venv_python(location: Path) -> Path:
+    """the python executable of the project venv"""
+    if get_platform() == "windows":
+        return location / ".venv" / "Scripts" / "python.exe"
 
+    return location / ".venv" / "bin" / "python"
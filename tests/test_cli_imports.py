@@ -0,0 +1,42 @@
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from benchmarks.cases import COLD_START_BUDGET, cold_start
+
+ROOT = Path(__file__).parent.parent
+
+# imported only by the commands that need them, never to start the CLI
+LAZY_MODULES = ["rich", "builders_hut.setups", "builders_hut.ui"]
+
+COLD_START_RUNS = 5
+
+
+@pytest.mark.parametrize("module", LAZY_MODULES)
+def test_cli_import_is_lazy(module):
+    # a fresh interpreter, the tests themselves import everything
+    loaded = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys, builders_hut.cmd_interface; "
+            "print(json.dumps(sorted(sys.modules)))",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert module not in json.loads(loaded.stdout)
+
+
+def test_cold_start_budget():
+    # the same measurement `python -m benchmarks run` checks the budget with
+    median = statistics.median(cold_start() for _ in range(COLD_START_RUNS))
+    assert median < COLD_START_BUDGET, (
+        f"hut --version took {median:.3f}s, budget is {COLD_START_BUDGET:.3f}s"
+    )
@@ -0,0 +1,273 @@
+import ast
+from pathlib import Path
+
+import pytest
+
+from builders_hut.setups import SetupFiles
+from builders_hut.setups.project_index import INDEX_PATH, ProjectIndex
+from builders_hut.setups.resource import add_resource, pluralize, resource_context
+from builders_hut.setups.wiring import add_exports, anchors_of
+from builders_hut.utils import setup_project
+
+MODELS = Path("app/models/__init__.py")
+REPOSITORIES = Path("app/repositories/__init__.py")
+SERVICES = Path("app/services/__init__.py")
+V1_ROUTER = Path("app/api/v1/__init__.py")
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    setup_project(
+        tmp_path,
+        SetupFiles,
+        name="demo",
+        description="A demo project",
+        version="0.1.0",
+        database_type="sql",
+        database_provider="sqlite",
+        installer="pip",
+        use_cache=False,
+    )
+    return tmp_path
+
+
+def read(project: Path, path: Path) -> str:
+    return (project / path).read_text(encoding="utf-8")
+
+
+def edit(project: Path, path: Path, old: str, new: str) -> None:
+    source = read(project, path)
+    assert old in source
+    (project / path).write_text(source.replace(old, new), encoding="utf-8")
+
+
+def all_of(source: str) -> list[str]:
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Assign) and node.targets[0].id == "__all__":
+            return [element.value for element in node.value.elts]
+    raise AssertionError("no __all__")
+
+
+def imports_of(source: str) -> dict[str, list[str]]:
+    """module -> names of the relative imports"""
+    return {
+        node.module: [alias.asname or alias.name for alias in node.names]
+        for node in ast.parse(source).body
+        if isinstance(node, ast.ImportFrom) and node.level
+    }
+
+
+def included_routers(source: str) -> list[str]:
+    return [
+        node.value.args[0].id
+        for node in ast.parse(source).body
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)
+    ]
+
+
+@pytest.mark.parametrize(
+    "word, plural",
+    [
+        ("villain", "villains"),
+        ("category", "categories"),
+        ("day", "days"),
+        ("box", "boxes"),
+        ("match", "matches"),
+        ("bus", "buses"),
+    ],
+)
+def test_pluralize(word, plural):
+    assert pluralize(word) == plural
+
+
+def test_resource_context_names():
+    context = resource_context("BlogPost")
+    assert context.class_name == "BlogPost"
+    assert context.module == "blog_post"
+    assert context.plural_module == "blog_posts"
+    assert context.path == "blog-posts"
+    assert context.path_param == "{blog_post_id}"
+
+
+def test_resource_context_irregular_plural():
+    context = resource_context("person", plural="people")
+    assert context.plural_module == "people"
+    assert context.plural_title == "People"
+    assert context.path == "people"
+
+
+@pytest.mark.parametrize("name", ["", "1st", "class", "a.b"])
+def test_resource_context_invalid_name(name):
+    with pytest.raises(RuntimeError, match="Invalid resource name"):
+        resource_context(name)
+
+
+def test_add_resource_wires_the_packages(project):
+    result = add_resource(project, "villain")
+
+    assert sorted(result.created) == sorted(
+        Path(package) / "villain.py"
+        for package in (
+            "app/models",
+            "app/schemas",
+            "app/repositories",
+            "app/services",
+            "app/api/v1",
+        )
+    )
+    for path in result.created:
+        ast.parse(read(project, path))
+
+    models = read(project, MODELS)
+    assert imports_of(models)["villain"] == ["Villain"]
+    assert all_of(models) == ["Hero", "Villain"]
+
+    repositories = read(project, REPOSITORIES)
+    assert imports_of(repositories)["villain"] == [
+        "VillainRepoDeps",
+        "VillainRepository",
+    ]
+    assert all_of(repositories) == [
+        "HeroRepoDeps",
+        "HeroRepository",
+        "VillainRepoDeps",
+        "VillainRepository",
+    ]
+
+    services = read(project, SERVICES)
+    assert all_of(services) == ["HeroServiceDeps", "VillainServiceDeps"]
+
+    router = read(project, V1_ROUTER)
+    assert imports_of(router)["villain"] == ["villain_router"]
+    assert included_routers(router) == ["hero_router", "villain_router"]
+    assert all_of(router) == ["router"]
+
+    assert (project / INDEX_PATH).is_file()
+
+
+def test_add_resource_keeps_the_rest_of_the_file(project):
+    edit(project, MODELS, "import Hero\n", "import Hero  # keep\n")
+    add_resource(project, "villain")
+    assert read(project, MODELS) == (
+        "\nfrom .hero import Hero  # keep\n"
+        "from .villain import Villain\n"
+        "\n"
+        '__all__ = ["Hero", "Villain"]\n'
+    )
+
+
+def test_add_resource_with_an_irregular_plural(project):
+    result = add_resource(project, "person", plural="people")
+    assert result.context.path == "people"
+    assert '"/people"' in read(project, Path("app/api/v1/person.py"))
+
+
+def test_adding_a_resource_twice(project):
+    add_resource(project, "villain")
+    before = {path: read(project, path) for path in (MODELS, V1_ROUTER)}
+
+    with pytest.raises(RuntimeError, match="already exists"):
+        add_resource(project, "villain")
+    assert {path: read(project, path) for path in (MODELS, V1_ROUTER)} == before
+
+
+def test_symbol_defined_by_hand(project):
+    (project / "app/models/extra.py").write_text("class Villain:\n    pass\n")
+    with pytest.raises(
+        RuntimeError, match="Villain is already defined in app/models/extra.py"
+    ):
+        add_resource(project, "villain")
+    assert not (project / "app/api/v1/villain.py").exists()
+
+
+def test_missing_router_anchor(project):
+    edit(project, V1_ROUTER, 'router = APIRouter(prefix="/v1")\n', "")
+    edit(project, V1_ROUTER, "router.include_router(hero_router)\n", "")
+    with pytest.raises(
+        RuntimeError, match=r"Could not find `router = APIRouter\(...\)`"
+    ):
+        add_resource(project, "villain")
+
+
+def test_not_a_project(tmp_path):
+    with pytest.raises(RuntimeError, match="is not a project built with hut"):
+        add_resource(tmp_path, "villain")
+
+
+def test_index_out_of_date_with_hand_edits(project):
+    add_resource(project, "villain")
+
+    # reformatted and extended by hand after the index stored its anchors
+    (project / MODELS).write_text(
+        '"""Models"""\n'
+        "\n"
+        "from .hero import Hero\n"
+        "from .villain import Villain\n"
+        "from .sidekick import Sidekick\n"
+        "\n"
+        "__all__ = [\n"
+        '    "Hero",\n'
+        '    "Villain",\n'
+        '    "Sidekick",\n'
+        "]\n",
+        encoding="utf-8",
+    )
+    (project / "app/models/sidekick.py").write_text("class Sidekick:\n    pass\n")
+
+    result = add_resource(project, "lair")
+    # the two changed modules, then the new ones written
+    assert result.parsed >= 2
+
+    models = read(project, MODELS)
+    assert imports_of(models) == {
+        "hero": ["Hero"],
+        "villain": ["Villain"],
+        "sidekick": ["Sidekick"],
+        "lair": ["Lair"],
+    }
+    assert all_of(models) == ["Hero", "Villain", "Sidekick", "Lair"]
+    assert models.endswith('    "Sidekick",\n    "Lair",\n]\n')
+    assert ProjectIndex.load(project).exports("app/models") == all_of(models)
+
+
+def test_index_missing_or_corrupt(project):
+    add_resource(project, "villain")
+    (project / INDEX_PATH).write_text("{not json")
+
+    add_resource(project, "lair")
+    assert all_of(read(project, MODELS)) == ["Hero", "Villain", "Lair"]
+
+
+def test_stored_anchors_match_a_fresh_parse(project):
+    for name in ("villain", "lair", "sidekick"):
+        add_resource(project, name)
+
+    index = ProjectIndex.load(project)
+    for path in (MODELS, REPOSITORIES, SERVICES, V1_ROUTER):
+        assert index.anchors(path) == anchors_of(read(project, path), path.as_posix())
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("", "from .villain import Villain\n"),
+        (
+            "__all__ = []\n",
+            'from .villain import Villain\n__all__ = ["Villain"]\n',
+        ),
+        (
+            '"""Doc"""\n__all__ = ["Hero"]\n',
+            '"""Doc"""\nfrom .villain import Villain\n__all__ = ["Hero", "Villain"]\n',
+        ),
+        (
+            'from .hero import Hero\n__all__ = [\n    "Hero"\n]',
+            "from .hero import Hero\nfrom .villain import Villain\n"
+            '__all__ = [\n    "Hero",\n    "Villain"\n]\n',
+        ),
+    ],
+)
+def test_add_exports(source, expected):
+    anchors = anchors_of(source, "x")
+    edited, anchors = add_exports(source, anchors, "villain", ["Villain"])
+    assert edited == expected
+    assert anchors == anchors_of(edited, "x")
@@ -0,0 +1,108 @@
+"""
+Golden files of the generated projects.
+
+Every template a build renders is rendered for each lock profile, every
+database provider with every schema backend, and compared with
+tests/golden. So are the resource templates, for each schema backend.
+After an intended change to a template, write the golden files again
+and review their diff:
+
+    HUT_UPDATE_GOLDEN=1 python -m pytest tests/test_templates.py
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from builders_hut.options import SchemaBackend
+from builders_hut.setups.files_setup import SetupFiles
+from builders_hut.setups.lockfiles import lock_profiles
+from builders_hut.setups.resource import RESOURCE_FILES, resource_context
+from builders_hut.setups.templates import (
+    PROJECT_TEMPLATES,
+    RESOURCE_TEMPLATES,
+    ProjectContext,
+)
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+UPDATE = os.environ.get("HUT_UPDATE_GOLDEN") == "1"
+
+PROFILES = lock_profiles()
+
+
+def project_config(profile: str) -> dict:
+    database_type, provider, backend = PROFILES[profile]
+    return {
+        "name": "demo",
+        "description": "A demo project",
+        "version": "0.1.0",
+        "database_type": database_type,
+        "database_provider": provider,
+        "schema_backend": backend,
+    }
+
+
+def project_templates(config: dict) -> dict[Path, str]:
+    """path -> template id of every file a build renders"""
+    templates = {}
+    for step_cls in SetupFiles.GENERATORS:
+        step = step_cls(Path("."))
+        step.configure(**config)
+        templates.update(step.templates())
+    return templates
+
+
+def check_golden(directory: Path, rendered: dict[Path, str]) -> None:
+    # a suffix, so golden files are never taken for project files
+    expected = {
+        path.relative_to(directory).with_suffix(path.suffix.removesuffix(".golden"))
+        for path in directory.rglob("*.golden")
+    }
+    if UPDATE:
+        for path in expected - rendered.keys():
+            (directory / f"{path}.golden").unlink()
+        for path, content in rendered.items():
+            golden = directory / f"{path}.golden"
+            golden.parent.mkdir(parents=True, exist_ok=True)
+            golden.write_bytes(content.encode("utf-8"))
+        return
+
+    assert sorted(rendered) == sorted(expected)
+    for path, content in rendered.items():
+        golden = (directory / f"{path}.golden").read_bytes().decode("utf-8")
+        assert content == golden, f"{path} differs from its golden file"
+
+
+@pytest.mark.parametrize("profile", sorted(PROFILES))
+def test_project_templates(profile):
+    config = project_config(profile)
+    context = ProjectContext.from_config(**config)
+    rendered = {
+        path: PROJECT_TEMPLATES.render(template_id, context)
+        for path, template_id in project_templates(config).items()
+    }
+    check_golden(GOLDEN_DIR / profile, rendered)
+
+
+@pytest.mark.parametrize("backend", [backend.value for backend in SchemaBackend])
+def test_resource_templates(backend):
+    context = resource_context("blog post", schema_backend=backend)
+    rendered = {
+        Path(path.format(module=context.module)): RESOURCE_TEMPLATES.render(
+            template_id, context
+        )
+        for path, template_id in RESOURCE_FILES.items()
+    }
+    check_golden(GOLDEN_DIR / f"resource-{backend}", rendered)
+
+
+def test_every_template_has_a_golden_file():
+    rendered = {
+        template_id
+        for profile in PROFILES
+        for template_id in project_templates(project_config(profile)).values()
+    }
+    rendered |= set(RESOURCE_FILES.values())
+    assert rendered == set(PROJECT_TEMPLATES) | set(RESOURCE_TEMPLATES)
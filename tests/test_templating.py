@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+
+import pytest
+
+from builders_hut.setups.templating import TemplateError, TemplateRegistry
+
+
+@dataclass(frozen=True)
+class Context:
+    name: str = "demo"
+    provider: str = "postgres"
+    items: tuple = ()
+    flag: bool = False
+
+
+def render(source: str, context: Context | None = None, **others: str) -> str:
+    registry = TemplateRegistry(Context, {"main": source, **others})
+    return registry.render("main", context or Context())
+
+
+def test_expressions_and_method_calls():
+    assert render("{{ name }}-{{ name.upper() }}-{{ len(name) }}") == "demo-DEMO-4"
+
+
+def test_literal_braces_are_left_alone():
+    source = "d = {'a': {1: 2}}\nf'{x}' {{ name }}\n"
+    assert render(source) == "d = {'a': {1: 2}}\nf'{x}' demo\n"
+
+
+def test_values_are_written_as_is():
+    # values are never escaped, nor read as template syntax
+    context = Context(name="say \"{{ hi }}\" {% if %} <b>&")
+    assert render("{{ name }}", context) == "say \"{{ hi }}\" {% if %} <b>&"
+
+
+@pytest.mark.parametrize(
+    "provider, expected",
+    [("postgres", "pg\n"), ("mysql", "my\n"), ("sqlite", "other\n")],
+)
+def test_if_elif_else(provider, expected):
+    source = (
+        '{% if provider == "postgres" %}\npg\n'
+        '{% elif provider == "mysql" %}\nmy\n'
+        "{% else %}\nother\n{% endif %}\n"
+    )
+    assert render(source, Context(provider=provider)) == expected
+
+
+def test_block_tag_alone_on_its_line_takes_the_line():
+    source = "a\n    {% if flag %}\n    b\n    {% endif %}\nc\n"
+    assert render(source, Context(flag=True)) == "a\n    b\nc\n"
+    assert render(source) == "a\nc\n"
+
+
+def test_inline_tags_keep_the_surrounding_text():
+    assert render("x{% if flag %}y{% endif %}z") == "xz"
+    assert render("x{% if flag %}y{% endif %}z", Context(flag=True)) == "xyz"
+
+
+def test_for_loops_unpack_tuples():
+    source = "{% for key, value in items %}\n{{ key }}={{ value }}\n{% endfor %}\n"
+    context = Context(items=(("a", 1), ("b", 2)))
+    assert render(source, context) == "a=1\nb=2\n"
+
+
+def test_empty_for_loop():
+    assert render("[{% for item in items %}{{ item }}{% endfor %}]") == "[]"
+
+
+def test_include():
+    assert render('<{% include "part" %}>', part="{{ name }}") == "<demo>"
+
+
+def test_raw_block_is_not_rendered():
+    assert render("{% raw %}{{ name }} {% if %}{% endraw %}") == "{{ name }} {% if %}"
+
+
+@pytest.mark.parametrize(
+    "source, message",
+    [
+        ("{{ missing }}", "unknown name 'missing'"),
+        ("{{ open('x') }}", "unknown name 'open'"),
+        ("{% if flag %}", "unclosed if block"),
+        ("{% else %}", "else outside of an if block"),
+        ("{% endfor %}", "unexpected endfor"),
+        ("{% for name in items %}{% endfor %}", "loop variable shadows the context"),
+        ("{% while flag %}", "unknown tag 'while'"),
+        ("{{ name + }}", "invalid expression"),
+    ],
+)
+def test_compile_errors(source, message):
+    with pytest.raises(TemplateError, match=message):
+        render(source)
+
+
+def test_compile_errors_name_the_line():
+    with pytest.raises(TemplateError, match="main, line 3"):
+        render("a\nb\n{{ missing }}\n")
+
+
+def test_include_cycle():
+    with pytest.raises(TemplateError, match="include each other"):
+        render('{% include "a" %}', a='{% include "b" %}', b='{% include "a" %}')
+
+
+def test_wrong_context_type():
+    registry = TemplateRegistry(Context, {"main": "{{ name }}"})
+    with pytest.raises(TemplateError, match="rendered with a Context"):
+        registry.render("main", object())
+
+
+def test_digest_follows_includes():
+    registry = TemplateRegistry(Context, {"main": '{% include "part" %}', "part": "a"})
+    before = registry.digest("main")
+    registry.add("part", "b")
+    assert registry.digest("main") != before
+    assert registry.render("main", Context()) == "b"